@@ -0,0 +1,9 @@
+import functools
+
+from pyudunits2 import UnitSystem
+
+
+@functools.cache
+def unit_system() -> UnitSystem:
+    # Loading the XML database is costly, so share it between benchmarks.
+    return UnitSystem.from_udunits2_xml()
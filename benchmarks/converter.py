@@ -0,0 +1,163 @@
+"""
+Benchmarks of unit conversion, in the asv (airspeed velocity) format.
+
+"""
+
+import numpy as np
+
+from pyudunits2 import Converter, MultiConverter
+
+from . import unit_system
+
+
+CONVERSIONS = ["degC -> degF", "km/h -> m/s", "m/s -> s/m", "mW -> lg(re W)"]
+
+
+def _converter(conversion: str) -> Converter:
+    system = unit_system()
+    from_unit, to_unit = conversion.split(" -> ")
+    return Converter(system.unit(from_unit), system.unit(to_unit))
+
+
+class GeneratedVsLambdify:
+    """
+    Compare the generated conversion functions with the equivalent sympy
+    lambdified functions (which were previously used for all conversions).
+    """
+
+    params = [CONVERSIONS, ["generated", "lambdify"]]
+    param_names = ["conversion", "implementation"]
+
+    def setup(self, conversion: str, implementation: str):
+        converter = _converter(conversion)
+        if implementation == "generated":
+            from pyudunits2._expr.codegen import compile_program
+
+            compiled = compile_program(converter._program)
+            self.convert_scalar, self.convert_array = compiled.scalar, compiled.array
+        else:
+            import sympy
+
+            fn = sympy.lambdify(sympy.Symbol("value"), converter.expression)
+            self.convert_scalar = self.convert_array = fn
+        self.scalar = 12.5
+        self.array = np.linspace(1, 100, 1_000_000)
+
+    def time_scalar(self, conversion: str, implementation: str):
+        self.convert_scalar(self.scalar)
+
+    def time_array(self, conversion: str, implementation: str):
+        self.convert_array(self.array)
+
+
+class Convert:
+    """The cost of Converter.convert, including the dispatch on input type."""
+
+    params = [CONVERSIONS]
+    param_names = ["conversion"]
+
+    def setup(self, conversion: str):
+        self.converter = _converter(conversion)
+        self.array = np.linspace(1, 100, 1_000_000)
+
+    def time_scalar(self, conversion: str):
+        self.converter.convert(12.5)
+
+    def time_array(self, conversion: str):
+        self.converter.convert(self.array)
+
+
+class ConverterConstruction:
+    params = [CONVERSIONS]
+    param_names = ["conversion"]
+
+    def setup(self, conversion: str):
+        system = unit_system()
+        from_unit, to_unit = conversion.split(" -> ")
+        self.units = system.unit(from_unit), system.unit(to_unit)
+
+    def time_construction(self, conversion: str):
+        Converter(*self.units)
+
+
+class ConvertScalar:
+    """
+    Per-value conversion of Python floats, as found in streaming (per record)
+    workloads. The target is well under a microsecond per call.
+    """
+
+    params = [CONVERSIONS]
+    param_names = ["conversion"]
+
+    def setup(self, conversion: str):
+        self.convert_scalar = _converter(conversion).convert_scalar
+
+    def time_convert_scalar(self, conversion: str):
+        self.convert_scalar(12.5)
+
+
+class ConvertThreaded:
+    """
+    Blockwise conversion of a large array with a pool of threads, showing the
+    scaling across cores of linear and logarithmic conversions.
+    """
+
+    params = [["km/h -> m/s", "degC -> degF", "mW -> lg(re W)"], [1, 2, 4, 8]]
+    param_names = ["conversion", "threads"]
+
+    def setup(self, conversion: str, threads: int):
+        self.converter = _converter(conversion)
+        self.array = np.linspace(1, 100, 50_000_000)
+        self.out = np.empty_like(self.array)
+
+    def time_convert(self, conversion: str, threads: int):
+        self.converter.convert(self.array, out=self.out, threads=threads)
+
+
+class ConvertProcesses:
+    """
+    Blockwise conversion of a large array with a pool of processes, sharing
+    the data through shared memory.
+    """
+
+    params = [["km/h -> m/s", "mW -> lg(re W)"], [1, 2, 4, 8]]
+    param_names = ["conversion", "processes"]
+    timeout = 120
+
+    def setup(self, conversion: str, processes: int):
+        self.converter = _converter(conversion)
+        self.array = np.linspace(1, 100, 50_000_000)
+        self.out = np.empty_like(self.array)
+
+    def time_convert(self, conversion: str, processes: int):
+        self.converter.convert(self.array, out=self.out, processes=processes)
+
+
+class ConvertMultiTarget:
+    """
+    Conversion of one array into several target units, either in a single
+    pass with a MultiConverter, or with one Converter for each target.
+    """
+
+    params = [
+        ["K -> degC, degF", "m s-1 -> knot, km h-1", "lg(re mW) -> W, kW, lg(re W)"],
+        ["single pass", "separate"],
+    ]
+    param_names = ["conversion", "implementation"]
+
+    def setup(self, conversion: str, implementation: str):
+        system = unit_system()
+        from_unit, to_units = conversion.split(" -> ")
+        from_unit = system.unit(from_unit)
+        to_units = [system.unit(unit) for unit in to_units.split(", ")]
+        self.multi = MultiConverter(from_unit, to_units)
+        self.converters = self.multi.converters
+        self.array = np.linspace(1, 100, 10_000_000)
+        self.outs = [np.empty_like(self.array) for _ in to_units]
+
+    def time_convert(self, conversion: str, implementation: str):
+        if implementation == "single pass":
+            self.multi.convert(self.array, outs=self.outs)
+        else:
+            for converter, out in zip(self.converters, self.outs):
+                converter.convert(self.array, out=out)
@@ -0,0 +1,125 @@
+"""
+Benchmarks of date unit (time coordinate) conversion, in the asv (airspeed
+velocity) format.
+
+"""
+
+import numpy as np
+
+from pyudunits2 import Converter
+
+from . import unit_system
+
+
+#: The number of elements of the time axes.
+N_TIMES = 10_000_000
+
+DATE_CONVERSIONS = [
+    "hours since 1970-01-01 -> days since 2000-01-01",
+    "seconds since 1850-01-01 00:00:00 -> days since 1850-01-01",
+]
+
+
+class ConvertTimeAxis:
+    """Conversion of a long (hourly) time axis between date units."""
+
+    params = [DATE_CONVERSIONS]
+    param_names = ["conversion"]
+
+    def setup(self, conversion: str):
+        system = unit_system()
+        from_unit, to_unit = conversion.split(" -> ")
+        self.units = system.unit(from_unit), system.unit(to_unit)
+        self.converter = Converter(*self.units)
+        self.times = np.arange(N_TIMES, dtype=np.float64)
+
+    def time_convert(self, conversion: str):
+        self.converter.convert(self.times)
+
+    def time_construct_and_convert(self, conversion: str):
+        Converter(*self.units).convert(self.times)
+
+
+class ConvertTimeAxisCftime:
+    """
+    The equivalent conversion with cftime (via date objects), for comparison.
+    Only run if cftime is installed.
+    """
+
+    params = [DATE_CONVERSIONS]
+    param_names = ["conversion"]
+    # Per-element date objects are slow: minutes, rather than milliseconds.
+    timeout = 900
+    number = 1
+    repeat = 1
+
+    def setup(self, conversion: str):
+        try:
+            import cftime
+        except ImportError:
+            raise NotImplementedError("cftime is not installed")
+        self.cftime = cftime
+        self.from_unit, self.to_unit = conversion.split(" -> ")
+        self.times = np.arange(N_TIMES, dtype=np.float64)
+
+    def time_convert(self, conversion: str):
+        dates = self.cftime.num2date(self.times, self.from_unit)
+        self.cftime.date2num(dates, self.to_unit)
+
+
+class DateFields:
+    """Splitting a long (hourly) time axis into calendar fields."""
+
+    params = [["standard", "noleap", "360_day"]]
+    param_names = ["calendar"]
+
+    def setup(self, calendar: str):
+        unit = unit_system().unit("hours since 1850-01-01")
+        self.unit = unit.with_calendar(calendar)
+        self.times = np.arange(N_TIMES, dtype=np.int64)
+        self.fields = self.unit.to_date_fields(self.times)
+
+    def time_to_date_fields(self, calendar: str):
+        self.unit.to_date_fields(self.times)
+
+    def time_from_date_fields(self, calendar: str):
+        fields = self.fields
+        self.unit.from_date_fields(fields.year, fields.month, fields.day, fields.hour)
+
+
+class ToDatetime64:
+    """
+    Conversion of a long time axis (of minutes, such that it is within the
+    range of datetime64[ns]) to and from numpy.datetime64.
+    """
+
+    params = [["int64", "float64"]]
+    param_names = ["dtype"]
+
+    def setup(self, dtype: str):
+        self.unit = unit_system().unit("minutes since 1990-01-01")
+        self.times = np.arange(N_TIMES, dtype=dtype)
+        self.datetimes = self.unit.to_datetime64(self.times)
+
+    def time_to_datetime64(self, dtype: str):
+        self.unit.to_datetime64(self.times)
+
+    def time_from_datetime64(self, dtype: str):
+        self.unit.from_datetime64(self.datetimes)
+
+
+class RebaseTimeAxis:
+    """Rebasing a long, regular (hourly) time axis to another date unit."""
+
+    def setup(self):
+        system = unit_system()
+        self.to_unit = system.unit("days since 2000-01-01")
+        self.axis = system.unit("hours since 1970-01-01").time_axis(
+            np.arange(N_TIMES, dtype=np.float64)
+        )
+
+    def time_rebase(self):
+        self.axis.rebase(self.to_unit)
+
+    def time_rebase_and_materialise(self):
+        self.axis.rebase(self.to_unit).values
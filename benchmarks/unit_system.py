@@ -0,0 +1,124 @@
+"""
+Benchmarks of loading the unit database, and of parsing, resolving and
+comparing all of its units, in the asv (airspeed velocity) format.
+
+"""
+
+import itertools
+
+from pyudunits2 import UnitSystem, UnresolvableUnitException
+from pyudunits2._grammar import parse
+
+from . import unit_system
+
+
+def _definitions() -> list[str]:
+    # The content of every <def> of the udunits2 XML database.
+    from lxml import etree
+
+    from pyudunits2._udunits2_xml_parser import XML_path
+
+    root = etree.parse(str(XML_path)).getroot()
+    return [element.text.strip() for element in root.iter("{*}def")]
+
+
+def _identifiers(system: UnitSystem, prefixed: bool = True) -> list[str]:
+    # Every name, symbol and alias of the units of the system, both without
+    # and (optionally) with each of the prefixes (prefix names for names, and
+    # prefix symbols for symbols).
+    names = [*system._names, *system._alias_names]
+    symbols = [*system._symbols, *system._alias_symbols]
+    if not prefixed:
+        return [*names, *symbols]
+    return [
+        *names,
+        *symbols,
+        *(prefix + name for prefix in system._prefix_names for name in names),
+        *(prefix + symbol for prefix in system._prefix_symbols for symbol in symbols),
+    ]
+
+
+def _resolve_all(system: UnitSystem, identifiers: list[str]) -> None:
+    for identifier in identifiers:
+        try:
+            system.unit_by_name_or_symbol(identifier)
+        except (UnresolvableUnitException, SyntaxError):
+            # Not all prefixed identifiers are units, and the definition of
+            # some units (e.g. "'/60") can't be parsed.
+            pass
+
+
+class LoadUnitSystem:
+    def time_from_udunits2_xml(self):
+        UnitSystem.from_udunits2_xml()
+
+    def timeraw_import_and_from_udunits2_xml(self):
+        # A cold start, in a fresh interpreter.
+        return """
+        from pyudunits2 import UnitSystem
+        UnitSystem.from_udunits2_xml()
+        """
+
+
+class ParseDefinitions:
+    """Parsing of the definition of every unit of the udunits2 database."""
+
+    def setup(self):
+        self.definitions = []
+        for definition in _definitions():
+            try:
+                parse(definition)
+            except SyntaxError:
+                continue
+            self.definitions.append(definition)
+
+    def time_parse(self):
+        for definition in self.definitions:
+            parse(definition)
+
+
+class ResolveIdentifiers:
+    """
+    Resolution of every name, symbol and alias, with every prefix. Cold
+    resolution includes the (lazy) parsing and resolution of the definitions
+    of the units of the unit system.
+    """
+
+    params = [["cold", "warm"]]
+    param_names = ["cache"]
+    # A fresh unit system for each sample.
+    number = 1
+    repeat = 3
+
+    def setup(self, cache: str):
+        self.system = UnitSystem.from_udunits2_xml()
+        self.identifiers = _identifiers(self.system)
+        if cache == "warm":
+            _resolve_all(self.system, self.identifiers)
+
+    def time_resolve(self, cache: str):
+        _resolve_all(self.system, self.identifiers)
+
+
+class PairwiseConvertibility:
+    """Convertibility checks of every pair of units of the database."""
+
+    number = 1
+    repeat = 1
+    timeout = 300
+
+    def setup(self):
+        system = unit_system()
+        units = {}
+        for identifier in _identifiers(system, prefixed=False):
+            try:
+                unit = system.unit_by_name_or_symbol(identifier)
+            except (UnresolvableUnitException, SyntaxError):
+                continue
+            # The aliases of a unit resolve to the same unit instance.
+            units.setdefault(id(unit), unit)
+        self.units = list(units.values())
+
+    def time_is_convertible_to(self):
+        for from_unit, to_unit in itertools.product(self.units, repeat=2):
+            from_unit.is_convertible_to(to_unit)
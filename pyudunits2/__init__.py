@@ -8,10 +8,20 @@ from ._unit import (
     DateTime as DateTime,
     NamedUnit as NamedUnit,
     Converter as Converter,
+    MultiConverter as MultiConverter,
 )
 from ._unit_system import (
     UnitSystem as UnitSystem,
 )
+from ._time_axis import (
+    TimeAxis as TimeAxis,
+)
+from ._instrumentation import (
+    instrument as instrument,
+)
+from ._parallel import (
+    SharedArrays as SharedArrays,
+)
 from ._exceptions import (
     UnresolvableUnitException as UnresolvableUnitException,
     IncompatibleUnitsError as IncompatibleUnitsError,
@@ -22,6 +32,10 @@ BasisUnit.__module__ = __name__
 DateUnit.__module__ = __name__
 NamedUnit.__module__ = __name__
 Converter.__module__ = __name__
+MultiConverter.__module__ = __name__
 UnitSystem.__module__ = __name__
+TimeAxis.__module__ = __name__
+instrument.__module__ = __name__
+SharedArrays.__module__ = __name__
 UnresolvableUnitException.__module__ = __name__
 IncompatibleUnitsError.__module__ = __name__
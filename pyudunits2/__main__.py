@@ -1,10 +1,21 @@
 import argparse
+import concurrent.futures
+import contextlib
+import csv
+import functools
+import itertools
+import json
 import sys
+import typing
+from fractions import Fraction
+
+from . import _server
 
 from ._unit_system import UnitSystem
 from ._unit import Converter
-from ._exceptions import IncompatibleUnitsError
+from ._exceptions import IncompatibleUnitsError, UnresolvableUnitException
 from ._grammar import _debug_tokens
+from ._optional import import_numpy
 
 
 def configure_parser(parser: argparse.ArgumentParser) -> None:
@@ -16,26 +27,148 @@ def configure_parser(parser: argparse.ArgumentParser) -> None:
     subparsers = parser.add_subparsers()
 
     convert_subcommand = subparsers.add_parser(
-        "convert", help="Convert a value from one unit to another"
+        "convert",
+        help=(
+            "Convert a value (or a stream of values, from stdin or files) "
+            "from one unit to another"
+        ),
+    )
+    convert_subcommand.add_argument(
+        "value",
+        nargs="?",
+        help=(
+            "The value to convert. If not given, values are read (one per line) "
+            "from the input files"
+        ),
     )
-    convert_subcommand.add_argument("value", help="The value to convert")
     convert_subcommand.add_argument("from_unit", help="The unit of the value")
     convert_subcommand.add_argument("to_unit", help="The target unit")
+    convert_subcommand.add_argument(
+        "-i",
+        "--input",
+        action="append",
+        dest="inputs",
+        metavar="FILE",
+        help="A file of values to convert ('-' for stdin, the default)",
+    )
+    convert_subcommand.add_argument(
+        "--column",
+        type=int,
+        help="Read the values from this (1-based) column of CSV input",
+    )
+    convert_subcommand.add_argument(
+        "--delimiter", default=",", help="The delimiter of CSV input"
+    )
+    convert_subcommand.add_argument(
+        "--skip-rows",
+        type=int,
+        default=0,
+        help="The number of (header) rows to skip at the start of each input",
+    )
+    convert_subcommand.add_argument(
+        "--format",
+        help=(
+            "The printf-style format of the converted values "
+            "(default: the shortest representation which round-trips)"
+        ),
+    )
+    convert_subcommand.add_argument(
+        "--block-size",
+        type=int,
+        default=CONVERT_BLOCK_SIZE,
+        help="The number of values converted at a time",
+    )
     convert_subcommand.set_defaults(handler=convert_handler)
 
     conv_expr = subparsers.add_parser(
         "conversion-expr", help="Get the equation to convert from one unit to another"
     )
-    conv_expr.add_argument("from_unit", help="The unit that you have")
-    conv_expr.add_argument("to_unit", help="The unit that you want")
+    conv_expr.add_argument(
+        "from_unit",
+        nargs="?",
+        help=(
+            "The unit that you have. If neither unit is given, from/to pairs "
+            "are read (one pair per line) from the input files, and JSON lines "
+            "are written"
+        ),
+    )
+    conv_expr.add_argument("to_unit", nargs="?", help="The unit that you want")
+    _add_batch_arguments(conv_expr)
+    conv_expr.add_argument(
+        "--delimiter",
+        default=",",
+        help="The delimiter between the from and to units of the input",
+    )
     conv_expr.set_defaults(handler=conv_expr_handler)
 
     explain = subparsers.add_parser(
         "explain-unit", help="Get (non machine readable) information about a unit"
     )
-    explain.add_argument("unit", help="The unit to explain")
+    explain.add_argument(
+        "unit",
+        nargs="?",
+        help=(
+            "The unit to explain. If not given, units are read (one per line) "
+            "from the input files, and JSON lines are written"
+        ),
+    )
+    _add_batch_arguments(explain)
     explain.set_defaults(handler=explain_handler)
 
+    serve = subparsers.add_parser(
+        "serve",
+        help=(
+            "Run a server which keeps the unit system loaded, such that "
+            "subsequent CLI commands are fast. The other subcommands use the "
+            f"server if it is running (unless {_server.NO_SERVER_ENV} is set)"
+        ),
+    )
+    serve.add_argument(
+        "--socket",
+        help=(
+            "The path of the Unix socket to listen on (default: "
+            f"${_server.SOCKET_ENV}, or a per-user path in $XDG_RUNTIME_DIR "
+            "or in a private directory in the temporary directory)"
+        ),
+    )
+    serve.set_defaults(handler=serve_handler)
+
+    bench = subparsers.add_parser(
+        "bench",
+        help=(
+            "Run the benchmark suite (in the asv format) of a pyudunits2 "
+            "checkout, and write the results as JSON"
+        ),
+    )
+    bench.add_argument(
+        "--benchmark-dir",
+        default="benchmarks",
+        help="The benchmarks package directory (default: ./benchmarks)",
+    )
+    bench.add_argument(
+        "-b",
+        "--bench",
+        metavar="REGEX",
+        help="Only run the benchmarks whose names match the regular expression",
+    )
+    bench.add_argument(
+        "-o",
+        "--output",
+        metavar="FILE",
+        help="The file to write the JSON results to (default: stdout)",
+    )
+    bench.add_argument(
+        "--compare",
+        metavar="FILE",
+        help="Compare the results with those of a previous run",
+    )
+    bench.add_argument(
+        "--quick",
+        action="store_true",
+        help="Take a single sample of each benchmark",
+    )
+    bench.set_defaults(handler=bench_handler)
+
     explain = subparsers.add_parser(
         "debug-parser",
         help="Show debug information relating to the raw parsing of a unit",
@@ -44,35 +177,365 @@ def configure_parser(parser: argparse.ArgumentParser) -> None:
     explain.set_defaults(handler=debug_parsing_handler)
 
 
-def convert_handler(args: argparse.Namespace) -> None:
-    raise NotImplementedError("Conversion not yet implemented")
+def _add_batch_arguments(subparser: argparse.ArgumentParser) -> None:
+    subparser.add_argument(
+        "-i",
+        "--input",
+        action="append",
+        dest="inputs",
+        metavar="FILE",
+        help="A file of batch input ('-' for stdin, the default)",
+    )
+    subparser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="The number of worker processes of batch mode",
+    )
 
 
-def conv_expr_handler(args: argparse.Namespace) -> None:
-    unit_system = UnitSystem.from_udunits2_xml()
-    from_unit = unit_system.unit(args.from_unit)
-    to_unit = unit_system.unit(args.to_unit)
+#: The default number of values read, converted and written at a time by the
+#: convert subcommand.
+CONVERT_BLOCK_SIZE = 2**16
+
+
+def _read_value_blocks(
+    paths: list[str],
+    *,
+    column: int | None,
+    delimiter: str,
+    skip_rows: int,
+    block_size: int,
+):
+    # Yield the values of the given files (or stdin) in blocks of (at most)
+    # block_size lines. Each block is parsed by NumPy's (C) text parser.
+    np = import_numpy()
+
+    for path in paths:
+        if path == "-":
+            stream = contextlib.nullcontext(sys.stdin)
+        else:
+            stream = open(path, encoding="utf-8")
+        with stream as lines:
+            for _ in itertools.islice(lines, skip_rows):
+                pass
+            while block := list(itertools.islice(lines, block_size)):
+                yield np.loadtxt(
+                    block,
+                    dtype=np.float64,
+                    delimiter=None if column is None else delimiter,
+                    usecols=0 if column is None else column - 1,
+                    ndmin=1,
+                )
+
+
+def convert_handler(args: argparse.Namespace) -> None:
+    if args.value is not None:
+        _run_command(
+            "convert",
+            value=args.value,
+            from_unit=args.from_unit,
+            to_unit=args.to_unit,
+            format=args.format,
+        )
+        return
 
+    unit_system = UnitSystem.from_udunits2_xml()
+    try:
+        from_unit = unit_system.unit(args.from_unit)
+        to_unit = unit_system.unit(args.to_unit)
+    except INPUT_ERRORS as err:
+        print(f"{type(err).__name__}: {err}", file=sys.stderr)
+        sys.exit(1)
     try:
         converter = Converter(from_unit, to_unit)
     except IncompatibleUnitsError:
         print(f'It is not possible to convert from "{from_unit}" to "{to_unit}"')
         sys.exit(1)
 
-    print(
-        f'To convert from "{from_unit}" to '
-        f'"{to_unit}", apply the following expression:'
+    format_value = repr if args.format is None else args.format.__mod__
+
+    blocks = _read_value_blocks(
+        args.inputs or ["-"],
+        column=args.column,
+        delimiter=args.delimiter,
+        skip_rows=args.skip_rows,
+        block_size=args.block_size,
     )
-    print(converter.expression)
+    write = sys.stdout.write
+    try:
+        for block in blocks:
+            converted = converter.convert(block).tolist()
+            if converted:
+                write("\n".join(map(format_value, converted)) + "\n")
+    except ValueError as err:
+        print(f"Unable to read the values to convert: {err}", file=sys.stderr)
+        sys.exit(1)
+
+
+def conv_expr_handler(args: argparse.Namespace) -> None:
+    if args.from_unit is None:
+        lines = _read_lines(args.inputs or ["-"])
+        pairs = [tuple(row) for row in csv.reader(lines, delimiter=args.delimiter)]
+        _run_batch("conversion-expr", pairs, jobs=args.jobs)
+        return
+    if args.to_unit is None:
+        print("A to unit must be given with the from unit", file=sys.stderr)
+        sys.exit(2)
+    _run_command("conversion-expr", from_unit=args.from_unit, to_unit=args.to_unit)
 
 
 def explain_handler(args: argparse.Namespace) -> None:
+    if args.unit is None:
+        units = [(line,) for line in _read_lines(args.inputs or ["-"])]
+        _run_batch("explain-unit", units, jobs=args.jobs)
+        return
+    _run_command("explain-unit", unit=args.unit)
+
+
+# The commands which may be run by the server. Each takes the unit system and
+# the (JSON serialisable) arguments of the command, and returns the output and
+# the exit code of the command.
+
+
+def convert_value(
+    unit_system: UnitSystem,
+    value: str,
+    from_unit: str,
+    to_unit: str,
+    format: str | None = None,
+) -> tuple[str, int]:
+    from_unit_, to_unit_ = unit_system.unit(from_unit), unit_system.unit(to_unit)
+    try:
+        converter = Converter(from_unit_, to_unit_)
+    except IncompatibleUnitsError:
+        return f'It is not possible to convert from "{from_unit_}" to "{to_unit_}"', 1
+    result = converter.convert(float(value))
+    return repr(result) if format is None else format % result, 0
+
+
+def conversion_expr(
+    unit_system: UnitSystem, from_unit: str, to_unit: str
+) -> tuple[str, int]:
+    from_unit_, to_unit_ = unit_system.unit(from_unit), unit_system.unit(to_unit)
+    try:
+        converter = Converter(from_unit_, to_unit_)
+    except IncompatibleUnitsError:
+        return f'It is not possible to convert from "{from_unit_}" to "{to_unit_}"', 1
+
+    return (
+        f'To convert from "{from_unit_}" to '
+        f'"{to_unit_}", apply the following expression:\n'
+        f"{converter.expression}"
+    ), 0
+
+
+def explain_unit(unit_system: UnitSystem, unit: str) -> tuple[str, int]:
+    unit_ = unit_system.unit(unit)
+    basis_unit = unit_.expanded()
+    return (
+        f"Unit: {unit_}\n"
+        f"In basis form: {basis_unit}\n"
+        f"Dimensionality: {unit_.dimensionality()}"
+    ), 0
+
+
+COMMANDS: dict[str, typing.Callable[..., tuple[str, int]]] = {
+    "convert": convert_value,
+    "conversion-expr": conversion_expr,
+    "explain-unit": explain_unit,
+}
+
+#: The exceptions of the commands which are due to their (user) input, such
+#: as an unresolvable unit, or a value which isn't a number.
+INPUT_ERRORS = (
+    SyntaxError,
+    UnresolvableUnitException,
+    ValueError,
+    NotImplementedError,
+)
+
+
+def _checked(command: _server.Command) -> _server.Command:
+    # The command, with errors in its input raised as CommandErrors.
+    @functools.wraps(command)
+    def checked(*args, **kwargs):
+        try:
+            return command(*args, **kwargs)
+        except INPUT_ERRORS as err:
+            raise _server.CommandError(f"{type(err).__name__}: {err}") from err
+
+    return checked
+
+
+def _run_command(command: str, **args) -> None:
+    # Run the command on the server (see the serve subcommand) if there is
+    # one running, otherwise run it here.
+    try:
+        result = _server.request(command, args)
+        if result is None:
+            result = _checked(COMMANDS[command])(UnitSystem.from_udunits2_xml(), **args)
+    except _server.CommandError as err:
+        print(err, file=sys.stderr)
+        sys.exit(1)
+    output, exit_code = result
+    print(output)
+    if exit_code:
+        sys.exit(exit_code)
+
+
+# The commands of batch mode. Each takes the unit system and the fields of a
+# line of input, and returns a JSON serialisable record of the results.
+
+
+def _coefficients(
+    coefficients: tuple[Fraction, Fraction] | None,
+) -> dict[str, float | None]:
+    # The scale and offset of an affine conversion (value * scale + offset).
+    if coefficients is None:
+        return {"scale": None, "offset": None}
+    scale, offset = coefficients
+    return {"scale": float(scale), "offset": float(offset)}
+
+
+def explain_unit_record(unit_system: UnitSystem, unit: str) -> dict[str, typing.Any]:
+    unit_ = unit_system.unit(unit)
+    # The conversion to the basis form of the unit (which, unlike a conversion
+    # to its dimensionality, includes dimensionless basis units such as rad).
+    basis = unit_._basis_program()
+    return {
+        "name": str(unit_),
+        "basis_form": unit_.expanded(),
+        "dimensionality": unit_.dimensionality()._name_form(),
+        **_coefficients(None if basis is None else basis.program.affine_coefficients()),
+    }
+
+
+def conversion_record(
+    unit_system: UnitSystem, from_unit: str, to_unit: str
+) -> dict[str, typing.Any]:
+    try:
+        converter = Converter(unit_system.unit(from_unit), unit_system.unit(to_unit))
+    except IncompatibleUnitsError:
+        return {"convertible": False, "expression": None, "scale": None, "offset": None}
+    return {
+        "convertible": True,
+        "expression": str(converter.expression),
+        **_coefficients(converter._affine_coefficients()),
+    }
+
+
+BATCH_COMMANDS: dict[
+    str, tuple[tuple[str, ...], typing.Callable[..., dict[str, typing.Any]]]
+] = {
+    "conversion-expr": (("from_unit", "to_unit"), conversion_record),
+    "explain-unit": (("unit",), explain_unit_record),
+}
+
+
+@functools.cache
+def _batch_unit_system() -> UnitSystem:
+    # Loaded once per process (including each worker process of batch mode).
+    return UnitSystem.from_udunits2_xml()
+
+
+def _batch_record(command: str, fields: tuple[str, ...]) -> dict[str, typing.Any]:
+    names, record_command = BATCH_COMMANDS[command]
+    record: dict[str, typing.Any] = dict.fromkeys(names)
+    record.update(zip(names, fields))
+    if len(fields) != len(names):
+        record["error"] = f"Expected {len(names)} fields, got {len(fields)}: {fields}"
+        return record
+    try:
+        record.update(record_command(_batch_unit_system(), *fields))
+    except Exception as err:
+        # A bad line of input must not prevent the rest of the batch.
+        record["error"] = f"{type(err).__name__}: {err}"
+    return record
+
+
+def _read_lines(paths: list[str]) -> typing.Iterator[str]:
+    # Yield the (stripped, non-blank) lines of the given files (or stdin).
+    for path in paths:
+        if path == "-":
+            stream = contextlib.nullcontext(sys.stdin)
+        else:
+            stream = open(path, encoding="utf-8")
+        with stream as lines:
+            for line in lines:
+                if line.strip():
+                    yield line.strip()
+
+
+def _run_batch(command: str, items: list[tuple[str, ...]], *, jobs: int) -> None:
+    # Each distinct item is computed once, and the records are written (as
+    # JSON lines) in the order of the input.
+    unique = list(dict.fromkeys(items))
+    record = functools.partial(_batch_record, command)
+    if jobs > 1 and len(unique) > 1:
+        with concurrent.futures.ProcessPoolExecutor(jobs) as executor:
+            chunk_size = max(1, len(unique) // (4 * jobs))
+            records = list(executor.map(record, unique, chunksize=chunk_size))
+    else:
+        records = list(map(record, unique))
+    lines = dict(zip(unique, map(json.dumps, records)))
+    sys.stdout.write("".join(lines[item] + "\n" for item in items))
+
+
+def serve_handler(args: argparse.Namespace) -> None:
     unit_system = UnitSystem.from_udunits2_xml()
-    unit = unit_system.unit(args.unit)
-    basis_unit = unit.expanded()
-    print(f"Unit: {unit}")
-    print(f"In basis form: {basis_unit}")
-    print(f"Dimensionality: {unit.dimensionality()}")
+    commands = {
+        # The results of the commands are cached, as the same units tend to
+        # be asked about repeatedly.
+        name: functools.lru_cache(maxsize=4096)(
+            functools.partial(_checked(command), unit_system)
+        )
+        for name, command in COMMANDS.items()
+    }
+    path = args.socket or _server.socket_path()
+    try:
+        server = _server.create_server(path, commands)
+    except RuntimeError as err:
+        print(err, file=sys.stderr)
+        sys.exit(1)
+    print(f"Serving pyudunits2 on {path}", file=sys.stderr)
+    try:
+        _server.serve(server)
+    except KeyboardInterrupt:
+        pass
+
+
+def bench_handler(args: argparse.Namespace) -> None:
+    import pathlib
+
+    from . import _bench
+
+    try:
+        benchmarks = _bench.discover(pathlib.Path(args.benchmark_dir), args.bench)
+    except ValueError as err:
+        print(err, file=sys.stderr)
+        sys.exit(1)
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fh:
+            baseline = json.load(fh)
+
+    results = _bench.run_all(benchmarks, quick=args.quick, progress=sys.stderr)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=1)
+    else:
+        print(json.dumps(results, indent=1))
+
+    if baseline is not None:
+        print("\nbaseline -> current (ratio):", file=sys.stderr)
+        for name, before, after, ratio in _bench.compare(baseline, results):
+            print(
+                f"{name}: {_bench.format_time(before)} -> "
+                f"{_bench.format_time(after)} ({ratio:.2f})",
+                file=sys.stderr,
+            )
 
 
 def debug_parsing_handler(args: argparse.Namespace) -> None:
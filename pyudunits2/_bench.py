@@ -0,0 +1,288 @@
+"""
+A runner of the benchmark suite of the repository (in the ``benchmarks``
+directory), for use without asv (see the ``bench`` subcommand of the CLI).
+
+The benchmarks are written in the asv (airspeed velocity) format: classes
+(or functions) in the modules of the benchmarks package, with ``time_*``
+methods which are timed in-process, and ``timeraw_*`` methods which return
+code to be timed in a fresh interpreter. The ``params``, ``param_names``,
+``number`` and ``repeat`` attributes, and ``setup`` and ``teardown`` methods
+(which may raise NotImplementedError to skip a benchmark) are supported.
+
+The results are written as JSON, keyed by the name of each benchmark, such
+that the results of different runs (e.g. before and after a change) can be
+compared (see :func:`compare`).
+
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import importlib
+import inspect
+import itertools
+import pathlib
+import pkgutil
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import textwrap
+import time
+import timeit
+import typing
+
+#: The version of the format of the results.
+RESULTS_VERSION = 1
+
+#: The minimum duration (in seconds) of a sample, when the number of calls of
+#: each sample is chosen automatically.
+SAMPLE_TIME = 0.01
+
+#: The default number of samples of each benchmark.
+DEFAULT_REPEAT = 5
+
+
+@dataclasses.dataclass
+class Benchmark:
+    #: The name of the benchmark, e.g. "converter.Convert.time_array".
+    name: str
+    #: The class of the benchmark, or None for a function benchmark.
+    cls: type | None
+    #: The name of the method (or function) of the benchmark.
+    attr: str
+    module: typing.Any
+    params: list[list[typing.Any]]
+    param_names: list[str]
+
+    @property
+    def is_raw(self) -> bool:
+        return self.attr.startswith("timeraw_")
+
+    def _option(self, name: str, default: typing.Any) -> typing.Any:
+        owner = self.cls if self.cls is not None else getattr(self.module, self.attr)
+        return getattr(owner, name, default)
+
+    @property
+    def number(self) -> int:
+        # 0 means that the number of calls of each sample is chosen
+        # automatically.
+        return 1 if self.is_raw else int(self._option("number", 0) or 0)
+
+    @property
+    def repeat(self) -> int:
+        repeat = self._option("repeat", DEFAULT_REPEAT) or DEFAULT_REPEAT
+        # asv also accepts a (min_repeat, max_repeat, max_time) tuple.
+        return repeat[1] if isinstance(repeat, tuple) else int(repeat)
+
+
+def discover(directory: pathlib.Path, pattern: str | None = None) -> list[Benchmark]:
+    """
+    Find the benchmarks of the given (benchmarks package) directory, whose
+    names match the (regular expression) pattern.
+
+    """
+    directory = directory.resolve()
+    if not (directory / "__init__.py").exists():
+        raise ValueError(f"{directory} is not a benchmarks package")
+    sys.path.insert(0, str(directory.parent))
+    try:
+        package = importlib.import_module(directory.name)
+        modules = [
+            importlib.import_module(f"{directory.name}.{module.name}")
+            for module in pkgutil.iter_modules([str(directory)])
+        ]
+    finally:
+        sys.path.remove(str(directory.parent))
+
+    benchmarks = []
+    for module in [package, *modules]:
+        prefix = module.__name__.partition(".")[2]
+        for name, obj in vars(module).items():
+            if getattr(obj, "__module__", None) != module.__name__:
+                continue
+            if inspect.isclass(obj):
+                attrs = [attr for attr in dir(obj) if _is_benchmark(attr)]
+                owner: typing.Any = obj
+            elif inspect.isfunction(obj) and _is_benchmark(name):
+                attrs, owner = [name], None
+            else:
+                continue
+            params = getattr(obj, "params", [])
+            if params and not all(isinstance(param, list) for param in params):
+                # A single parameter.
+                params = [params]
+            param_names = getattr(
+                obj, "param_names", [f"param{i + 1}" for i in range(len(params))]
+            )
+            for attr in attrs:
+                parts = [prefix, name, attr] if owner is not None else [prefix, attr]
+                full_name = ".".join(part for part in parts if part)
+                if pattern is None or re.search(pattern, full_name):
+                    benchmarks.append(
+                        Benchmark(
+                            full_name, owner, attr, module, params, list(param_names)
+                        )
+                    )
+    return sorted(benchmarks, key=lambda benchmark: benchmark.name)
+
+
+def _is_benchmark(name: str) -> bool:
+    return name.startswith(("time_", "timeraw_"))
+
+
+def run(benchmark: Benchmark, *, quick: bool = False) -> list[dict[str, typing.Any]]:
+    """
+    Run the benchmark for each combination of its parameters, returning the
+    result (in seconds per call) of each.
+
+    """
+    results = []
+    for combination in itertools.product(*benchmark.params):
+        result: dict[str, typing.Any] = {
+            "params": dict(zip(benchmark.param_names, map(repr, combination)))
+        }
+        try:
+            samples, number = _samples(benchmark, combination, quick=quick)
+        except NotImplementedError:
+            # The benchmark is not applicable (e.g. a missing dependency).
+            result["skipped"] = True
+        else:
+            result.update(
+                min=min(samples),
+                median=statistics.median(samples),
+                samples=samples,
+                number=number,
+            )
+        results.append(result)
+    return results
+
+
+def _samples(
+    benchmark: Benchmark, combination: tuple, *, quick: bool
+) -> tuple[list[float], int]:
+    instance = benchmark.cls() if benchmark.cls is not None else benchmark.module
+    func = getattr(instance, benchmark.attr)
+
+    def sample(number: int) -> float:
+        # As with asv, each sample has a fresh setup.
+        if benchmark.cls is not None and hasattr(instance, "setup"):
+            instance.setup(*combination)
+        try:
+            if benchmark.is_raw:
+                return _time_raw(func(*combination))
+            return timeit.Timer(lambda: func(*combination)).timeit(number)
+        finally:
+            if benchmark.cls is not None and hasattr(instance, "teardown"):
+                instance.teardown(*combination)
+
+    number = benchmark.number
+    if not number:
+        number = 1
+        while (elapsed := sample(number)) < SAMPLE_TIME:
+            number *= max(2, min(10, int(SAMPLE_TIME / max(elapsed, 1e-9))))
+    repeat = 1 if quick else benchmark.repeat
+    return [sample(number) / number for _ in range(repeat)], number
+
+
+def _time_raw(code: str | tuple[str, str]) -> float:
+    # Time the code in a fresh interpreter, after running its setup code.
+    code, setup = (code, "") if isinstance(code, str) else code
+    script = "\n".join(
+        [
+            "import time as _time",
+            textwrap.dedent(setup),
+            "_start = _time.perf_counter()",
+            textwrap.dedent(code),
+            "print(_time.perf_counter() - _start)",
+        ]
+    )
+    process = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    return float(process.stdout.splitlines()[-1])
+
+
+def run_all(
+    benchmarks: typing.Iterable[Benchmark],
+    *,
+    quick: bool = False,
+    progress: typing.TextIO | None = None,
+) -> dict[str, typing.Any]:
+    """Run the benchmarks, returning their results and the environment."""
+    from . import __version__
+
+    results = {}
+    for benchmark in benchmarks:
+        start = time.perf_counter()
+        results[benchmark.name] = run(benchmark, quick=quick)
+        if progress is not None:
+            for result in results[benchmark.name]:
+                print(
+                    f"{benchmark.name}{_format_params(result['params'])}: "
+                    f"{_format_result(result)}",
+                    file=progress,
+                )
+            elapsed = time.perf_counter() - start
+            print(f"    ({elapsed:.1f}s)", file=progress)
+    return {
+        "version": RESULTS_VERSION,
+        "pyudunits2": __version__,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+        "date": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "results": results,
+    }
+
+
+def compare(
+    baseline: dict[str, typing.Any], results: dict[str, typing.Any]
+) -> list[tuple[str, float, float, float]]:
+    """
+    The (name, baseline median, median, ratio) of each benchmark result
+    which is in both sets of results.
+
+    """
+    baseline_medians = _medians(baseline)
+    return [
+        (name, baseline_medians[name], median, median / baseline_medians[name])
+        for name, median in _medians(results).items()
+        if name in baseline_medians
+    ]
+
+
+def _medians(results: dict[str, typing.Any]) -> dict[str, float]:
+    if results.get("version") != RESULTS_VERSION:
+        raise ValueError(
+            f"Unsupported results version {results.get('version')!r} "
+            f"(expected {RESULTS_VERSION})"
+        )
+    return {
+        f"{name}{_format_params(result['params'])}": result["median"]
+        for name, benchmark_results in results["results"].items()
+        for result in benchmark_results
+        if not result.get("skipped")
+    }
+
+
+def _format_params(params: dict[str, str]) -> str:
+    if not params:
+        return ""
+    return "(" + ", ".join(f"{name}={value}" for name, value in params.items()) + ")"
+
+
+def _format_result(result: dict[str, typing.Any]) -> str:
+    if result.get("skipped"):
+        return "skipped"
+    return format_time(result["median"])
+
+
+def format_time(seconds: float) -> str:
+    """A human-readable form of the duration, e.g. "12.3ms"."""
+    for unit, scale in [("s", 1), ("ms", 1e-3), ("μs", 1e-6)]:
+        if seconds >= scale:
+            return f"{seconds / scale:.3g}{unit}"
+    return f"{seconds / 1e-9:.3g}ns"
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import typing
+
+
+K = typing.TypeVar("K")
+V = typing.TypeVar("V")
+
+
+class BoundedCache(dict[K, V]):
+    """
+    A dictionary which holds at most ``maxsize`` items. When full, the oldest
+    item is evicted to make way for a new one.
+
+    """
+
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __setitem__(self, key: K, value: V) -> None:
+        if key not in self and len(self) >= self.maxsize:
+            # Dictionaries are insertion ordered, so the first key is the oldest.
+            del self[next(iter(self))]
+        super().__setitem__(key, value)
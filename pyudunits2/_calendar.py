@@ -0,0 +1,347 @@
+"""
+Calendar arithmetic for date units.
+
+The day arithmetic is written such that it works equally on Python ints and
+on NumPy integer arrays, so that it can be applied to whole time axes at
+once, without constructing a Python date object per element.
+
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import typing
+from fractions import Fraction
+
+from ._optional import import_numpy
+
+if typing.TYPE_CHECKING:
+    from ._datetime import DateTime, Time
+
+
+#: The calendar assumed when none is given (as in CF conventions).
+DEFAULT_CALENDAR = "standard"
+
+SECONDS_PER_DAY = 86_400
+MICROSECONDS_PER_DAY = SECONDS_PER_DAY * 1_000_000
+
+#: The length of a tick of each (fixed length) ``numpy.datetime64`` unit.
+SECONDS_PER_DATETIME64_TICK: dict[str, Fraction] = {
+    "W": Fraction(7 * SECONDS_PER_DAY),
+    "D": Fraction(SECONDS_PER_DAY),
+    "h": Fraction(3600),
+    "m": Fraction(60),
+    "s": Fraction(1),
+    "ms": Fraction(1, 10**3),
+    "us": Fraction(1, 10**6),
+    "ns": Fraction(1, 10**9),
+    "ps": Fraction(1, 10**12),
+    "fs": Fraction(1, 10**15),
+    "as": Fraction(1, 10**18),
+}
+
+
+def _where(condition, x, y):
+    # A conditional which works on both Python scalars and NumPy arrays.
+    if isinstance(condition, bool):
+        return x if condition else y
+    np = import_numpy()
+
+    return np.where(condition, x, y)
+
+
+class CalendarEngine:
+    """
+    The day arithmetic of a calendar: the conversion between dates and day
+    numbers, where day 0 is 1970-01-01 of the calendar (or of the Gregorian
+    calendar, for calendars which count real days).
+
+    Both conversions must work equally on Python ints and on (broadcastable)
+    NumPy integer arrays, without constructing a date object per element.
+
+    """
+
+    #: Whether the days of this calendar are real (solar) days, with day 0
+    #: being 1970-01-01 in the (proleptic) Gregorian calendar. Offsets in
+    #: calendars which count real days are interchangeable.
+    counts_real_days: bool = False
+
+    def days_from_date(self, year, month, day):
+        """The number of days since 1970-01-01 of the given date(s)."""
+        raise NotImplementedError("Subclass must implement")
+
+    def date_from_days(self, days):
+        """The (year, month, day) of the given number(s) of days since 1970-01-01."""
+        raise NotImplementedError("Subclass must implement")
+
+
+class _MarchYearCalendar(CalendarEngine):
+    # Calendars whose month lengths are those of the Gregorian calendar, other
+    # than February. Years are counted from March, such that the (variable
+    # length) February is at the end of the year, and the dates repeat in a
+    # cycle of whole (March based) years. Based on the well known algorithms
+    # of Howard Hinnant, using only integer arithmetic (and floor division,
+    # such that negative years work).
+
+    cycle_years: int
+    cycle_days: int
+    #: The days from 0000-03-01 of the calendar to day 0.
+    epoch_offset: int
+    #: Whether the year before year 1 is year 0. Otherwise, as in udunits2
+    #: and CF conventions, it is year -1 (and, as in udunits2, a year 0 is
+    #: taken to be year 1).
+    has_year_zero: bool = True
+
+    def _days_before_year(self, year_of_cycle):
+        raise NotImplementedError("Subclass must implement")
+
+    def _year_of_cycle(self, day_of_cycle):
+        raise NotImplementedError("Subclass must implement")
+
+    def days_from_date(self, year, month, day):
+        if not self.has_year_zero:
+            year = year + (year < 0) + (year == 0)
+        return self._days_from_astronomical_date(year, month, day)
+
+    def _days_from_astronomical_date(self, year, month, day):
+        year = year - (month <= 2)
+        cycle = year // self.cycle_years
+        year_of_cycle = year - cycle * self.cycle_years
+        month_index = (month + 9) % 12  # March == 0
+        day_of_year = (153 * month_index + 2) // 5 + day - 1
+        return (
+            cycle * self.cycle_days
+            + self._days_before_year(year_of_cycle)
+            + day_of_year
+            - self.epoch_offset
+        )
+
+    def date_from_days(self, days):
+        days = days + self.epoch_offset
+        cycle = days // self.cycle_days
+        day_of_cycle = days - cycle * self.cycle_days
+        year_of_cycle = self._year_of_cycle(day_of_cycle)
+        day_of_year = day_of_cycle - self._days_before_year(year_of_cycle)
+        month_index = (5 * day_of_year + 2) // 153  # March == 0
+        day = day_of_year - (153 * month_index + 2) // 5 + 1
+        month = month_index + 3 - 12 * (month_index >= 10)
+        year = year_of_cycle + cycle * self.cycle_years + (month <= 2)
+        if not self.has_year_zero:
+            year = year - (year <= 0)
+        return year, month, day
+
+
+class ProlepticGregorianCalendar(_MarchYearCalendar):
+    # As in ISO 8601, the proleptic Gregorian calendar has a year 0.
+    counts_real_days = True
+    cycle_years, cycle_days = 400, 146_097
+    epoch_offset = 719_468
+
+    def _days_before_year(self, year_of_cycle):
+        return year_of_cycle * 365 + year_of_cycle // 4 - year_of_cycle // 100
+
+    def _year_of_cycle(self, day_of_cycle):
+        return (
+            day_of_cycle
+            - day_of_cycle // 1460
+            + day_of_cycle // 36_524
+            - day_of_cycle // 146_096
+        ) // 365
+
+
+class JulianCalendar(_MarchYearCalendar):
+    counts_real_days = True
+    has_year_zero = False
+    cycle_years, cycle_days = 4, 1461
+    # 1970-01-01 (Gregorian) is 1969-12-19 in the Julian calendar.
+    epoch_offset = 719_470
+
+    def _days_before_year(self, year_of_cycle):
+        return year_of_cycle * 365 + year_of_cycle // 4
+
+    def _year_of_cycle(self, day_of_cycle):
+        return (day_of_cycle - day_of_cycle // 1460) // 365
+
+
+class NoLeapCalendar(_MarchYearCalendar):
+    cycle_years, cycle_days = 1, 365
+    epoch_offset = 1969 * 365 + 306
+
+    def _days_before_year(self, year_of_cycle):
+        return 0
+
+    def _year_of_cycle(self, day_of_cycle):
+        return 0
+
+
+class AllLeapCalendar(_MarchYearCalendar):
+    cycle_years, cycle_days = 1, 366
+    epoch_offset = 1969 * 366 + 306
+
+    def _days_before_year(self, year_of_cycle):
+        return 0
+
+    def _year_of_cycle(self, day_of_cycle):
+        return 0
+
+
+class Day360Calendar(CalendarEngine):
+    """Twelve months of 30 days."""
+
+    def days_from_date(self, year, month, day):
+        return (year - 1970) * 360 + (month - 1) * 30 + day - 1
+
+    def date_from_days(self, days):
+        year = days // 360 + 1970
+        day_of_year = days % 360
+        return year, day_of_year // 30 + 1, day_of_year % 30 + 1
+
+
+#: The first day of the Gregorian calendar in the standard (mixed) calendar.
+GREGORIAN_REFORM = (1582, 10, 15)
+
+
+class StandardCalendar(CalendarEngine):
+    """
+    The mixed Julian/Gregorian calendar (as in udunits2 and CF conventions).
+    Dates before 1582-10-15 are in the Julian calendar.
+
+    """
+
+    counts_real_days = True
+
+    def __init__(self):
+        self._gregorian = ProlepticGregorianCalendar()
+        self._julian = JulianCalendar()
+        self._reform_day = self._gregorian.days_from_date(*GREGORIAN_REFORM)
+
+    def days_from_date(self, year, month, day):
+        year_, month_, day_ = GREGORIAN_REFORM
+        is_julian = (year * 100 + month) * 100 + day < (
+            year_ * 100 + month_
+        ) * 100 + day_
+        return _where(
+            is_julian,
+            self._julian.days_from_date(year, month, day),
+            self._gregorian.days_from_date(year, month, day),
+        )
+
+    def date_from_days(self, days):
+        is_julian = days < self._reform_day
+        julian = self._julian.date_from_days(days)
+        gregorian = self._gregorian.date_from_days(days)
+        return tuple(
+            _where(is_julian, julian_field, gregorian_field)
+            for julian_field, gregorian_field in zip(julian, gregorian)
+        )
+
+
+_ENGINES: dict[str, CalendarEngine] = {}
+
+#: The canonical name of each supported calendar, keyed by its (CF) aliases.
+CALENDAR_ALIASES: dict[str, str] = {}
+
+
+def register_calendar(
+    name: str, engine: CalendarEngine, aliases: typing.Iterable[str] = ()
+):
+    """Register the engine of the named calendar (and its aliases)."""
+    _ENGINES[name] = engine
+    for alias in [name, *aliases]:
+        CALENDAR_ALIASES[alias] = name
+
+
+register_calendar("standard", StandardCalendar(), aliases=["gregorian"])
+register_calendar("proleptic_gregorian", ProlepticGregorianCalendar())
+register_calendar("julian", JulianCalendar())
+register_calendar("noleap", NoLeapCalendar(), aliases=["365_day"])
+register_calendar("all_leap", AllLeapCalendar(), aliases=["366_day"])
+register_calendar("360_day", Day360Calendar())
+
+
+def canonical_calendar(calendar: str) -> str:
+    """
+    Return the canonical name of the given calendar, raising a ValueError if
+    it is not supported.
+    """
+    try:
+        return CALENDAR_ALIASES[calendar.lower()]
+    except KeyError:
+        raise ValueError(
+            f"Unsupported calendar {calendar!r}. Supported calendars are: "
+            f"{', '.join(sorted(CALENDAR_ALIASES))}"
+        ) from None
+
+
+def calendar_engine(calendar: str) -> CalendarEngine:
+    """Return the engine of the given calendar."""
+    return _ENGINES[canonical_calendar(calendar)]
+
+
+def seconds_since_epoch(date_time: DateTime, calendar: str) -> Fraction:
+    """
+    The exact number of seconds between 1970-01-01 00:00 UTC and the given
+    date time, in the given calendar.
+    """
+    engine = calendar_engine(calendar)
+    days = engine.days_from_date(date_time.year, date_time.month, date_time.day)
+    seconds = days * SECONDS_PER_DAY + time_seconds(date_time.time)
+    return seconds - tz_offset_seconds(date_time)
+
+
+def time_seconds(time: Time) -> Fraction:
+    # The (signed) number of seconds represented by a clock. A negative clock
+    # (e.g. "-19:04:02") is represented by a negative hour.
+    sign = -1 if time.hour < 0 else 1
+    seconds = Fraction(abs(time.hour) * 3600 + time.minute * 60 + time.second)
+    return sign * (seconds + Fraction(time.microseconds, 1_000_000))
+
+
+def tz_offset_seconds(date_time: DateTime) -> Fraction:
+    # The offset of the local time of the date time from UTC.
+    offset = date_time.tz_offset
+    if isinstance(offset, str):
+        return Fraction(0)
+    return time_seconds(offset)
+
+
+@dataclasses.dataclass(frozen=True)
+class DateFields:
+    """
+    The calendar fields of one or more date times (in UTC). Each field is
+    either an int or an integer NumPy array.
+
+    """
+
+    year: typing.Any
+    month: typing.Any
+    day: typing.Any
+    hour: typing.Any = 0
+    minute: typing.Any = 0
+    second: typing.Any = 0
+    microsecond: typing.Any = 0
+
+
+def fields_from_microseconds(microseconds, calendar: str) -> DateFields:
+    """
+    The calendar fields of the given (integer) number(s) of microseconds
+    since 1970-01-01 00:00 UTC.
+    """
+    days, microseconds = divmod(microseconds, MICROSECONDS_PER_DAY)
+    seconds, microsecond = divmod(microseconds, 1_000_000)
+    hour, seconds = divmod(seconds, 3600)
+    minute, second = divmod(seconds, 60)
+    year, month, day = calendar_engine(calendar).date_from_days(days)
+    return DateFields(year, month, day, hour, minute, second, microsecond)
+
+
+def microseconds_from_fields(fields: DateFields, calendar: str):
+    """
+    The (integer) number(s) of microseconds since 1970-01-01 00:00 UTC of the
+    given calendar fields.
+    """
+    days = calendar_engine(calendar).days_from_date(
+        fields.year, fields.month, fields.day
+    )
+    seconds = (fields.hour * 60 + fields.minute) * 60 + fields.second
+    return days * MICROSECONDS_PER_DAY + seconds * 1_000_000 + fields.microsecond
@@ -1,5 +1,7 @@
 from __future__ import annotations
 import dataclasses
+import functools
+import re
 import typing
 
 
@@ -42,8 +44,149 @@ class DateTime:
             and self.tz_offset == other.tz_offset
         )
 
+    def __str__(self):
+        if self.raw_content is not None:
+            return self.raw_content
+        dt_str = f"{self.year:04}-{self.month:02}-{self.day:02} {self.time}"
+        if isinstance(self.tz_offset, Time):
+            sign = "-" if self.tz_offset.hour < 0 else "+"
+            offset = dataclasses.replace(self.tz_offset, hour=abs(self.tz_offset.hour))
+            dt_str += f" {sign}{offset}"
+        else:
+            dt_str += f" {self.tz_offset}"
+        return dt_str
+
+
+#: The date at the start of a timestamp: either a (dash separated) date, such
+#: as "1990-01-02" or "1990-1", or a packed (optionally signed) integer, such
+#: as "1990", "19900102" or "199001021900" (which also contains a clock).
+_DATE = re.compile(
+    r"(?P<sign>[+-]?)(?:(?P<year>\d+)-(?P<month>\d{1,2})(?:-(?P<day>\d{1,2}))?"
+    r"|(?P<packed>\d+))"
+)
+
+#: The clock following a date, either as "hh:mm[:ss[.fff]]" or packed as
+#: "hh[mm[ss]]". A clock may be signed, e.g. "1990-1-2+5:2:2".
+_CLOCK = re.compile(
+    r"(?P<sign>[+-]?)(?:(?P<hour>\d{1,2}):(?P<minute>\d{1,2})"
+    r"(?::(?P<second>\d{1,2})(?:\.(?P<fraction>\d*))?)?"
+    r"|(?P<packed>\d+))"
+)
+
+#: The offset of the local time from UTC, either as "hh:mm" or packed as
+#: "hh[mm]", e.g. "+6", "-5:30" or "+0530".
+_TZ_OFFSET = re.compile(
+    r"(?P<sign>[+-]?)(?:(?P<hour>\d{1,2}):(?P<minute>\d{1,2})|(?P<packed>\d+))"
+)
+
+#: The named timezones, all of which are UTC. "TZ" is a "T" separator
+#: followed by the "Z" (Zulu) timezone, e.g. "1970-01-10TZ".
+_TIMEZONE = re.compile(r"\s*(?:UTC|GMT|T?Z)$")
+
+
+def _unpack(digits: str, n_fields: int) -> list[int]:
+    # Split packed digits into (at most n_fields) two-digit fields.
+    if len(digits) % 2 or len(digits) > 2 * n_fields:
+        raise ValueError(f"Unable to unpack {digits!r}")
+    return [int(digits[i : i + 2]) for i in range(0, len(digits), 2)]
+
+
+def _clock(match: re.Match) -> Time:
+    fields = match.groupdict()
+    sign = -1 if fields["sign"] == "-" else 1
+    if fields["packed"] is not None:
+        digits = fields["packed"]
+        if len(digits) % 2:
+            # A single digit hour, e.g. "5" or "530".
+            digits = "0" + digits
+        fields = _unpack(digits, 3)
+        hour, minute, second = fields + [0, 0][: 3 - len(fields)]
+        fraction = ""
+    else:
+        hour, minute = int(fields["hour"]), int(fields["minute"])
+        second = int(fields.get("second") or 0)
+        fraction = fields.get("fraction") or ""
+    return Time(
+        hour=sign * hour,
+        minute=minute,
+        second=second,
+        microseconds=int(fraction[:6].ljust(6, "0")),
+    )
 
+
+@functools.lru_cache(maxsize=1024)
 def parse_udunits_date(content: str) -> DateTime:
-    raise NotImplementedError(
-        f"Date time parsing not yet implemented (requested parse of {content!r})"
+    """
+    Parse the reference date of a date unit (the part after the "since"),
+    in any of the timestamp forms of the udunits2 grammar. For example
+    "2000-01-01", "1990-1-1 0:0:1 +2", "19900101T190030 GMT", "20200101"
+    and "2001-12-31 23:59:59.999 UTC".
+
+    The results are cached, as the same reference dates are typically
+    repeated across the many variables of a dataset.
+
+    """
+    try:
+        return _parse_udunits_date(content)
+    except ValueError:
+        raise ValueError(f"Unable to parse the date time {content!r}") from None
+
+
+def _parse_udunits_date(content: str) -> DateTime:
+    text = content.strip()
+    timezone = _TIMEZONE.search(text)
+    if timezone is not None:
+        text = text[: timezone.start()]
+
+    match = _DATE.match(text)
+    if match is None:
+        raise ValueError("No date")
+    sign = -1 if match["sign"] == "-" else 1
+    time: Time | None = None
+    if match["packed"] is not None:
+        digits = match["packed"]
+        if len(digits) <= 4:
+            year, month, day = int(digits), 1, 1
+        else:
+            year = int(digits[:4])
+            fields = _unpack(digits[4:], 5)
+            month, day, hour, minute, second = fields + [1, 1, 0, 0, 0][len(fields) :]
+            if len(fields) > 2:
+                # The clock is packed together with the date.
+                time = Time(hour, minute, second)
+    else:
+        year, month = int(match["year"]), int(match["month"])
+        day = int(match["day"] or 1)
+    if not (1 <= month <= 12 and 1 <= day <= 31):
+        raise ValueError("Invalid date")
+    rest = text[match.end() :]
+
+    if time is None and rest:
+        # The clock is separated from the date by whitespace, a "T", or
+        # nothing at all (e.g. "1990-1-2+5:2" and "2020-0101").
+        separator = re.match(r"\s*T?", rest)
+        match = _CLOCK.match(rest, separator.end())
+        if match is None:
+            raise ValueError("No clock")
+        time = _clock(match)
+        rest = rest[match.end() :]
+
+    tz_offset: Time | str = "UTC"
+    if rest.strip():
+        match = _TZ_OFFSET.fullmatch(rest.strip())
+        if match is None or not (rest[0].isspace() or match["sign"]):
+            raise ValueError("Invalid timezone offset")
+        if match["packed"] is not None:
+            digits = match["packed"]
+            tz_offset = _clock(_CLOCK.fullmatch(match["sign"] + digits))
+        else:
+            tz_offset = _clock(match)
+
+    return DateTime(
+        year=sign * year,
+        month=month,
+        day=day,
+        time=time or Time(0, 0),
+        tz_offset=tz_offset,
+        raw_content=content,
     )
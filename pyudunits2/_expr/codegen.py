@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import dataclasses
+import functools
+import math
+import typing
+from fractions import Fraction
+
+from .program import Affine, Exp, Log, Program, Reciprocal
+
+
+@dataclasses.dataclass(frozen=True)
+class CompiledProgram:
+    """
+    The Python functions generated for a :class:`~pyudunits2._expr.program.Program`.
+
+    ``scalar`` takes and returns a Python number, using the ``math`` module.
+    ``array`` accepts anything array-like (and an optional ``out`` array),
+    and applies each step in turn using NumPy ufuncs, allocating at most one
+    new array.
+
+    """
+
+    scalar: typing.Callable[[typing.Any], typing.Any]
+    array: typing.Callable[..., typing.Any]
+    source: str
+
+
+def _literal(value: Fraction | float) -> str:
+    # repr of a float is the shortest string which round-trips exactly.
+    return repr(float(value))
+
+
+_SCALAR_LOGS = {None: "math.log", 2: "math.log2", 10: "math.log10"}
+_ARRAY_LOGS = {None: "np.log", 2: "np.log2", 10: "np.log10"}
+
+
+# The operator precedence of the generated (scalar) expressions.
+_ADD, _MUL, _POW, _ATOM = range(4)
+
+
+def _scalar_source(program: Program) -> str:
+    expr = "value"
+    precedence = _ATOM
+
+    def operand(minimum_precedence: int) -> str:
+        # Bracket the current expression if it binds less tightly than needed.
+        return expr if precedence >= minimum_precedence else f"({expr})"
+
+    for step in program.steps:
+        if isinstance(step, Affine):
+            if step.scale != 1:
+                expr = f"{operand(_MUL)} * {_literal(step.scale)}"
+                precedence = _MUL
+            if step.offset > 0:
+                expr = f"{operand(_ADD)} + {_literal(step.offset)}"
+                precedence = _ADD
+            elif step.offset < 0:
+                expr = f"{operand(_ADD)} - {_literal(-step.offset)}"
+                precedence = _ADD
+        elif isinstance(step, Exp):
+            if step.base is None:
+                expr, precedence = f"math.exp({expr})", _ATOM
+            else:
+                expr = f"{_literal(step.base)} ** {operand(_ATOM)}"
+                precedence = _POW
+        elif isinstance(step, Log):
+            expr, precedence = f"{_SCALAR_LOGS[step.base]}({expr})", _ATOM
+        elif isinstance(step, Reciprocal):
+            expr, precedence = f"1 / {operand(_POW)}", _MUL
+        else:
+            raise ValueError(f"Unknown step {step!r}")
+    return f"def convert_scalar(value):\n    return {expr}\n"
+
+
+def _array_source(program: Program) -> str:
+    lines = ["def convert_array(value, out=None):"]
+    if program.is_identity():
+        lines += [
+            "    if out is None or out is value:",
+            "        return value",
+            "    np.copyto(out, value)",
+            "    return out",
+        ]
+        return "\n".join(lines) + "\n"
+
+    # Scalars are converted as a one element array, as a ufunc can't write
+    # its result into a (NumPy) scalar.
+    lines += [
+        "    if out is None and np.ndim(value) == 0:",
+        "        return convert_array(np.reshape(value, 1))[0]",
+    ]
+    # The first operation reads from the input. All subsequent operations
+    # work in-place on the output.
+    operand = "value"
+    for step in program.steps:
+        if isinstance(step, Affine):
+            ops = []
+            if step.scale != 1:
+                ops.append(f"np.multiply({{}}, {_literal(step.scale)}, out=out)")
+            if step.offset > 0:
+                ops.append(f"np.add({{}}, {_literal(step.offset)}, out=out)")
+            elif step.offset < 0:
+                ops.append(f"np.subtract({{}}, {_literal(-step.offset)}, out=out)")
+        elif isinstance(step, Exp):
+            if step.base is None:
+                ops = ["np.exp({}, out=out)"]
+            else:
+                ops = [f"np.power({_literal(step.base)}, {{}}, out=out)"]
+        elif isinstance(step, Log):
+            ops = [f"{_ARRAY_LOGS[step.base]}({{}}, out=out)"]
+        elif isinstance(step, Reciprocal):
+            ops = ["np.divide(1.0, {}, out=out)"]
+        else:
+            raise ValueError(f"Unknown step {step!r}")
+        for op in ops:
+            lines.append(f"    out = {op.format(operand)}")
+            operand = "out"
+    lines.append("    return out")
+    return "\n".join(lines) + "\n"
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_program(program: Program) -> CompiledProgram:
+    """
+    Generate, compile and cache the Python functions which apply the given
+    program. Constants are folded into the generated source as float
+    literals.
+
+    """
+    source = _scalar_source(program)
+    namespace: dict[str, typing.Any] = {"math": math}
+
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    else:
+        source += "\n\n" + _array_source(program)
+        namespace["np"] = np
+
+    exec(compile(source, "<pyudunits2 conversion>", "exec"), namespace)
+    scalar = namespace["convert_scalar"]
+    if np is None:
+        # Without NumPy, we can only handle scalars.
+        def array(value, out=None):
+            if out is not None:
+                raise ValueError("The out argument requires NumPy")
+            return scalar(value)
+    else:
+        array = namespace["convert_array"]
+
+    return CompiledProgram(scalar=scalar, array=array, source=source)
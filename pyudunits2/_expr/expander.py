@@ -6,6 +6,7 @@ import typing
 
 from . import graph as unit_graph
 from .graph import Node, Visitor
+from .rational import as_fraction, from_fraction
 
 
 _log = logging.getLogger(__name__)
@@ -82,17 +83,20 @@ class ChainedExpr:
                 isinstance(last_term, unit_graph.Terminal)
                 and isinstance(last_term, unit_graph.Number)
                 and isinstance(node, unit_graph.Number)
-                and type(node.content) is type(last_term.content)
                 and isinstance(raised_to, int)
                 and raised_to > 0
             ):
-                # a · b^n == a*(b^n); Where a and b are numbers of the same
-                #                     type (float / int)
+                # a · b^n == a*(b^n); Where a and b are numbers. The numbers
+                #                     are combined exactly, even when they
+                #                     are of different types (Decimal / int).
 
                 # We can combine the two terms, so pop the last one.
                 assert terms.pop() is last_term
                 new_term = unit_graph.Number(
-                    last_term.content * (node.content**raised_to),
+                    from_fraction(
+                        as_fraction(last_term.content)
+                        * as_fraction(node.content) ** raised_to
+                    ),
                     raw_content=None,
                 )
                 _log.debug(
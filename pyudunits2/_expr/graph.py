@@ -2,6 +2,11 @@ from __future__ import annotations
 
 import dataclasses
 import decimal
+import fractions
+import typing
+
+if typing.TYPE_CHECKING:
+    from .._datetime import DateTime
 
 
 @dataclasses.dataclass(frozen=True)
@@ -54,9 +59,24 @@ class Unhandled(Terminal):
         return str(self.raw_content)
 
 
+@dataclasses.dataclass(frozen=True)
+class Timestamp(Terminal):
+    """The reference date of a date unit (e.g. the "2000-01-01" of "days since 2000-01-01")"""
+
+    raw_content: str
+    date_time: DateTime
+
+    @property
+    def content(self):
+        return self.date_time
+
+    def __str__(self):
+        return str(self.raw_content)
+
+
 @dataclasses.dataclass(frozen=True)
 class Number(Terminal):
-    value: decimal.Decimal | int
+    value: decimal.Decimal | int | fractions.Fraction
     raw_content: str | None
 
     @property
@@ -72,6 +92,9 @@ class Identifier(Terminal):
     """The unit itself (e.g. meters, m, km and π)"""
 
     name: str
+    #: The position of the identifier in the (stripped) unit string, if it
+    #: was parsed. Not part of the identity of the identifier.
+    position: int | None = dataclasses.field(default=None, compare=False, repr=False)
 
     @property
     def content(self):
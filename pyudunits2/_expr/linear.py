@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import dataclasses
+import typing
+from fractions import Fraction
+
+from . import graph as unit_graph
+from .program import BasisProgram, basis_program
+
+
+@dataclasses.dataclass(frozen=True)
+class LinearForm:
+    """
+    The normal form of a linear (i.e. non-logarithmic) unit.
+
+    A value ``v`` in the unit represents a quantity of ``v * scale + offset``
+    in the product of basis units given by ``powers``. For example, ``degC``
+    has a scale of 1, an offset of 273.15 and powers of ``{kelvin: 1}``.
+
+    """
+
+    scale: Fraction
+    offset: Fraction
+    powers: typing.Mapping[unit_graph.Identifier, int]
+
+    @classmethod
+    def from_basis_program(cls, basis: BasisProgram) -> LinearForm | None:
+        coefficients = basis.program.affine_coefficients()
+        if coefficients is None:
+            return None
+        scale, offset = coefficients
+        return cls(scale=scale, offset=offset, powers=basis.powers)
+
+
+def linear_form(expanded_expr: unit_graph.Node) -> LinearForm:
+    """
+    Compute the :class:`LinearForm` of the given (fully expanded) unit
+    definition, using exact arithmetic and without involving sympy.
+
+    A ``ValueError`` is raised if the unit is not linear.
+
+    """
+    form = LinearForm.from_basis_program(basis_program(expanded_expr))
+    if form is None:
+        raise ValueError(f"Unit {expanded_expr} is not linear")
+    return form
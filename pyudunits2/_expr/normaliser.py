@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 import typing
 
+from .._instrumentation import stage
 from . import graph as unit_graph
 from .graph import Node, Visitor
 
@@ -122,6 +123,7 @@ class NormalisedNode:
     A container holding a node that has been normalised.
     """
 
+    @stage("normalise")
     def __init__(self, unit_expr: Node, identifier_references):
         new_unit_expr = NormalisedExpressionGraph(
             unit_expr,
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import dataclasses
+import typing
+from fractions import Fraction
+
+from . import graph as unit_graph
+from .graph import Visitor
+from .rational import ExactMonomial
+from .split import SplitExpr
+
+
+#: The base of each of the logarithm functions in the grammar. A base of None
+#: represents the natural logarithm.
+LOG_BASES: dict[str, int | None] = {
+    "lb": 2,
+    "lg": 10,
+    "ln": None,
+    "log": None,  # Unspecified by udunits2...
+}
+
+
+@dataclasses.dataclass(frozen=True)
+class Affine:
+    """The step ``value * scale + offset``."""
+
+    scale: Fraction
+    offset: Fraction = Fraction(0)
+
+    def inverse(self) -> Affine:
+        if not self.scale:
+            raise ValueError("A zero scale factor cannot be inverted")
+        return Affine(1 / self.scale, -self.offset / self.scale)
+
+    def then(self, other: Affine) -> Affine:
+        return Affine(
+            self.scale * other.scale, self.offset * other.scale + other.offset
+        )
+
+    def is_identity(self) -> bool:
+        return self.scale == 1 and self.offset == 0
+
+
+@dataclasses.dataclass(frozen=True)
+class Exp:
+    """The step ``base ** value`` (``e ** value`` if base is None)."""
+
+    base: int | None
+
+    def inverse(self) -> Log:
+        return Log(self.base)
+
+
+@dataclasses.dataclass(frozen=True)
+class Log:
+    """The step ``log(value, base)`` (the natural logarithm if base is None)."""
+
+    base: int | None
+
+    def inverse(self) -> Exp:
+        return Exp(self.base)
+
+
+@dataclasses.dataclass(frozen=True)
+class Reciprocal:
+    """The step ``1 / value``."""
+
+    def inverse(self) -> Reciprocal:
+        return self
+
+
+Step = Affine | Exp | Log | Reciprocal
+
+
+@dataclasses.dataclass(frozen=True)
+class Program:
+    """
+    A compact, exact (and hashable) description of a value transformation,
+    such as the conversion from one unit to another. The transformation is
+    the application of each of the elementary steps in turn.
+
+    Programs should be constructed with :meth:`from_steps`, which folds
+    the steps into their simplest form.
+
+    """
+
+    steps: tuple[Step, ...] = ()
+
+    @classmethod
+    def from_steps(cls, steps: typing.Iterable[Step]) -> Program:
+        folded: list[Step] = []
+        for step in steps:
+            last = folded[-1] if folded else None
+            if isinstance(step, Affine) and isinstance(last, Affine):
+                folded.pop()
+                step = last.then(step)
+            elif isinstance(step, Log) and isinstance(last, Exp):
+                # log(b^x, b) == x
+                if step.base == last.base:
+                    folded.pop()
+                    continue
+            elif isinstance(step, Reciprocal) and isinstance(last, Reciprocal):
+                folded.pop()
+                continue
+
+            if isinstance(step, Affine) and step.is_identity():
+                continue
+            folded.append(step)
+        return cls(tuple(folded))
+
+    def then(self, other: Program) -> Program:
+        """Return the program which applies this program, followed by other."""
+        return Program.from_steps(self.steps + other.steps)
+
+    def inverse(self) -> Program:
+        return Program.from_steps(step.inverse() for step in reversed(self.steps))
+
+    def is_identity(self) -> bool:
+        return not self.steps
+
+    def affine_coefficients(self) -> tuple[Fraction, Fraction] | None:
+        """
+        Return the exact ``(scale, offset)`` of the program, or None if the
+        program is not affine.
+        """
+        if not self.steps:
+            return Fraction(1), Fraction(0)
+        if len(self.steps) == 1 and isinstance(self.steps[0], Affine):
+            return self.steps[0].scale, self.steps[0].offset
+        return None
+
+
+def _contains_value(node: unit_graph.Node) -> bool:
+    if isinstance(node, unit_graph.Identifier):
+        return node.name == "value"
+    return any(_contains_value(child) for child in node.children())
+
+
+def _constant(node: unit_graph.Node) -> Fraction:
+    monomial = ExactMonomial().visit(node)
+    if monomial.powers:
+        raise ValueError(f"Non-numeric coefficient {node} in transformation")
+    return monomial.scale
+
+
+class TransformSteps(Visitor):
+    """
+    Turn a value transformation, as produced by
+    :class:`~pyudunits2._expr.split.SplitExpr`, into the steps which map a
+    value in the units of the definition to a value in the unit.
+
+    For example, ``5·(lg(re value))`` becomes ``[Log(10), Affine(5)]``.
+
+    A ``ValueError`` is raised if the transformation has non-numeric
+    coefficients.
+
+    """
+
+    if typing.TYPE_CHECKING:
+
+        def visit(self, node: unit_graph.Node) -> list[Step]: ...
+
+    def generic_visit(self, node: unit_graph.Node):
+        raise ValueError(f"Unable to represent {node} as a transformation step")
+
+    def visit_Identifier(self, node: unit_graph.Identifier):
+        if node.name != "value":
+            raise ValueError(f"Non-numeric coefficient {node} in transformation")
+        return []
+
+    def visit_Multiply(self, node: unit_graph.Multiply):
+        if _contains_value(node.lhs):
+            if _contains_value(node.rhs):
+                raise ValueError(f"Transformation {node} is not invertible")
+            inner, coefficient = node.lhs, node.rhs
+        else:
+            inner, coefficient = node.rhs, node.lhs
+        return self.visit(inner) + [Affine(_constant(coefficient))]
+
+    def visit_Divide(self, node: unit_graph.Divide):
+        if _contains_value(node.rhs):
+            raise ValueError(f"Transformation {node} is not invertible")
+        divisor = _constant(node.rhs)
+        if not divisor:
+            raise ValueError(f"Division by zero in transformation {node}")
+        return self.visit(node.lhs) + [Affine(1 / divisor)]
+
+    def visit_Shift(self, node: unit_graph.Shift):
+        return self.visit(node.unit) + [
+            Affine(Fraction(1), -_constant(node.shift_from))
+        ]
+
+    def visit_Logarithm(self, node: unit_graph.Logarithm):
+        return self.visit(node.term) + [Log(LOG_BASES[node.function])]
+
+
+@dataclasses.dataclass(frozen=True)
+class BasisProgram:
+    """
+    The program which takes a value in a unit to a value in the product of
+    basis units given by ``powers``.
+    """
+
+    program: Program
+    powers: typing.Mapping[unit_graph.Identifier, int]
+
+
+def basis_program(expanded_expr: unit_graph.Node) -> BasisProgram:
+    """
+    Compute the :class:`BasisProgram` of the given (fully expanded) unit
+    definition, using exact arithmetic and without involving sympy.
+
+    A ``ValueError`` is raised if the unit cannot be represented in this way.
+
+    """
+    transform, definition = SplitExpr(expanded_expr).visit(expanded_expr)
+    steps = [] if transform is None else TransformSteps().visit(transform)
+
+    monomial = ExactMonomial().visit(definition)
+    if not monomial.scale:
+        raise ValueError(f"Unit {expanded_expr} has a zero scale factor")
+
+    # The transformation maps X (the value in the units of the definition)
+    # to the value in the unit, so we need its inverse, followed by the
+    # scaling of the definition to the basis units.
+    program = Program.from_steps(steps).inverse()
+    program = program.then(Program.from_steps([Affine(monomial.scale)]))
+    return BasisProgram(program, monomial.powers)
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import dataclasses
+import typing
+from decimal import Decimal
+from fractions import Fraction
+
+from . import graph as unit_graph
+from .graph import Visitor
+
+
+def as_fraction(value: int | Decimal | Fraction | str) -> Fraction:
+    """
+    Return the exact rational value of a number found in an expression graph.
+
+    Number nodes hold ints, Decimals (which preserve the precision of the
+    unit string), or strings (e.g. from unicode exponents).
+
+    """
+    if isinstance(value, (int, Fraction)):
+        return Fraction(value)
+    elif isinstance(value, Decimal):
+        # Fraction is able to exactly represent any finite Decimal.
+        return Fraction(value)
+    elif isinstance(value, str):
+        return Fraction(Decimal(value))
+    raise TypeError(f"Unable to represent {value!r} as an exact number")
+
+
+def from_fraction(value: Fraction) -> int | Decimal | Fraction:
+    """
+    Return the most natural number type for the given exact value, such that
+    it can be held by a :class:`~pyudunits2._expr.graph.Number`.
+
+    Integral values are returned as int, terminating decimals as Decimal, and
+    all other values remain as a Fraction.
+
+    """
+    if value.denominator == 1:
+        return value.numerator
+
+    # A fraction is a terminating decimal iff the denominator's only prime
+    # factors are 2 and 5.
+    denominator = value.denominator
+    twos = fives = 0
+    while denominator % 2 == 0:
+        denominator //= 2
+        twos += 1
+    while denominator % 5 == 0:
+        denominator //= 5
+        fives += 1
+    if denominator != 1:
+        return value
+
+    n_digits = max(twos, fives)
+    digits = abs(value.numerator) * 10**n_digits // value.denominator
+    # Built from its digits, as arithmetic on a Decimal would round it to the
+    # precision of the decimal context.
+    sign = int(value < 0)
+    return Decimal((sign, tuple(map(int, str(digits))), -n_digits))
+
+
+@dataclasses.dataclass(frozen=True)
+class Monomial:
+    """
+    An exact scale factor multiplied by a product of identifiers raised to
+    integer powers. For example, ``1000·m·s^-1``.
+    """
+
+    scale: Fraction
+    powers: typing.Mapping[unit_graph.Identifier, int]
+
+
+class ExactMonomial(Visitor):
+    """
+    Fold a product of numbers and identifiers into a single :class:`Monomial`,
+    using exact rational arithmetic throughout.
+
+    Only multiplication, division and integer powers are supported.
+    A ``ValueError`` is raised for any other construct (e.g. logarithms and
+    shifts), since these cannot be represented as a monomial.
+
+    """
+
+    if typing.TYPE_CHECKING:
+
+        def visit(self, node: unit_graph.Node) -> Monomial: ...
+
+    def generic_visit(self, node: unit_graph.Node):
+        raise ValueError(f"Unable to represent {type(node).__name__} as a monomial")
+
+    def visit_Number(self, node: unit_graph.Number):
+        return Monomial(as_fraction(node.content), {})
+
+    def visit_Identifier(self, node: unit_graph.Identifier):
+        return Monomial(Fraction(1), {node: 1})
+
+    def visit_Multiply(self, node: unit_graph.Multiply):
+        return self._combine(self.visit(node.lhs), self.visit(node.rhs), 1)
+
+    def visit_Divide(self, node: unit_graph.Divide):
+        return self._combine(self.visit(node.lhs), self.visit(node.rhs), -1)
+
+    def visit_Raise(self, node: unit_graph.Raise):
+        if not isinstance(node.rhs, unit_graph.Number):
+            raise ValueError(f"Non-numeric exponent in {node}")
+        exponent = as_fraction(node.rhs.content)
+        if exponent.denominator != 1:
+            raise ValueError(f"Non-integer exponent in {node}")
+        power = exponent.numerator
+        base = self.visit(node.lhs)
+        return Monomial(
+            base.scale**power,
+            {identifier: order * power for identifier, order in base.powers.items()},
+        )
+
+    @staticmethod
+    def _combine(lhs: Monomial, rhs: Monomial, sign: int) -> Monomial:
+        powers = dict(lhs.powers)
+        for identifier, order in rhs.powers.items():
+            powers[identifier] = powers.get(identifier, 0) + sign * order
+        return Monomial(
+            lhs.scale * rhs.scale**sign,
+            {identifier: order for identifier, order in powers.items() if order},
+        )
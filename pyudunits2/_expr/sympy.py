@@ -1,17 +1,18 @@
 from __future__ import annotations
 
 from decimal import Decimal
+from fractions import Fraction
 
 from sympy import Symbol
 
 
-from sympy.parsing.sympy_parser import parse_expr as sympy_parse
 import sympy
 
 import logging
 import typing
 
 from . import graph as unit_graph
+from .rational import as_fraction
 import sympy.core.expr
 
 _log = logging.getLogger(__name__)
@@ -29,12 +30,21 @@ class ToSympy(unit_graph.Visitor):
         return Symbol(node.content)
 
     def visit_Number(self, node: unit_graph.Number):
+        # Construct the sympy numbers directly, rather than going through the
+        # (comparatively slow) sympy parser. The resulting types are the same
+        # as those produced by the parser (Integer for ints, Float otherwise).
         if isinstance(node.content, str):
-            return sympy_parse(node.content)
+            # For example, unicode exponents. Exact, as for Fractions.
+            value = as_fraction(node.content)
+            return sympy.Rational(value.numerator, value.denominator)
         elif isinstance(node.content, Decimal):
-            return sympy_parse(str(node.content))
-        elif isinstance(node.content, (int, float)):
-            return sympy_parse(str(node.content))
+            return sympy.Float(str(node.content))
+        elif isinstance(node.content, Fraction):
+            return sympy.Rational(node.content.numerator, node.content.denominator)
+        elif isinstance(node.content, int):
+            return sympy.Integer(node.content)
+        elif isinstance(node.content, float):
+            return sympy.Float(node.content)
         else:
             raise ValueError(f"Unknown number type {type(node.content)}")
 
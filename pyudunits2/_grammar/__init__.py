@@ -1,6 +1,8 @@
 import unicodedata
 from decimal import Decimal
 
+from .._datetime import parse_udunits_date
+from .._instrumentation import stage
 from .._expr import graph as graph
 from ._antlr4_runtime import (
     CommonTokenStream,
@@ -99,6 +101,8 @@ class UnitParseVisitor(udunits2ParserVisitor):
                 result = handler(content)
             else:
                 result = handler
+            if isinstance(result, graph.Identifier):
+                result = graph.Identifier(result.name, position=ctx.symbol.start)
 
         if result is not None and not isinstance(result, (graph.Node, str)):
             raise ValueError(f"Unhandled token {result} (type {type(result)})")
@@ -123,10 +127,14 @@ class UnitParseVisitor(udunits2ParserVisitor):
         return node
 
     def visitTimestamp(self, ctx):
-        # For now, we simply amalgamate timestamps into a single Terminal.
-        # More work is needed to turn this into a good date/time/timezone
-        # representation.
-        return graph.Unhandled(raw_content=ctx.getText())
+        raw_content = ctx.getText()
+        try:
+            date_time = parse_udunits_date(raw_content)
+        except ValueError:
+            # The grammar accepts some timestamps which are not valid dates
+            # (e.g. "199022T1"). Keep these as they were written.
+            return graph.Unhandled(raw_content=raw_content)
+        return graph.Timestamp(raw_content=raw_content, date_time=date_time)
 
     def visitPower(self, ctx):
         node = self.visitChildren(ctx)
@@ -212,6 +220,7 @@ def normalize(unit_string):
     return str(parse(unit_string))
 
 
+@stage("parse")
 def parse(unit_str: str) -> graph.Node:
     # The udunits2 definition (C code) says to strip the unit string
     # first.
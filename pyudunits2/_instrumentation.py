@@ -0,0 +1,137 @@
+"""
+Opt-in instrumentation of the stages of creating units and converters, for
+finding out where the time goes in (for example) :meth:`UnitSystem.unit`
+without an external profiler.
+
+Use :func:`instrument` to record the number of calls and the cumulative time
+of each stage::
+
+    with instrument() as stats:
+        unit_system.unit("kg m/s^2")
+    print(stats.report())
+
+When no instrumentation is active, the stages cost one extra (pure Python)
+function call each.
+
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import functools
+import time
+import typing
+
+#: The instrumented stages, and what they represent.
+STAGES = {
+    "parse": "Lexing and parsing of unit strings (_grammar.parse)",
+    "resolve_identifier": (
+        "Resolution of identifiers, such as 'km', in the unit system "
+        "(UnitSystem.unit_by_name_or_symbol)"
+    ),
+    "resolve_definition": (
+        "Resolution of the lazily parsed definitions of the units of the "
+        "unit system (LazilyDefinedUnit.resolve)"
+    ),
+    "normalise": "Normalisation of unit expressions (NormalisedNode)",
+    "symbolic": "Derivation of the symbolic (sympy) forms of units and conversions",
+    "converter": "Construction of converters (Converter)",
+}
+
+F = typing.TypeVar("F", bound=typing.Callable[..., typing.Any])
+
+
+@dataclasses.dataclass
+class StageStats:
+    #: The number of calls of the stage.
+    count: int = 0
+    #: The cumulative (wall clock) time of the stage, in seconds. Time spent
+    #: in other stages called by the stage is included, but time spent in
+    #: nested calls of the same stage is only counted once.
+    total_time: float = 0.0
+
+
+class Instrumentation:
+    """The statistics of each stage, recorded by :func:`instrument`."""
+
+    def __init__(self):
+        self.stages: dict[str, StageStats] = {stage: StageStats() for stage in STAGES}
+        self._depths: dict[str, int] = dict.fromkeys(STAGES, 0)
+
+    def __getitem__(self, stage: str) -> StageStats:
+        return self.stages[stage]
+
+    def __repr__(self):
+        return f"<Instrumentation of {len(self.stages)} stages>"
+
+    def _enter(self, stage: str) -> None:
+        self.stages[stage].count += 1
+        self._depths[stage] += 1
+
+    def _exit(self, stage: str, elapsed: float) -> None:
+        self._depths[stage] -= 1
+        if not self._depths[stage]:
+            self.stages[stage].total_time += elapsed
+
+    def report(self) -> str:
+        """A table of the count and cumulative time of each stage."""
+        lines = [f"{'stage':<20} {'count':>10} {'total (s)':>12}"]
+        for stage, stats in self.stages.items():
+            lines.append(f"{stage:<20} {stats.count:>10} {stats.total_time:>12.6f}")
+        return "\n".join(lines)
+
+
+# The active instrumentations, innermost last. Instrumentation is process
+# wide: calls from all threads are recorded.
+_active: tuple[Instrumentation, ...] = ()
+
+
+@contextlib.contextmanager
+def instrument() -> typing.Iterator[Instrumentation]:
+    """
+    Record the number of calls, and the cumulative time, of each stage of
+    unit parsing, resolution, normalisation and conversion (see
+    :data:`STAGES`) within the context.
+
+    Instrumentation contexts may be nested, in which case the calls are
+    recorded by all of the active contexts.
+
+    """
+    global _active
+    instrumentation = Instrumentation()
+    _active = (*_active, instrumentation)
+    try:
+        yield instrumentation
+    finally:
+        _active = tuple(active for active in _active if active is not instrumentation)
+
+
+def stage(name: str) -> typing.Callable[[F], F]:
+    """Decorate a function as (an implementation of) the named stage."""
+    if name not in STAGES:
+        raise ValueError(f"Unknown stage {name!r}")
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _active:
+                return func(*args, **kwargs)
+            return _record(name, func, args, kwargs)
+
+        return typing.cast(F, wrapper)
+
+    return decorator
+
+
+def _record(name: str, func, args, kwargs):
+    instrumentations = _active
+    for instrumentation in instrumentations:
+        instrumentation._enter(name)
+    start = time.perf_counter()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        elapsed = time.perf_counter() - start
+        for instrumentation in instrumentations:
+            instrumentation._exit(name, elapsed)
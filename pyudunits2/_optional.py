@@ -0,0 +1,27 @@
+"""
+The import of optional dependencies, which are only needed for some of the
+functionality of pyudunits2.
+
+"""
+
+from __future__ import annotations
+
+import types
+
+
+def import_numpy() -> types.ModuleType:
+    """
+    Import NumPy, which is needed for conversions of arrays (and other array
+    functionality), raising an ImportError which names the extra to install
+    if it is not available.
+
+    """
+    try:
+        import numpy
+    except ImportError as err:
+        raise ImportError(
+            "Unable to import NumPy, which is needed for this pyudunits2 "
+            "functionality. Be sure to install the pyudunits2 numpy extra. "
+            "For example, with 'pip install pyudunits2[numpy]'"
+        ) from err
+    return numpy
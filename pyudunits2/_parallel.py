@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+import concurrent.futures
+import typing
+
+from ._optional import import_numpy
+
+if typing.TYPE_CHECKING:
+    from ._expr.program import Program
+
+
+#: The maximum number of elements converted by each task. Small enough that
+#: the intermediate results of a multi-step conversion stay in cache, large
+#: enough that the per-task overhead is negligible.
+BLOCK_SIZE = 2**18
+
+
+def _blocks(size: int, n_blocks: int, max_block_size: int | None = None) -> list[slice]:
+    block_size = -(-size // n_blocks)
+    if max_block_size is not None:
+        block_size = min(max_block_size, block_size)
+    return [
+        slice(start, min(start + block_size, size))
+        for start in range(0, size, block_size)
+    ]
+
+
+def convert_in_threads(
+    convert_array: typing.Callable[..., typing.Any],
+    values: typing.Any,
+    out: typing.Any = None,
+    *,
+    threads: int,
+):
+    """
+    Apply ``convert_array`` (a function with the signature of the generated
+    array conversion functions) to contiguous blocks of ``values`` using a
+    pool of threads, writing each block into the corresponding slice of
+    ``out``. NumPy releases the GIL in its ufunc loops, so the blocks are
+    converted concurrently.
+
+    Inputs which are not contiguous NumPy arrays (or which are too small to
+    be worth splitting) are converted in the calling thread.
+
+    """
+    np = import_numpy()
+
+    if (
+        not isinstance(values, np.ndarray)
+        or values.size < 2 * BLOCK_SIZE
+        or not values.flags.c_contiguous
+        or (out is not None and not out.flags.c_contiguous)
+    ):
+        return convert_array(values, out=out)
+
+    flat_values = values.reshape(-1)
+    if out is None:
+        # Let NumPy determine the result type, based on an empty block.
+        dtype = np.asarray(convert_array(np.empty(0, values.dtype))).dtype
+        out = np.empty(values.shape, dtype=dtype)
+    elif out.shape != values.shape:
+        raise ValueError(
+            f"The out array has shape {out.shape}, but the values "
+            f"have shape {values.shape}"
+        )
+    flat_out = out.reshape(-1)
+
+    def convert_block(block: slice):
+        convert_array(flat_values[block], out=flat_out[block])
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
+        # Consume the results so that any exception is raised here.
+        blocks = _blocks(values.size, threads, BLOCK_SIZE)
+        for _ in executor.map(convert_block, blocks):
+            pass
+    return out
+
+
+class SharedArrays:
+    """
+    An allocator of NumPy arrays in :mod:`multiprocessing.shared_memory`,
+    which :meth:`Converter.convert` (with
+    ``processes``) converts in place: neither the values nor the result are
+    copied into (or out of) shared memory.
+
+    The shared memory is released when the allocator is closed (or on exit
+    from its context), after which its arrays must no longer be used. For
+    example::
+
+        with SharedArrays() as shared:
+            values = shared.empty(100_000_000)
+            values[...] = load_values()
+            out = shared.empty(values.shape)
+            converter.convert(values, out=out, processes=8)
+            save_values(out)
+
+    """
+
+    def __init__(self):
+        self._memories: list[typing.Any] = []
+
+    def empty(self, shape, dtype=float):
+        """A new (uninitialised, C-contiguous) array in shared memory."""
+        from multiprocessing import shared_memory
+
+        np = import_numpy()
+
+        dtype = np.dtype(dtype)
+        size = int(np.prod(shape, dtype=np.int64)) * dtype.itemsize
+        # Shared memory can't be empty.
+        memory = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        self._memories.append(memory)
+        _SHARED_MEMORIES[memory.name] = (_address(memory.buf), memory.size)
+        return np.ndarray(shape, dtype=dtype, buffer=memory.buf)
+
+    def close(self) -> None:
+        """Release the shared memory of the arrays."""
+        while self._memories:
+            memory = self._memories.pop()
+            del _SHARED_MEMORIES[memory.name]
+            memory.unlink()
+            try:
+                memory.close()
+            except BufferError:
+                # Some of the arrays are still referenced. The memory is
+                # freed when they (and the SharedMemory object) are.
+                pass
+
+    def __enter__(self) -> SharedArrays:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+# The address and size of the memory of each live SharedArrays allocation,
+# by the name of its shared memory block.
+_SHARED_MEMORIES: dict[str, tuple[int, int]] = {}
+
+
+def _address(buffer) -> int:
+    np = import_numpy()
+
+    return np.frombuffer(buffer, dtype=np.uint8).ctypes.data
+
+
+def _shared_location(array) -> tuple[str, int] | None:
+    # The name of the shared memory block (allocated by SharedArrays) which
+    # holds the given C-contiguous array, and the offset of the array in it.
+    if not array.flags.c_contiguous:
+        return None
+    start = array.ctypes.data
+    for name, (address, size) in _SHARED_MEMORIES.items():
+        if address <= start and start + array.nbytes <= address + size:
+            return name, start - address
+    return None
+
+
+def _convert_shared_block(
+    program: Program,
+    values_location: tuple[str, int],
+    values_dtype: str,
+    out_location: tuple[str, int],
+    out_dtype: str,
+    size: int,
+    chunk: slice,
+    block_size: int,
+):
+    # Runs in a worker process: attach to the shared memory blocks by name,
+    # and convert one chunk of the values into the output, block by block.
+    from multiprocessing import shared_memory
+
+    np = import_numpy()
+
+    from ._expr.codegen import compile_program
+
+    convert_array = compile_program(program).array
+    (values_name, values_offset), (out_name, out_offset) = (
+        values_location,
+        out_location,
+    )
+    values_memory = shared_memory.SharedMemory(name=values_name)
+    out_memory = shared_memory.SharedMemory(name=out_name)
+    try:
+        values = np.ndarray(
+            size, dtype=values_dtype, buffer=values_memory.buf, offset=values_offset
+        )
+        out = np.ndarray(
+            size, dtype=out_dtype, buffer=out_memory.buf, offset=out_offset
+        )
+        for start in range(chunk.start, chunk.stop, block_size):
+            block = slice(start, min(start + block_size, chunk.stop))
+            convert_array(values[block], out=out[block])
+        # Drop the views before closing, as the buffers are still exported.
+        del values, out
+    finally:
+        values_memory.close()
+        out_memory.close()
+
+
+def convert_in_processes(
+    program: Program,
+    values: typing.Any,
+    out: typing.Any = None,
+    *,
+    processes: int,
+):
+    """
+    Apply the given conversion program to blocks of ``values`` using a pool
+    of worker processes.
+
+    The values and the result are held in :mod:`multiprocessing.shared_memory`
+    blocks, which the workers attach to by name. Only the (compact and
+    picklable) program and the bounds of each block are sent to the workers,
+    which generate their own conversion functions from the program. Values
+    (and an ``out`` array) allocated by :class:`SharedArrays` are used in
+    place. Otherwise, they are copied into (and the result copied out of)
+    temporary shared memory.
+
+    Inputs which are not NumPy arrays (or which are too small to be worth
+    splitting) are converted in the calling process.
+
+    """
+
+    np = import_numpy()
+
+    from ._expr.codegen import compile_program
+
+    convert_array = compile_program(program).array
+    if not isinstance(values, np.ndarray) or values.size < 2 * BLOCK_SIZE:
+        return convert_array(values, out=out)
+
+    dtype = np.asarray(convert_array(np.empty(0, values.dtype))).dtype
+    if out is None:
+        out = np.empty(values.shape, dtype=dtype)
+    elif out.shape != values.shape:
+        raise ValueError(
+            f"The out array has shape {out.shape}, but the values "
+            f"have shape {values.shape}"
+        )
+    else:
+        dtype = out.dtype
+
+    with SharedArrays() as temporary:
+        values_location = _shared_location(values)
+        if values_location is None:
+            shared_values = temporary.empty(values.shape, dtype=values.dtype)
+            shared_values[...] = values
+            values_location = _shared_location(shared_values)
+        out_location = _shared_location(out)
+        copy_out = out_location is None
+        if copy_out:
+            shared_out = temporary.empty(values.shape, dtype=dtype)
+            out_location = _shared_location(shared_out)
+
+        with concurrent.futures.ProcessPoolExecutor(max_workers=processes) as pool:
+            futures = [
+                pool.submit(
+                    _convert_shared_block,
+                    program,
+                    values_location,
+                    values.dtype.str,
+                    out_location,
+                    dtype.str,
+                    values.size,
+                    chunk,
+                    BLOCK_SIZE,
+                )
+                # A few chunks per process balances the load, without
+                # sending many small tasks.
+                for chunk in _blocks(values.size, 4 * processes)
+            ]
+            for future in futures:
+                # Raise any exception from the workers.
+                future.result()
+
+        if copy_out:
+            out[...] = shared_out
+        # Drop the views before the temporary shared memory is closed.
+        shared_values = shared_out = None
+    return out
@@ -0,0 +1,42 @@
+"""
+Compact pickling of units, such that they can be cheaply sent to other
+processes (e.g. ``multiprocessing`` or ``concurrent.futures`` workers).
+
+A unit which came from a well-known unit system is pickled as the identifier
+of that system and the unit string, and is re-created from a per-process
+instance of the unit system when unpickled.
+
+"""
+
+from __future__ import annotations
+
+import functools
+import typing
+
+if typing.TYPE_CHECKING:
+    from ._unit import DateUnit, Unit
+    from ._unit_system import UnitSystem
+
+
+#: The identifier of the unit system defined by the udunits2 XML database.
+UDUNITS2_XML = "udunits2-xml"
+
+
+@functools.cache
+def unit_system(system_id: str) -> UnitSystem:
+    """Return this process' instance of the identified unit system."""
+    from ._unit_system import UnitSystem
+
+    if system_id == UDUNITS2_XML:
+        return UnitSystem.from_udunits2_xml()
+    raise ValueError(f"Unknown unit system {system_id!r}")
+
+
+@functools.lru_cache(maxsize=1024)
+def restore_unit(
+    system_id: str, unit_string: str, calendar: str | None = None
+) -> Unit | DateUnit:
+    unit = unit_system(system_id).unit(unit_string)
+    if calendar is not None:
+        unit = unit.with_calendar(calendar)
+    return unit
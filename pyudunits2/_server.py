@@ -0,0 +1,206 @@
+"""
+A long-lived server for the CLI, which keeps a warm unit system (and caches
+of results) in memory, such that repeated CLI invocations do not have to
+load the unit database and import sympy each time.
+
+The server listens on a Unix domain socket, with a JSON lines protocol. Each
+request is a JSON object of the form::
+
+    {"command": "explain-unit", "args": {"unit": "m/s"}}
+
+And each response is either ``{"output": "...", "exit_code": 0}``,
+``{"command_error": "..."}`` if the command rejected its input (see
+:class:`CommandError`), or ``{"error": "..."}`` if the command could not be
+run.
+
+"""
+
+from __future__ import annotations
+
+import getpass
+import json
+import os
+import socket
+import socketserver
+import stat
+import tempfile
+import typing
+
+#: The environment variable of the path of the socket of the server.
+SOCKET_ENV = "PYUDUNITS2_SOCKET"
+
+#: The environment variable which, if set (to anything but an empty
+#: string), stops the CLI from using a running server.
+NO_SERVER_ENV = "PYUDUNITS2_NO_SERVER"
+
+#: The maximum time (in seconds) to wait for a response from the server.
+TIMEOUT = 30
+
+#: The maximum time (in seconds) that the server waits for a client to send
+#: (each part of) a request. The server handles one connection at a time, so
+#: an idle client must not be able to block it.
+CONNECTION_TIMEOUT = 5
+
+Command = typing.Callable[..., tuple[str, int]]
+
+
+class CommandError(Exception):
+    """
+    An error in the input of a command (such as an unresolvable unit), which
+    is reported to the user, rather than the command being run again without
+    the server.
+    """
+
+
+def socket_path() -> str:
+    """The path of the socket of the server of the current user."""
+    path = os.environ.get(SOCKET_ENV)
+    if path:
+        return path
+    runtime_directory = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_directory:
+        # The runtime directory is private to the user.
+        return os.path.join(runtime_directory, f"pyudunits2-{getpass.getuser()}.sock")
+    # The (shared, world-writable) temporary directory is not, so the socket
+    # goes in a private directory within it (see create_server).
+    return os.path.join(_fallback_directory(), "pyudunits2.sock")
+
+
+def _fallback_directory() -> str:
+    return os.path.join(tempfile.gettempdir(), f"pyudunits2-{getpass.getuser()}")
+
+
+def _make_private_directory(directory: str) -> None:
+    # Create the directory, accessible only by the current user, or check
+    # that an existing one is.
+    try:
+        os.mkdir(directory, mode=0o700)
+    except FileExistsError:
+        pass
+    status = os.lstat(directory)
+    if (
+        not stat.S_ISDIR(status.st_mode)
+        or status.st_uid != os.getuid()
+        or status.st_mode & 0o077
+    ):
+        raise RuntimeError(
+            f"{directory} is not a directory which is private to the current user"
+        )
+
+
+def _is_own_socket(path: str) -> bool:
+    # Whether the path is a socket of the current user (rather than, for
+    # example, a socket which another user has put in a shared directory).
+    try:
+        status = os.stat(path)
+    except OSError:
+        return False
+    return stat.S_ISSOCK(status.st_mode) and status.st_uid == os.getuid()
+
+
+def request(
+    command: str, args: dict[str, typing.Any], path: str | None = None
+) -> tuple[str, int] | None:
+    """
+    Run the command on the running server, returning its output and exit
+    code. None is returned if there is no (usable) server, or if the server
+    failed to run the command, in which case the caller should run the
+    command itself. A CommandError is raised if the command rejected its
+    input.
+
+    """
+    if os.environ.get(NO_SERVER_ENV) or not hasattr(socket, "AF_UNIX"):
+        return None
+    path = path or socket_path()
+    if not _is_own_socket(path):
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.settimeout(TIMEOUT)
+            connection.connect(path)
+            message = json.dumps({"command": command, "args": args}) + "\n"
+            connection.sendall(message.encode("utf-8"))
+            with connection.makefile("r", encoding="utf-8") as responses:
+                response = json.loads(responses.readline())
+    except (OSError, ValueError):
+        # For example, a stale socket of a server which is no longer running.
+        return None
+    if "command_error" in response:
+        raise CommandError(response["command_error"])
+    if "error" in response:
+        return None
+    return response["output"], response["exit_code"]
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: _Server
+    timeout = CONNECTION_TIMEOUT
+
+    def handle(self):
+        try:
+            self._handle_requests()
+        except TimeoutError:
+            # The client is idle: drop it, such that others can be served.
+            pass
+
+    def _handle_requests(self):
+        for line in self.rfile:
+            try:
+                message = json.loads(line)
+                command = self.server.commands[message["command"]]
+                output, exit_code = command(**message.get("args", {}))
+                response: dict[str, typing.Any] = {
+                    "output": output,
+                    "exit_code": exit_code,
+                }
+            except CommandError as err:
+                response = {"command_error": str(err)}
+            except Exception as err:
+                response = {"error": f"{type(err).__name__}: {err}"}
+            self.wfile.write((json.dumps(response) + "\n").encode("utf-8"))
+            self.wfile.flush()
+
+
+class _Server(socketserver.UnixStreamServer):
+    # Requests are handled one at a time, as the (lazily computed) caches of
+    # the unit system are not thread-safe.
+    def __init__(self, path: str, commands: typing.Mapping[str, Command]):
+        self.commands = commands
+        super().__init__(path, _RequestHandler)
+
+
+def create_server(path: str, commands: typing.Mapping[str, Command]) -> _Server:
+    """
+    Create (but do not start) a server of the given commands, listening on
+    the given path. A stale socket (of a server which is no longer running)
+    is replaced, but a RuntimeError is raised if a server is already running,
+    or if the path is anything other than a socket of the current user.
+
+    The default path in the temporary directory (see :func:`socket_path`) is
+    in a directory which is created to be private to the current user.
+
+    """
+    if os.path.dirname(path) == _fallback_directory():
+        _make_private_directory(os.path.dirname(path))
+    if os.path.lexists(path):
+        if not _is_own_socket(path) or os.path.islink(path):
+            raise RuntimeError(
+                f"{path} exists, and is not a socket of the current user"
+            )
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            try:
+                connection.connect(path)
+            except OSError:
+                os.unlink(path)
+            else:
+                raise RuntimeError(f"A server is already running on {path}")
+    return _Server(path, commands)
+
+
+def serve(server: _Server) -> None:
+    """Run the server until interrupted, removing its socket afterwards."""
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        os.unlink(server.server_address)
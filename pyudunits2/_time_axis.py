@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import typing
+from fractions import Fraction
+
+from ._optional import import_numpy
+from ._unit import Converter, DateUnit
+
+#: The tolerance, relative to the step, within which floating point offsets
+#: are taken to be a (rounded) arithmetic progression.
+REGULARITY_TOLERANCE = 1e-6
+
+
+class TimeAxis:
+    """
+    A time coordinate: a sequence of offsets in a :class:`DateUnit`.
+
+    Time coordinates are almost always regularly spaced, in which case they
+    are held as an arithmetic progression of ``count`` offsets, from
+    ``start`` in increments of ``step``. Such axes are rebased to another
+    date unit (e.g. when concatenating files with different reference dates)
+    in constant time, and the offsets are only materialised on demand (see
+    :attr:`values`).
+
+    Use :meth:`DateUnit.time_axis` to create a time axis from offsets.
+
+    """
+
+    def __init__(
+        self,
+        unit: DateUnit,
+        start: int | float | None,
+        step: int | float | None,
+        count: int,
+    ):
+        self._unit = unit
+        self._start = start
+        self._step = step
+        self._count = count
+        self._values: typing.Any = None
+
+    @classmethod
+    def from_values(cls, unit: DateUnit, values) -> TimeAxis:
+        """
+        Return the time axis of the given (1-dimensional) offsets, which is
+        regular if the offsets are an arithmetic progression: exactly for
+        integer offsets, and within :data:`REGULARITY_TOLERANCE` of the step
+        for floating point offsets (which are rarely exact, e.g.
+        ``[0.1, 0.2, 0.3]``).
+
+        """
+        np = import_numpy()
+
+        values = np.asarray(values)
+        if values.ndim != 1:
+            raise ValueError(
+                f"A time axis must be 1-dimensional, got shape {values.shape}"
+            )
+        if values.dtype.kind not in "iuf":
+            raise ValueError(f"A time axis must be numeric, got {values.dtype}")
+
+        if values.size >= 2:
+            start = values[0].item()
+            if values.dtype.kind == "f":
+                # The mean step, which is more accurate than any one increment.
+                step = (values[-1] - values[0]).item() / (values.size - 1)
+            else:
+                step = (values[1] - values[0]).item()
+            tolerance = _tolerance(step)
+            progression = start + step * np.arange(values.size)
+            if step and np.allclose(values, progression, rtol=0, atol=tolerance):
+                axis = cls(unit, start, step, values.size)
+                axis._values = values
+                return axis
+
+        axis = cls(unit, None, None, values.size)
+        axis._values = values
+        return axis
+
+    def __repr__(self):
+        if self.is_regular:
+            content = f"start={self._start!r}, step={self._step!r}"
+        else:
+            content = "irregular"
+        return (
+            f"<TimeAxis of {self._count} {self._unit.unit} since "
+            f"{self._unit.reference_date} ({content})>"
+        )
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __array__(self, dtype=None, copy=None):
+        np = import_numpy()
+
+        return np.asarray(self.values, dtype=dtype)
+
+    @property
+    def unit(self) -> DateUnit:
+        """The date unit of the offsets."""
+        return self._unit
+
+    @property
+    def is_regular(self) -> bool:
+        """Whether the offsets are an arithmetic progression."""
+        return self._step is not None
+
+    @property
+    def start(self) -> int | float | None:
+        """The first offset of a regular axis, otherwise None."""
+        return self._start
+
+    @property
+    def step(self) -> int | float | None:
+        """The increment of the offsets of a regular axis, otherwise None."""
+        return self._step
+
+    @property
+    def count(self) -> int:
+        """The number of offsets."""
+        return self._count
+
+    @property
+    def values(self):
+        """The offsets, as a NumPy array (computed on first access)."""
+        if self._values is None:
+            np = import_numpy()
+
+            self._values = self._start + self._step * np.arange(self._count)
+        return self._values
+
+    def rebase(self, unit: DateUnit) -> TimeAxis:
+        """
+        Return this time axis in the given date unit. A regular axis is
+        rebased in constant time, without materialising the offsets.
+
+        """
+        converter = Converter(self._unit, unit)
+        if not self.is_regular:
+            return TimeAxis.from_values(unit, converter.convert(self.values))
+
+        scale, offset = converter._affine_coefficients()
+        start = Fraction(self._start) * scale + offset
+        step = Fraction(self._step) * scale
+        return TimeAxis(
+            unit, _number(start, self._start), _number(step, self._step), self._count
+        )
+
+    def extend(self, other: TimeAxis) -> TimeAxis:
+        """
+        Return this time axis followed by the other, in the unit of this axis.
+        If the other axis continues the progression of this one, the result
+        is regular (and is computed in constant time).
+
+        """
+        other = other.rebase(self._unit)
+        if self.is_regular and other.is_regular:
+            # As in from_values, floating point offsets need only continue the
+            # progression within a tolerance (including the drift of a
+            # slightly different step over the offsets of the other axis).
+            tolerance = _tolerance(self._step)
+            expected_start = self._start + self._step * self._count
+            continues = abs(other._start - expected_start) <= tolerance
+            drift = abs(other._step - self._step) * (other._count - 1)
+            if continues and drift <= tolerance:
+                return TimeAxis(
+                    self._unit, self._start, self._step, self._count + other._count
+                )
+        np = import_numpy()
+
+        return TimeAxis.from_values(
+            self._unit, np.concatenate([self.values, other.values])
+        )
+
+
+def _tolerance(step: int | float) -> float:
+    # The tolerance of the offsets of a regular axis with the given step.
+    if isinstance(step, float):
+        return REGULARITY_TOLERANCE * abs(step)
+    return 0
+
+
+def _number(value: Fraction, like: int | float) -> int | float:
+    # An integer axis stays integer while its offsets are whole numbers.
+    if isinstance(like, int) and value.denominator == 1:
+        return int(value)
+    return float(value)
@@ -118,9 +118,9 @@ class UDUNITS2XMLParser:
         # Keep the value as a string. We can parse it later.
         value: str = value_tag.text or ""
 
-        symbols = set()
-        for symbol in tag.pop_iter_tags("symbol"):
-            symbols.add(symbol.text)
+        # Keep the symbols in the order of the document, since the first
+        # symbol is the preferred one.
+        symbols = dict.fromkeys(symbol.text for symbol in tag.pop_iter_tags("symbol"))
 
         if tag.children or tag.text:
             cls.unhandled_content_detected(
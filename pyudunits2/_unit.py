@@ -5,14 +5,45 @@ from ._expr.graph import Node, Identifier
 from ._expr import graph as unit_graph
 from ._unit_reference import UnitReference, Prefix
 from ._exceptions import IncompatibleUnitsError
-from ._datetime import DateTime
+from ._calendar import (
+    DEFAULT_CALENDAR,
+    SECONDS_PER_DATETIME64_TICK,
+    DateFields,
+    calendar_engine,
+    canonical_calendar,
+    fields_from_microseconds,
+    microseconds_from_fields,
+    seconds_since_epoch,
+)
+from ._datetime import DateTime, parse_udunits_date
 from ._expr.normaliser import NormalisedNode
+from ._instrumentation import stage
+from ._optional import import_numpy
+from ._pickle import restore_unit
 
+import dataclasses
 import typing
+from fractions import Fraction
 
 
 if typing.TYPE_CHECKING:
     from sympy.core.expr import Expr as SympyExpr
+    from ._expr.linear import LinearForm
+    from ._expr.program import BasisProgram, Program
+    from ._time_axis import TimeAxis
+
+
+#: A sentinel for a cached value which has not yet been computed.
+_NOT_COMPUTED: typing.Any = object()
+
+_INT64_MAX = 2**63 - 1
+
+
+def _wrap_int64(value: int):
+    # The given integer as a (two's complement) 64-bit integer.
+    np = import_numpy()
+
+    return np.int64((value + 2**63) % 2**64 - 2**63)
 
 
 class Expression:
@@ -94,6 +125,7 @@ class UnitDefinition:
 
 
 class Converter:
+    @stage("converter")
     def __init__(self, from_unit: Unit, to_unit: Unit):
         """
 
@@ -182,7 +214,13 @@ class Converter:
         self._from_unit = from_unit
         self._to_unit = to_unit
 
-        import sympy
+        is_date_conversion = isinstance(from_unit, DateUnit) or isinstance(
+            to_unit, DateUnit
+        )
+        if is_date_conversion and not from_unit.is_convertible_to(to_unit):
+            raise IncompatibleUnitsError(
+                f"Units {to_unit} and {from_unit} are not convertible"
+            )
 
         from_dimensionality = from_unit.dimensionality()
         to_dimensionality = to_unit.dimensionality()
@@ -197,9 +235,188 @@ class Converter:
             raise IncompatibleUnitsError(
                 f"Units {to_unit} and {from_unit} are not convertible"
             )
+        self._is_direct_conversion = is_direct_conversion
+        self._expression: SympyExpr | None = None
+
+        # Wherever possible, the conversion is described by an exact program
+        # of elementary steps, from which a Python function is generated.
+        # This avoids sympy entirely.
+        self._program = self._conversion_program()
+        if self._program is None and is_date_conversion:
+            raise IncompatibleUnitsError(
+                f"Unable to compute the conversion from {from_unit} to {to_unit}"
+            )
+        self._compile()
+
+        # TODO: Check that it is dimensionless.
+
+    def __reduce__(self):
+        # Pickle the units (which are themselves compact) and the program,
+        # so that the conversion need not be re-derived when unpickled.
+        return _converter_from_program, (
+            self._from_unit,
+            self._to_unit,
+            self._is_direct_conversion,
+            self._program,
+        )
+
+    def _compile(self) -> None:
+        # Set up the functions which apply the conversion.
+        if self._program is not None:
+            from ._expr.codegen import compile_program
+
+            compiled = compile_program(self._program)
+            self._converter = compiled.array
+            #: Convert a single Python number. For linear conversions this
+            #: is a generated function of the form ``value * scale + offset``,
+            #: with the coefficients folded in as float literals, and for
+            #: logarithmic units the ``math`` module is used. As this is the
+            #: generated function itself (not a method), there is no overhead
+            #: beyond that of the conversion.
+            self.convert_scalar: typing.Callable[[float], float] = compiled.scalar
+        else:
+            import sympy
+
+            lambdified = sympy.lambdify(
+                sympy.symbols("value"),
+                self.expression,
+            )
+            self._converter = _with_out_argument(lambdified)
+            self.convert_scalar = lambdified
+
+    def _conversion_program(self) -> Program | None:
+        # Compute the exact program which converts values from one unit to
+        # the other, or return None if either unit can't be represented by
+        # a program (e.g. due to non-numeric coefficients).
+        from fractions import Fraction
+
+        from ._expr.program import Affine, Program, Reciprocal
+
+        from_basis = self._from_unit._basis_program()
+        to_basis = self._to_unit._basis_program()
+        if from_basis is None or to_basis is None:
+            return None
+
+        if self._is_direct_conversion:
+            if from_basis.powers != to_basis.powers:
+                # For example, dimensionless basis units which do not cancel.
+                return None
+            if isinstance(self._from_unit, DateUnit):
+                # The values are durations (in basis units, i.e. seconds)
+                # since different reference dates, so shift them by the
+                # difference between the reference dates.
+                epoch_difference = (
+                    self._from_unit._reference_seconds()
+                    - self._to_unit._reference_seconds()
+                )
+                return from_basis.program.then(
+                    Program.from_steps([Affine(Fraction(1), epoch_difference)])
+                ).then(to_basis.program.inverse())
+            return from_basis.program.then(to_basis.program.inverse())
+        else:
+            inverted_powers = {
+                identifier: -order for identifier, order in from_basis.powers.items()
+            }
+            if inverted_powers != to_basis.powers:
+                return None
+            # A quantity q in the from basis is 1/q in the (inverted) to basis.
+            return from_basis.program.then(
+                Program.from_steps([Reciprocal()]),
+            ).then(to_basis.program.inverse())
+
+    @property
+    def is_identity(self) -> bool:
+        """
+        Whether the conversion leaves values unchanged (e.g. from ``m`` to
+        ``meter``, or from ``m/m`` to ``1``). Identity conversions return
+        their input as-is, without making a copy.
+
+        """
+        return self._program is not None and self._program.is_identity()
+
+    @property
+    def is_linear(self) -> bool:
+        """
+        Whether the conversion is of the form ``value * scale + offset``.
+        See :attr:`scale` and :attr:`offset`.
+
+        """
+        return self._program is not None and (
+            self._program.affine_coefficients() is not None
+        )
+
+    @property
+    def scale(self) -> float | None:
+        """The scale factor of a linear conversion, otherwise None."""
+        coefficients = self._affine_coefficients()
+        return None if coefficients is None else float(coefficients[0])
+
+    @property
+    def offset(self) -> float | None:
+        """The offset of a linear conversion, otherwise None."""
+        coefficients = self._affine_coefficients()
+        return None if coefficients is None else float(coefficients[1])
 
-        t1, d1 = from_unit._symbolic_definition()
-        t2, d2 = to_unit._symbolic_definition()
+    def _affine_coefficients(self) -> tuple[Fraction, Fraction] | None:
+        if self._program is None:
+            return None
+        return self._program.affine_coefficients()
+
+    def then(self, other: Converter) -> Converter:
+        """
+        Return a single converter which applies this conversion, followed by
+        the other. For example, the conversions ``degC -> K`` and
+        ``K -> degF`` fuse into a ``degC -> degF`` conversion which costs
+        one pass over the values.
+
+        The to unit of this converter must be the from unit of the other.
+
+        """
+        if self._to_unit != other._from_unit:
+            raise IncompatibleUnitsError(
+                f"Unable to chain a conversion to {self._to_unit} with a "
+                f"conversion from {other._from_unit}"
+            )
+        if self._program is None or other._program is None:
+            return Converter(self._from_unit, other._to_unit)
+        # Two inversions (e.g. m/s -> s/m -> m/s) make a direct conversion.
+        return _converter_from_program(
+            self._from_unit,
+            other._to_unit,
+            self._is_direct_conversion == other._is_direct_conversion,
+            self._program.then(other._program),
+        )
+
+    def inverse(self) -> Converter:
+        """Return the converter which undoes this conversion."""
+        if self._program is None:
+            return Converter(self._to_unit, self._from_unit)
+        return _converter_from_program(
+            self._to_unit,
+            self._from_unit,
+            self._is_direct_conversion,
+            self._program.inverse(),
+        )
+
+    @property
+    def expression(self) -> SympyExpr:
+        """The symbolic (sympy) expression of the conversion."""
+        if self._expression is None:
+            self._expression = self._symbolic_conversion_expr()
+        return self._expression
+
+    @stage("symbolic")
+    def _symbolic_conversion_expr(self) -> SympyExpr:
+        import sympy
+
+        if isinstance(self._from_unit, DateUnit):
+            # Date conversions are always affine (see _conversion_program).
+            scale, offset = self._program.affine_coefficients()
+            value = sympy.Symbol("value")
+            return sympy.Rational(scale) * value + sympy.Rational(offset)
+
+        t1, d1 = self._from_unit._symbolic_definition()
+        t2, d2 = self._to_unit._symbolic_definition()
 
         to_symbol = sympy.symbols("value_transformed_to_base_unit_scale")
 
@@ -219,26 +436,219 @@ class Converter:
             assert len(transformer1) == 1
             [transformer1] = transformer1
 
-        if is_direct_conversion:
+        if self._is_direct_conversion:
             convert_expr = t2.subs(to_value, transformer1 * d1 / d2)
         else:
             convert_expr = t2.subs(to_value, 1 / (transformer1 * d1 * d2))
+        return convert_expr
+
+    def convert(
+        self,
+        values,
+        out=None,
+        *,
+        threads: int | None = None,
+        processes: int | None = None,
+    ):
+        """
+        Convert the given number or array of values.
+
+        If ``out`` is given, the result is written into it (and returned).
+        Passing the input array as ``out`` converts the values in-place,
+        without allocating. Identity conversions return the input itself
+        unless ``out`` is given, in which case the values are copied into it.
+
+        For large, contiguous NumPy arrays, ``threads`` may be given to split
+        the array into blocks which are converted concurrently by that many
+        threads. Alternatively, ``processes`` may be given to convert the
+        blocks in a pool of that many worker processes, via shared memory.
+
+        Starting the processes takes tens of milliseconds, and copying the
+        values into (and the result out of) shared memory costs about as much
+        as a linear conversion of them, so threads are the better choice for
+        most conversions. Processes only win for compute-bound (logarithmic
+        or exponential) conversions of arrays of many millions of values,
+        on many cores, and especially when the values and ``out`` are
+        allocated by :class:`SharedArrays` (such that they are converted in
+        place, without either copy).
+
+        """
+        # TODO: Sympy can return an expression here. We never want it
+        #  to - it should always be a number-like.
+        if out is None and type(values) in (int, float):
+            try:
+                return self.convert_scalar(values)
+            except (ArithmeticError, ValueError):
+                # The value is outside the domain (e.g. the log of a negative
+                # number) or range of the math functions. Fall back to NumPy,
+                # which returns nan or inf (with a warning) instead.
+                pass
+        if threads is not None and processes is not None:
+            raise ValueError("Only one of threads and processes may be given")
+        if (threads or processes or 1) > 1 and out is None and self.is_identity:
+            return values
+        if processes is not None and processes > 1 and self._program is not None:
+            from ._parallel import convert_in_processes
+
+            return convert_in_processes(
+                self._program, values, out=out, processes=processes
+            )
+        if threads is not None and threads > 1:
+            from ._parallel import convert_in_threads
+
+            return convert_in_threads(self._converter, values, out=out, threads=threads)
+        return self._converter(values, out=out)
+
 
-        fn = sympy.lambdify(
-            orig_qty,
-            convert_expr,
+class MultiConverter:
+    """
+    Convert values from one unit into several target units in a single pass
+    over the values.
+
+    The values are processed block by block. Targets whose conversion is
+    linear are converted directly from each block (while it is in cache),
+    and the (potentially expensive) conversion of the source unit to its
+    basis units is shared by all other targets, such that it is computed
+    only once per block.
+
+    For example::
+
+        kelvin = system.unit("K")
+        to_celsius_and_fahrenheit = MultiConverter(
+            kelvin, [system.unit("degC"), system.unit("degF")]
         )
-        self.expression = convert_expr
-        self._converter = fn
+        celsius, fahrenheit = to_celsius_and_fahrenheit.convert(values)
 
-        # TODO: Check that it is dimensionless.
+    """
 
-        return
+    def __init__(self, from_unit: Unit, to_units: typing.Sequence[Unit]):
+        from ._expr.codegen import compile_program
+        from ._expr.program import Program, Reciprocal
 
-    def convert(self, values):
-        # TODO: Sympy can return an expression here. We never want it
-        #  to - it should always be a number-like.
-        return self._converter(values)
+        self._from_unit = from_unit
+        self._to_units = tuple(to_units)
+        self._converters = [Converter(from_unit, to_unit) for to_unit in to_units]
+
+        from_basis = from_unit._basis_program()
+        self._to_basis = None
+        if from_basis is not None:
+            self._to_basis = compile_program(from_basis.program).array
+
+        # For each target, the function applied to a block of values, and
+        # whether it takes the values in basis units (rather than in the
+        # source unit).
+        self._steps: list[tuple[typing.Callable[..., typing.Any], bool]] = []
+        for converter in self._converters:
+            program = converter._program
+            if program is None:
+                self._steps.append((converter._converter, False))
+            elif program.affine_coefficients() is not None or self._to_basis is None:
+                self._steps.append((compile_program(program).array, False))
+            else:
+                # The tail takes the shared basis values to the target unit.
+                to_basis_program = converter._to_unit._basis_program().program
+                tail = to_basis_program.inverse()
+                if not converter._is_direct_conversion:
+                    tail = Program.from_steps([Reciprocal()]).then(tail)
+                self._steps.append((compile_program(tail).array, True))
+
+    @property
+    def converters(self) -> list[Converter]:
+        """The individual converters, in the order of the target units."""
+        return list(self._converters)
+
+    def convert(self, values, outs: typing.Sequence | None = None) -> list:
+        """
+        Convert the values into each of the target units, returning a list of
+        the results.
+
+        If given, ``outs`` is a sequence of C-contiguous arrays (one for each
+        target unit, of the same shape as the values) which the results are
+        written into.
+
+        """
+        np = import_numpy()
+
+        from ._parallel import BLOCK_SIZE
+
+        if not isinstance(values, np.ndarray):
+            if outs is None:
+                return [converter.convert(values) for converter in self._converters]
+            return [
+                converter.convert(values, out=out)
+                for converter, out in zip(self._converters, outs, strict=True)
+            ]
+
+        if outs is None:
+            empty = np.empty(0, dtype=values.dtype)
+            outs = [
+                np.empty(values.shape, dtype=np.asarray(result).dtype)
+                for result in self._convert_block(empty)
+            ]
+        elif len(outs) != len(self._steps):
+            raise ValueError(
+                f"Expected {len(self._steps)} output arrays, got {len(outs)}"
+            )
+        for out in outs:
+            if out.shape != values.shape or not out.flags.c_contiguous:
+                raise ValueError(
+                    "The output arrays must be C-contiguous and of the same "
+                    f"shape as the values ({values.shape})"
+                )
+
+        flat_values = values.reshape(-1)
+        flat_outs = [out.reshape(-1) for out in outs]
+        for start in range(0, flat_values.size, BLOCK_SIZE):
+            block = slice(start, start + BLOCK_SIZE)
+            self._convert_block(
+                flat_values[block], [flat_out[block] for flat_out in flat_outs]
+            )
+        return list(outs)
+
+    def _convert_block(self, values, outs=None) -> list:
+        if outs is None:
+            outs = [None] * len(self._steps)
+        basis_values = None
+        results = []
+        for (step, takes_basis_values), out in zip(self._steps, outs):
+            if takes_basis_values:
+                if basis_values is None:
+                    basis_values = self._to_basis(values)
+                results.append(step(basis_values, out=out))
+            else:
+                results.append(step(values, out=out))
+        return results
+
+
+def _converter_from_program(
+    from_unit: Unit,
+    to_unit: Unit,
+    is_direct_conversion: bool,
+    program: Program | None,
+) -> Converter:
+    if program is None:
+        return Converter(from_unit, to_unit)
+    converter = Converter.__new__(Converter)
+    converter._from_unit = from_unit
+    converter._to_unit = to_unit
+    converter._is_direct_conversion = is_direct_conversion
+    converter._expression = None
+    converter._program = program
+    converter._compile()
+    return converter
+
+
+def _with_out_argument(function):
+    # Give a (lambdified) single argument function the same signature as
+    # the generated array conversion functions.
+    def convert_array(value, out=None):
+        result = function(value)
+        if out is None:
+            return result
+        out[...] = result
+        return out
+
+    return convert_array
 
 
 class Dimensionality:
@@ -312,8 +722,14 @@ def _unit_from_expression_and_identifiers(
             # date_ref = DateUnit.parse(unit_expr.shift_from)
             date_ref = unit_expr.shift_from
             if isinstance(date_ref, unit_graph.Number):
-                date_ref = unit_graph.Unhandled(date_ref.raw_content)
-            if not isinstance(date_ref, unit_graph.Unhandled):
+                # A year (e.g. "2000") or a packed date (e.g. "20000101").
+                try:
+                    date_ref = parse_udunits_date(date_ref.raw_content)
+                except ValueError:
+                    date_ref = unit_graph.Unhandled(date_ref.raw_content)
+            elif isinstance(date_ref, unit_graph.Timestamp):
+                date_ref = date_ref.date_time
+            if not isinstance(date_ref, (DateTime, unit_graph.Unhandled)):
                 raise ValueError(f"Unexpected parse type for date: {type(date_ref)}")
 
             return DateUnit(
@@ -347,6 +763,27 @@ class Unit(UnitInterface):
         self._definition: Node = definition
         self._identifier_references = identifier_references
         self._cached_symbolic_definition = None
+        self._cached_basis_program: BasisProgram | None = _NOT_COMPUTED
+        # The (unit system identifier, unit string) from which this unit can
+        # be re-created when unpickled. See pyudunits2._pickle.
+        self._origin: tuple[str, str] | None = None
+
+    def __reduce_ex__(self, protocol):
+        if self._origin is not None:
+            return restore_unit, self._origin
+        return super().__reduce_ex__(protocol)
+
+    def __getstate__(self):
+        # Drop the cached (and potentially large) derived forms.
+        state = self.__dict__.copy()
+        del state["_cached_symbolic_definition"]
+        del state["_cached_basis_program"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._cached_symbolic_definition = None
+        self._cached_basis_program = _NOT_COMPUTED
 
     def __str__(self):
         return str(self._definition)
@@ -371,6 +808,11 @@ class Unit(UnitInterface):
             # Short-circuit identical definitions.
             return True
 
+        self_form = self._linear_form()
+        other_form = other._linear_form()
+        if self_form is not None and other_form is not None:
+            return self_form == other_form
+
         from sympy import simplify, expand
 
         self_t, self_d = self._symbolic_definition()
@@ -380,6 +822,7 @@ class Unit(UnitInterface):
         sim = simplify(eq)
         return expand(sim, trig=False) == 0 and self_t == other_t
 
+    @stage("symbolic")
     def _symbolic_definition(self) -> tuple[SympyExpr, SympyExpr]:
         if self._cached_symbolic_definition is None:
             from ._expr.sympy import ToSympy
@@ -399,6 +842,30 @@ class Unit(UnitInterface):
             self._cached_symbolic_definition = transform, prepared
         return self._cached_symbolic_definition
 
+    def _basis_program(self) -> BasisProgram | None:
+        # The exact program which takes a value in this unit to a value in
+        # its basis units, or None if the unit can't be represented in this
+        # way (e.g. it has non-numeric coefficients). Such units can be
+        # compared and converted without the use of sympy.
+        if self._cached_basis_program is _NOT_COMPUTED:
+            from ._expr.program import basis_program
+
+            try:
+                self._cached_basis_program = basis_program(self._expanded_expr())
+            except (ValueError, ZeroDivisionError):
+                self._cached_basis_program = None
+        return self._cached_basis_program
+
+    def _linear_form(self) -> LinearForm | None:
+        # The exact normal form of the unit (scale, offset and basis powers),
+        # or None if the unit is not linear (e.g. it is logarithmic).
+        from ._expr.linear import LinearForm
+
+        basis = self._basis_program()
+        if basis is None:
+            return None
+        return LinearForm.from_basis_program(basis)
+
     def _expanded_expr(self) -> Node:
         from ._expr.substitute import Substitute
 
@@ -480,14 +947,267 @@ class DateUnit(UnitInterface):
         *,
         unit: Unit,
         reference_date: DateTime | unit_graph.Unhandled,
+        calendar: str = DEFAULT_CALENDAR,
     ):
         assert unit.is_time_unit()
         self._unit = unit
         self._reference_date = reference_date
+        self._calendar = canonical_calendar(calendar)
+        self._cached_reference_seconds: Fraction | None = None
+        # See Unit._origin.
+        self._origin: tuple[str, str] | None = None
+
+    def __reduce_ex__(self, protocol):
+        if self._origin is not None:
+            return restore_unit, (*self._origin, self._calendar)
+        return super().__reduce_ex__(protocol)
+
+    def __str__(self):
+        return f"{self._unit} since {self._reference_date}"
+
+    @property
+    def calendar(self) -> str:
+        """
+        The (canonical) name of the calendar of the reference date. Unit
+        strings do not define a calendar, so this defaults to ``"standard"``.
+        See :meth:`with_calendar`.
+
+        """
+        return self._calendar
+
+    def with_calendar(self, calendar: str) -> DateUnit:
+        """
+        Return this date unit, but in the given calendar (for example, from
+        the CF ``calendar`` attribute of a time coordinate).
+
+        """
+        result = DateUnit(
+            unit=self._unit, reference_date=self._reference_date, calendar=calendar
+        )
+        result._origin = self._origin
+        return result
 
     def is_convertible_to(self, other: UnitInterface) -> bool:
-        # TODO: We can start to do better now that we have rich dates.
-        return False
+        # Date units are convertible if their calendars match (or both count
+        # real days, such as the standard and julian calendars), and they are
+        # both durations in time units. The reference date must be known.
+        if not isinstance(other, DateUnit):
+            return False
+        if self.calendar != other.calendar and not (
+            calendar_engine(self.calendar).counts_real_days
+            and calendar_engine(other.calendar).counts_real_days
+        ):
+            return False
+        try:
+            self._reference_seconds()
+            other._reference_seconds()
+        except ValueError:
+            return False
+        return self.dimensionality() == other.dimensionality()
+
+    def _reference_seconds(self) -> Fraction:
+        # The exact number of seconds between 1970-01-01 00:00 UTC and the
+        # reference date, in the calendar of this unit.
+        if self._cached_reference_seconds is None:
+            reference = self._reference_date
+            if not isinstance(reference, DateTime):
+                raise ValueError(f"Unable to interpret the reference date {reference}")
+            self._cached_reference_seconds = seconds_since_epoch(
+                reference, self._calendar
+            )
+        return self._cached_reference_seconds
+
+    def _seconds_per_unit(self) -> Fraction:
+        basis = self._unit._basis_program()
+        coefficients = None if basis is None else basis.program.affine_coefficients()
+        if coefficients is None or coefficients[1] != 0:
+            raise ValueError(f"Unable to represent {self._unit} in seconds")
+        return coefficients[0]
+
+    def _ticks_since_epoch(
+        self, values, ticks_per_second: Fraction, *, nan_as_nat: bool = False
+    ):
+        # The (integer) number of ticks since 1970-01-01 00:00 UTC of the
+        # given offsets. The reference date is added as an integer, such that
+        # it does not cost any precision. Offsets whose ticks do not fit in a
+        # 64-bit integer raise an OverflowError, rather than wrapping around.
+        # NaN offsets become NaT (the minimum int64) if nan_as_nat is set.
+        scale = self._seconds_per_unit() * ticks_per_second
+        origin = round(self._reference_seconds() * ticks_per_second)
+        if isinstance(values, (int, float)) and not nan_as_nat:
+            return round(Fraction(values) * scale) + origin
+
+        np = import_numpy()
+
+        values = np.asarray(values)
+        shape = values.shape
+        values = np.atleast_1d(values)
+        is_integer = values.dtype.kind in "iu" and scale.denominator == 1
+        is_nan = None
+        if not is_integer:
+            values = values.astype(np.float64, copy=False)
+            is_nan = np.isnan(values)
+            if is_nan.any():
+                if not nan_as_nat:
+                    raise ValueError("Unable to represent NaN offsets as dates")
+                values = np.where(is_nan, 0, values)
+
+        if values.size:
+            # Check the extremes exactly. Allow for the rounding of the
+            # (float) products, which are then rounded to integers.
+            margin = 0 if is_integer else 2**11
+            for extreme in [values.min(), values.max()]:
+                ticks = round(Fraction(extreme.item()) * scale) + origin
+                if abs(ticks) > _INT64_MAX - margin:
+                    raise OverflowError(
+                        f"The offset {extreme} ({self._unit} since "
+                        f"{self.reference_date}) is out of the range of "
+                        "64-bit integer ticks"
+                    )
+
+        # The result is known to fit, so the intermediate products and the
+        # reference date may wrap around (as two's complement integers).
+        wrapped_origin = _wrap_int64(origin)
+        if is_integer:
+            ticks = values.astype(np.int64) * int(scale) + wrapped_origin
+        else:
+            products = np.rint(values * float(scale))
+            if np.abs(products).max(initial=0) < 2**63 - 2**11:
+                ticks = products.astype(np.int64) + wrapped_origin
+            else:
+                # Far from the reference date, at a fine resolution. The float
+                # products are no more precise than their sum.
+                ticks = np.rint(products + float(origin)).astype(np.int64)
+        if is_nan is not None:
+            ticks[is_nan] = np.iinfo(np.int64).min
+        return ticks.reshape(shape)
+
+    def _check_counts_real_days(self):
+        if not calendar_engine(self._calendar).counts_real_days:
+            raise ValueError(
+                f"Dates in the {self._calendar} calendar cannot be represented "
+                "as numpy.datetime64"
+            )
+
+    def to_datetime64(self, values, resolution: str = "ns"):
+        """
+        Convert the given offsets (in this unit, since the reference date)
+        to ``numpy.datetime64`` values of the given resolution (e.g. "s",
+        "us" or "ns").
+
+        Integer offsets in units of a whole number of ticks are converted
+        exactly; other offsets are rounded to the nearest tick. NaN offsets
+        become NaT, and offsets which can not be represented at the given
+        resolution raise an OverflowError.
+
+        ``numpy.datetime64`` is in the proleptic Gregorian calendar, so this
+        is only available for calendars which count real days.
+
+        """
+        self._check_counts_real_days()
+        if resolution not in SECONDS_PER_DATETIME64_TICK:
+            raise ValueError(f"Unsupported datetime64 resolution {resolution!r}")
+        ticks = self._ticks_since_epoch(
+            values,
+            1 / SECONDS_PER_DATETIME64_TICK[resolution],
+            nan_as_nat=True,
+        )
+        return ticks.view(f"datetime64[{resolution}]")[()]
+
+    def from_datetime64(self, array):
+        """
+        Convert the given ``numpy.datetime64`` values to offsets (in this unit,
+        since the reference date). NaT values become NaN. This is the inverse
+        of :meth:`to_datetime64`.
+
+        """
+        np = import_numpy()
+
+        self._check_counts_real_days()
+        array = np.asarray(array)
+        shape = array.shape
+        array = np.atleast_1d(array)
+        if array.dtype.kind != "M":
+            raise ValueError(f"Expected numpy.datetime64 values, got {array.dtype}")
+        resolution, count = np.datetime_data(array.dtype)
+        if resolution in ("Y", "M"):
+            # Years and months vary in length.
+            array = array.astype("datetime64[D]")
+            resolution, count = "D", 1
+        seconds_per_tick = SECONDS_PER_DATETIME64_TICK[resolution] * count
+
+        ticks = array.view(np.int64)
+        units_per_tick = seconds_per_tick / self._seconds_per_unit()
+        origin = self._reference_seconds() / seconds_per_tick
+        # Subtract the (whole ticks of the) reference date as integers where
+        # they can't overflow, such that no precision is lost.
+        whole_origin = round(origin)
+        is_nat = np.isnat(array)
+        valid_ticks = ticks[~is_nat]
+        if valid_ticks.size == 0 or (
+            abs(int(valid_ticks.min()) - whole_origin) <= _INT64_MAX
+            and abs(int(valid_ticks.max()) - whole_origin) <= _INT64_MAX
+        ):
+            # The difference is known to fit, so may wrap around.
+            values = (ticks - _wrap_int64(whole_origin)) * float(units_per_tick)
+            values -= float((origin - whole_origin) * units_per_tick)
+        else:
+            values = (ticks - float(origin)) * float(units_per_tick)
+        values[is_nat] = np.nan
+        return values.reshape(shape)[()]
+
+    def to_date_fields(self, values) -> DateFields:
+        """
+        Split the given offsets (in this unit, since the reference date) into
+        the (UTC) year, month, day, hour, minute, second and microsecond
+        fields of the calendar.
+
+        Offsets may be a number or an array, and are converted using integer
+        arithmetic. Integer offsets in units of a whole number of microseconds
+        are converted exactly; other offsets are rounded to the nearest
+        microsecond.
+
+        """
+        return fields_from_microseconds(
+            self._ticks_since_epoch(values, Fraction(1_000_000)), self._calendar
+        )
+
+    def from_date_fields(
+        self, year, month, day, hour=0, minute=0, second=0, microsecond=0
+    ):
+        """
+        The offsets (in this unit, since the reference date) of the given
+        calendar fields, each of which may be a number or an array. This is
+        the inverse of :meth:`to_date_fields`.
+
+        """
+        fields = DateFields(year, month, day, hour, minute, second, microsecond)
+        if not all(isinstance(field, int) for field in dataclasses.astuple(fields)):
+            np = import_numpy()
+
+            fields = DateFields(
+                *(
+                    np.asarray(field, dtype=np.int64)
+                    for field in dataclasses.astuple(fields)
+                )
+            )
+        origin = round(self._reference_seconds() * 1_000_000)
+        microseconds = microseconds_from_fields(fields, self._calendar) - origin
+        scale = self._seconds_per_unit() * 1_000_000
+        if isinstance(microseconds, int):
+            return float(microseconds / scale)
+        return microseconds / float(scale)
+
+    def time_axis(self, values) -> TimeAxis:
+        """
+        Return a :class:`TimeAxis` of the given (1-dimensional) offsets in this
+        unit. Regularly spaced offsets are detected, such that the axis can be
+        rebased to other date units in constant time.
+
+        """
+        from ._time_axis import TimeAxis
+
+        return TimeAxis.from_values(self, values)
 
     @property
     def unit(self):
@@ -512,6 +1232,14 @@ class DateUnit(UnitInterface):
         # TODO: This should be specialised for dates.
         return self._unit._symbolic_definition()
 
+    def _basis_program(self):
+        # TODO: This should be specialised for dates.
+        return self._unit._basis_program()
+
+    def _linear_form(self):
+        # TODO: This should be specialised for dates.
+        return self._unit._linear_form()
+
     def expanded(self):
         return f"{self._unit.expanded()} since {self.reference_date}"
 
@@ -582,11 +1310,11 @@ class BasisUnit(NamedUnit):
     def __str__(self):
         return self._ref
 
-    def dimensionality(self) -> dict[BasisUnit, int]:
+    def dimensionality(self) -> Dimensionality:
         if self._dimensionless:
-            return {}
+            return Dimensionality({})
         else:
-            return {self: 1}
+            return Dimensionality({self: 1})
 
     def is_time_unit(self):
         return self._is_time_unit
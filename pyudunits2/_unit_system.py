@@ -1,20 +1,34 @@
 from __future__ import annotations
 
+import bisect
+import dataclasses
 import pathlib
 import typing
+from fractions import Fraction
 
+from ._cache import BoundedCache
+from ._instrumentation import stage
+from ._optional import import_numpy
 from ._unit_reference import Prefix
 
 from ._expr.graph import Node
 from ._expr.atoms import ExtractIdentifiers
 from ._expr import graph as unit_graph
 from ._grammar import parse
-from ._exceptions import UnresolvableUnitException
+from ._exceptions import IncompatibleUnitsError, UnresolvableUnitException
+from ._pickle import UDUNITS2_XML
 
 # We can import Unit from unit_system (but not the other way around)
-from ._unit import Unit, DateUnit, NamedUnit, _unit_from_expression_and_identifiers
+from ._unit import (
+    Converter,
+    DateUnit,
+    NamedUnit,
+    Unit,
+    _unit_from_expression_and_identifiers,
+)
 
 if typing.TYPE_CHECKING:
+    from ._expr.linear import LinearForm
     from ._unit_reference import UnitReference
 
 
@@ -40,6 +54,7 @@ class LazilyDefinedUnit:
         # self._resolved_definition: Node | None = None
         self._resolved_unit: NamedUnit | None = None
 
+    @stage("resolve_definition")
     def resolve(self) -> NamedUnit:
         if self._resolved_unit is None:
             unit_expr = parse(self._definition)
@@ -78,7 +93,97 @@ class LazilyDefinedUnit:
         # return
 
 
+@dataclasses.dataclass(frozen=True)
+class UnitValidation:
+    """
+    The verdict of validating a unit string against a :class:`UnitSystem`.
+
+    Instances are truthy if the unit string is valid.
+
+    """
+
+    unit_string: str
+    is_valid: bool
+    #: The category of the problem ("syntax", "unresolvable" or "invalid"),
+    #: or None if the unit string is valid.
+    error_type: str | None = None
+    message: str | None = None
+    #: The (zero-based) offset of the problem within the unit string, if known.
+    position: int | None = None
+
+    def __bool__(self) -> bool:
+        return self.is_valid
+
+
+@dataclasses.dataclass(frozen=True)
+class ScaledUnit:
+    """
+    A named unit of a :class:`UnitSystem`, along with the factor which
+    converts a value in the unit into its basis units. For example, ``km``
+    has a scale of 1000 (meters).
+
+    The scale is None for units which are not linear (e.g. logarithmic units).
+
+    """
+
+    name: str
+    unit: NamedUnit
+    scale: float | None
+
+
+@dataclasses.dataclass(frozen=True)
+class _DisplayIndex:
+    # The candidate display units for a unit, sorted by increasing scale,
+    # with the scale (and its log10) of each relative to the unit.
+    unit_strings: typing.Any  # A numpy array of str.
+    scales: typing.Any  # A numpy array of float.
+    log_scales: typing.Any  # A numpy array of float.
+    #: The index of the candidate to use for zero and non-finite values.
+    default: int
+
+
+def _is_power_of_1000(value: Fraction) -> bool:
+    if value < 1:
+        value = 1 / value
+    while value.denominator == 1 and value.numerator % 1000 == 0:
+        value /= 1000
+    return value == 1
+
+
+def _primary_name(names: UnitReference) -> str:
+    # Prefer the name, then the symbol, then any alias.
+    if names.name is not None:
+        return names.name.singular
+    if names.symbols:
+        return names.symbols[0]
+    if names.alias_names:
+        return names.alias_names[0].singular
+    return names.alias_symbols[0]
+
+
+def _dimensionality_key(unit: Unit | DateUnit) -> frozenset[tuple[str, int]]:
+    # A hashable, canonical form of the dimensionality of the unit.
+    return frozenset(
+        (str(basis_unit), order) for basis_unit, order in unit.dimensionality().items()
+    )
+
+
+def _needs_construction(node: Node) -> bool:
+    # Whether the unit of the expression may fail to be constructed even
+    # once all of its identifiers are resolved.
+    if isinstance(node, (unit_graph.Shift, unit_graph.Unhandled)):
+        return True
+    return any(_needs_construction(child) for child in node.children())
+
+
 class UnitSystem:
+    #: The maximum number of validation verdicts to remember.
+    _VALIDATION_CACHE_SIZE = 10_000
+    #: The maximum number of unresolvable identifiers to remember.
+    _UNRESOLVABLE_CACHE_SIZE = 1_000
+    #: The maximum number of display unit scale indices to remember.
+    _DISPLAY_INDEX_CACHE_SIZE = 100
+
     def __init__(
         self,
     ):
@@ -94,6 +199,27 @@ class UnitSystem:
         self._prefix_names: dict[str, Prefix] = {}
         self._prefix_symbols: dict[str, Prefix] = {}
 
+        self._validation_cache: BoundedCache[str, UnitValidation] = BoundedCache(
+            self._VALIDATION_CACHE_SIZE
+        )
+        # Identifiers which are known not to resolve to a unit (e.g. "N/A").
+        # Looking these up is expensive, since every prefix must be tried.
+        self._unresolvable_identifiers: BoundedCache[str, None] = BoundedCache(
+            self._UNRESOLVABLE_CACHE_SIZE
+        )
+        # The identifier of a well-known unit system with exactly this
+        # content, allowing units to be pickled compactly. See
+        # pyudunits2._pickle.
+        self._pickle_id: str | None = None
+        # Sorted scales of the candidate display units. See best_display_unit.
+        self._display_indices: BoundedCache[
+            tuple[str, tuple[str, ...] | None], _DisplayIndex
+        ] = BoundedCache(self._DISPLAY_INDEX_CACHE_SIZE)
+        # Lazily built. See units_with_dimensionality.
+        self._dimensionality_index: (
+            dict[frozenset[tuple[str, int]], list[ScaledUnit]] | None
+        ) = None
+
     @classmethod
     def from_udunits2_xml(cls, path: pathlib.Path | None = None) -> UnitSystem:
         # Lazy import of the XML functionality, since it is not a
@@ -110,16 +236,38 @@ class UnitSystem:
         if path is None:
             # TODO: In the future we can short-circuit this to a pre-prepared
             #  unit system which was built from the udunits2 XML file.
-            return read_all()
+            system = read_all()
+            system._pickle_id = UDUNITS2_XML
+            return system
         else:
             raise NotImplementedError("Not yet able to read from another XML file")
 
+    def _invalidate_caches(self) -> None:
+        # Called whenever the content of the unit system changes, such that
+        # previously computed results may no longer hold.
+        self._validation_cache.clear()
+        self._unresolvable_identifiers.clear()
+        self._dimensionality_index = None
+        self._display_indices.clear()
+        # The content no longer matches that of the well-known system.
+        self._pickle_id = None
+
     def add_prefix(self, prefix: Prefix) -> None:
+        self._invalidate_caches()
         self._prefix_names[prefix.name] = prefix
         for symbol in prefix.symbols:
             self._prefix_symbols[symbol] = prefix
 
     def add_unit(self, unit: NamedUnit | LazilyDefinedUnit, replace=False) -> None:
+        self._invalidate_caches()
+        self._register_unit(unit, replace=replace)
+
+    def _register_unit(
+        self, unit: NamedUnit | LazilyDefinedUnit, replace=False
+    ) -> None:
+        # Register the unit without invalidating any caches. This is used
+        # directly when replacing a LazilyDefinedUnit with its resolved form,
+        # since doing so does not change the meaning of the unit system.
         ref = unit._names
         if ref.name is not None:
             if not replace and ref.name.singular in self._names:
@@ -202,21 +350,25 @@ class UnitSystem:
         unit = self._names.get(name, None) or self._alias_names.get(name, None)
         if isinstance(unit, LazilyDefinedUnit):
             unit = unit.resolve()
-            self.add_unit(unit, replace=True)
+            self._register_unit(unit, replace=True)
         return unit
 
     def _unit_by_symbol(self, symbol: str) -> Unit | None:
         unit = self._symbols.get(symbol, None) or self._alias_symbols.get(symbol, None)
         if isinstance(unit, LazilyDefinedUnit):
             unit = unit.resolve()
-            self.add_unit(unit, replace=True)
+            self._register_unit(unit, replace=True)
         return unit
 
+    @stage("resolve_identifier")
     def unit_by_name_or_symbol(self, name_or_symbol: str) -> Unit:
         # Looks up a referencable unit from the system. This does not do any
         # parsing, for that use the `unit` method.
         # Instead, this method is designed to look up a specific referencable unit,
         # optionally with a prefix. For example "km", "hours", etc.
+        if name_or_symbol in self._unresolvable_identifiers:
+            raise self._unresolvable_exception(name_or_symbol)
+
         result: Unit | None = None
 
         if unit := self._unit_by_name(name_or_symbol):
@@ -228,58 +380,58 @@ class UnitSystem:
         if result is None:
             for prefix_name, prefix in self._prefix_names.items():
                 if name_or_symbol.startswith(prefix_name):
-                    unit = self._unit_by_name(
-                        name_or_symbol[len(prefix_name) :]
-                    ) or self._unit_by_symbol(name_or_symbol[len(prefix_name) :])
-                    if unit:
-                        refs = {
-                            unit_graph.Identifier(prefix_name): prefix,
-                            unit_graph.Identifier(
-                                name_or_symbol[len(prefix_name) :]
-                            ): unit,
-                        }
-                        result = Unit(
-                            definition=unit_graph.Multiply(
-                                unit_graph.Identifier(prefix_name),
-                                unit_graph.Identifier(
-                                    name_or_symbol[len(prefix_name) :]
-                                ),
-                            ),
-                            identifier_references=refs,
-                        )
+                    result = self._prefixed_unit(
+                        prefix_name, prefix, name_or_symbol[len(prefix_name) :]
+                    )
+                    if result is not None:
                         break
 
         if result is None:
             for prefix_symbol, prefix in self._prefix_symbols.items():
                 if name_or_symbol.startswith(prefix_symbol):
-                    unit = self._unit_by_name(
-                        name_or_symbol[len(prefix_symbol) :]
-                    ) or self._unit_by_symbol(name_or_symbol[len(prefix_symbol) :])
-                    if unit:
-                        refs = {
-                            unit_graph.Identifier(prefix_symbol): prefix,
-                            unit_graph.Identifier(
-                                name_or_symbol[len(prefix_symbol) :]
-                            ): unit,
-                        }
-                        result = Unit(
-                            definition=unit_graph.Multiply(
-                                unit_graph.Identifier(prefix_symbol),
-                                unit_graph.Identifier(
-                                    name_or_symbol[len(prefix_symbol) :]
-                                ),
-                            ),
-                            identifier_references=refs,
-                        )
+                    result = self._prefixed_unit(
+                        prefix_symbol, prefix, name_or_symbol[len(prefix_symbol) :]
+                    )
+                    if result is not None:
                         break
 
         if result is None:
-            raise UnresolvableUnitException(
-                f"Unable to convert the identifier '{name_or_symbol}' into a unit "
-                "in the unit system"
-            )
+            self._unresolvable_identifiers[name_or_symbol] = None
+            raise self._unresolvable_exception(name_or_symbol)
         return result
 
+    def _prefixed_unit(
+        self, prefix_identifier: str, prefix: Prefix, unit_identifier: str
+    ) -> Unit | None:
+        unit = self._unit_by_name(unit_identifier) or self._unit_by_symbol(
+            unit_identifier
+        )
+        if not unit:
+            return None
+        if prefix_identifier == unit_identifier:
+            # For example "mm" (milli-meter). The prefix and the unit can't
+            # both be referenced by the same identifier, so use the value of
+            # the prefix directly.
+            prefix_expr = prefix._expanded_expr()
+            refs = {}
+        else:
+            prefix_expr = unit_graph.Identifier(prefix_identifier)
+            refs = {prefix_expr: prefix}
+        refs[unit_graph.Identifier(unit_identifier)] = unit
+        return Unit(
+            definition=unit_graph.Multiply(
+                prefix_expr, unit_graph.Identifier(unit_identifier)
+            ),
+            identifier_references=refs,
+        )
+
+    @staticmethod
+    def _unresolvable_exception(name_or_symbol: str) -> UnresolvableUnitException:
+        return UnresolvableUnitException(
+            f"Unable to convert the identifier '{name_or_symbol}' into a unit "
+            "in the unit system"
+        )
+
     def unit(self, unit: str) -> Unit | DateUnit:
         unit_expr = parse(unit)
 
@@ -289,4 +441,370 @@ class UnitSystem:
             identifier: self.unit_by_name_or_symbol(identifier.content)
             for identifier in identifiers
         }
-        return _unit_from_expression_and_identifiers(unit_expr, identifier_references)
+        result = _unit_from_expression_and_identifiers(unit_expr, identifier_references)
+        if self._pickle_id is not None:
+            result._origin = (self._pickle_id, unit)
+        return result
+
+    def is_valid(self, unit_string: str) -> bool:
+        """
+        Return whether the given unit string is syntactically valid and
+        resolvable in this unit system.
+
+        This is cheaper than calling :meth:`unit`, and verdicts (including
+        negative ones) are cached.
+
+        """
+        return self._validate(unit_string).is_valid
+
+    def validate_many(self, unit_strings: typing.Iterable[str]) -> list[UnitValidation]:
+        """
+        Validate each of the given unit strings, returning a
+        :class:`UnitValidation` for each. No exception is raised for
+        invalid unit strings; instead the details of the problem are available
+        on the verdict.
+
+        """
+        return [self._validate(unit_string) for unit_string in unit_strings]
+
+    def _validate(self, unit_string: str) -> UnitValidation:
+        verdict = self._validation_cache.get(unit_string)
+        if verdict is None:
+            verdict = self._compute_validation(unit_string)
+            self._validation_cache[unit_string] = verdict
+        return verdict
+
+    def _compute_validation(self, unit_string: str) -> UnitValidation:
+        try:
+            unit_expr = parse(unit_string)
+        except SyntaxError as err:
+            # The syntax error offset refers to a quoted (and stripped) form
+            # of the unit string. Translate it back to the given string.
+            leading_whitespace = len(unit_string) - len(unit_string.lstrip())
+            position = None
+            if err.offset is not None:
+                position = err.offset - 2 + leading_whitespace
+            return UnitValidation(
+                unit_string,
+                False,
+                error_type="syntax",
+                message=err.msg,
+                position=position,
+            )
+
+        identifiers = ExtractIdentifiers().visit(unit_expr)
+        identifier_references = {}
+        for identifier in identifiers:
+            try:
+                identifier_references[identifier] = self.unit_by_name_or_symbol(
+                    identifier.content
+                )
+            except UnresolvableUnitException as err:
+                position = None
+                if identifier.position is not None:
+                    # The position is within the stripped unit string.
+                    leading_whitespace = len(unit_string) - len(unit_string.lstrip())
+                    position = identifier.position + leading_whitespace
+                return UnitValidation(
+                    unit_string,
+                    False,
+                    error_type="unresolvable",
+                    message=str(err),
+                    position=position,
+                )
+
+        # Only shifted units (e.g. dates nested within a unit) and unhandled
+        # content (e.g. an empty unit string) can fail to be constructed once
+        # all of the identifiers are resolved, so we avoid constructing (and
+        # normalising) the unit unless necessary.
+        if _needs_construction(unit_expr):
+            try:
+                _unit_from_expression_and_identifiers(unit_expr, identifier_references)
+            except (ValueError, NotImplementedError) as err:
+                return UnitValidation(
+                    unit_string,
+                    False,
+                    error_type="invalid",
+                    message=str(err),
+                )
+
+        return UnitValidation(unit_string, True)
+
+    def convert_column(
+        self,
+        values,
+        units,
+        to_unit: str | Unit,
+        *,
+        unit_codes: typing.Sequence[str] | None = None,
+        errors: typing.Literal["raise", "mask"] = "raise",
+    ):
+        """
+        Convert an array of values, each of which has its own unit, into a
+        single target unit. This is typical of tabular data, where a column
+        of values is accompanied by a column of unit strings.
+
+        ``units`` is an array of unit strings of the same shape as
+        ``values``. Alternatively, ``units`` may be an array of integer codes
+        which index into the sequence of unit strings given by
+        ``unit_codes``.
+
+        The rows are grouped by unit, such that a converter is built only
+        once for each distinct unit, and each group is converted with a
+        single vectorised operation. The result is a new float array.
+
+        Rows whose unit cannot be converted to the target unit (including
+        unresolvable or invalid unit strings) raise an exception, or, if
+        ``errors`` is ``"mask"``, are masked in the resulting
+        :class:`numpy.ma.MaskedArray`.
+
+        """
+        np = import_numpy()
+
+        if errors not in ("raise", "mask"):
+            raise ValueError(f"Unknown errors mode {errors!r}")
+        if isinstance(to_unit, str):
+            to_unit = self.unit(to_unit)
+
+        values = np.asarray(values)
+        units = np.asarray(units)
+        if values.shape != units.shape:
+            raise ValueError(
+                f"The values have shape {values.shape}, but the units "
+                f"have shape {units.shape}"
+            )
+        flat_values = values.reshape(-1)
+
+        # Group the rows by unit: ``order`` lists the rows of each group in
+        # turn, and ``bounds`` delimits the groups within it.
+        group_keys, group_of_row = np.unique(units.reshape(-1), return_inverse=True)
+        order = np.argsort(group_of_row, kind="stable")
+        bounds = np.concatenate(
+            [[0], np.cumsum(np.bincount(group_of_row, minlength=len(group_keys)))]
+        )
+
+        result = np.empty(flat_values.shape, dtype=np.float64)
+        mask = np.zeros(flat_values.shape, dtype=bool)
+        for group, key in enumerate(group_keys):
+            rows = order[bounds[group] : bounds[group + 1]]
+            unit_string = str(key) if unit_codes is None else unit_codes[key]
+            try:
+                converter = Converter(self.unit(unit_string), to_unit)
+            except (
+                SyntaxError,
+                UnresolvableUnitException,
+                IncompatibleUnitsError,
+                ValueError,
+                # For example, an empty unit string.
+                NotImplementedError,
+            ) as err:
+                if errors == "raise":
+                    raise IncompatibleUnitsError(
+                        f"Unable to convert the unit '{unit_string}' "
+                        f"(of {len(rows)} rows) to {to_unit}"
+                    ) from err
+                mask[rows] = True
+                continue
+            result[rows] = converter.convert(flat_values[rows])
+
+        result = result.reshape(values.shape)
+        if errors == "mask":
+            return np.ma.MaskedArray(result, mask=mask.reshape(values.shape))
+        return result
+
+    def units_with_dimensionality(
+        self, unit: str | Unit | DateUnit
+    ) -> list[ScaledUnit]:
+        """
+        Return all of the named units in the unit system which have the same
+        dimensionality as the given unit (i.e. to which it can be converted
+        directly), along with their scale factors.
+
+        For example, ``units_with_dimensionality("m s-2")`` includes
+        ``standard_free_fall`` with a scale of 9.80665.
+
+        The first call builds an index of all of the named units (resolving
+        any lazily defined units), after which each query is a dictionary
+        lookup. The index is rebuilt if the unit system is modified.
+
+        """
+        if isinstance(unit, str):
+            unit = self.unit(unit)
+        if self._dimensionality_index is None:
+            self._dimensionality_index = self._build_dimensionality_index()
+        return list(self._dimensionality_index.get(_dimensionality_key(unit), []))
+
+    def _build_dimensionality_index(
+        self,
+    ) -> dict[frozenset[tuple[str, int]], list[ScaledUnit]]:
+        units: dict[int, NamedUnit | LazilyDefinedUnit] = {}
+        for lookup in [
+            self._names,
+            self._symbols,
+            self._alias_names,
+            self._alias_symbols,
+        ]:
+            for named_unit in lookup.values():
+                units.setdefault(id(named_unit), named_unit)
+
+        index: dict[frozenset[tuple[str, int]], list[ScaledUnit]] = {}
+        indexed: set[int] = set()
+        for named_unit in units.values():
+            try:
+                if isinstance(named_unit, LazilyDefinedUnit):
+                    named_unit = named_unit.resolve()
+                    self._register_unit(named_unit, replace=True)
+                if id(named_unit) in indexed:
+                    # Already indexed in its resolved form.
+                    continue
+                indexed.add(id(named_unit))
+                key = _dimensionality_key(named_unit)
+                linear_form = named_unit._linear_form()
+            except (SyntaxError, UnresolvableUnitException, ValueError):
+                # Units whose definitions can't be resolved are not indexed.
+                continue
+            name = _primary_name(named_unit._names)
+            scale = None if linear_form is None else float(linear_form.scale)
+            index.setdefault(key, []).append(ScaledUnit(name, named_unit, scale))
+        return index
+
+    def best_display_unit(
+        self,
+        values,
+        unit: str,
+        *,
+        candidates: typing.Iterable[str] | None = None,
+    ):
+        """
+        Choose the most readable unit in which to present each of the given
+        values (which are in the given unit). For example, ``1.2e-6 m`` is
+        best presented as ``1.2 µm``.
+
+        By default, the candidate units are the given unit (which must be
+        the name or symbol of a unit in the system) with each of the prefixes
+        which are a power of 1000 (e.g. ``mm``, ``m``, ``km``). The prefixes
+        of a prefixed unit replace its prefix (e.g. ``g``, ``kg``, ``Mg``
+        for ``kg``). Alternatively,
+        any linear units of the same dimensionality may be given as
+        ``candidates`` (e.g. ``["mm", "m", "km", "au"]``).
+
+        Each value is presented in the candidate unit with the largest scale
+        for which the magnitude of the presented value is at least 1. Zero
+        and non-finite values are presented in the given unit (or the
+        candidate of the next smaller scale, if it is not a candidate).
+
+        Returns the presented values and the corresponding unit strings
+        (arrays of the same shape as ``values``, or a number and a string if
+        ``values`` is a number).
+
+        """
+        np = import_numpy()
+
+        key = (unit, None if candidates is None else tuple(candidates))
+        index = self._display_indices.get(key)
+        if index is None:
+            index = self._display_index(*key)
+            self._display_indices[key] = index
+
+        values_array = np.atleast_1d(np.asarray(values, dtype=np.float64))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_magnitudes = np.log10(np.abs(values_array))
+        # A little tolerance, such that 1000 m (with rounding error) is 1 km.
+        choice = (
+            np.searchsorted(index.log_scales, log_magnitudes + 1e-12, side="right") - 1
+        )
+        np.clip(choice, 0, len(index.log_scales) - 1, out=choice)
+        choice[~np.isfinite(log_magnitudes)] = index.default
+
+        presented = values_array / index.scales[choice]
+        unit_strings = index.unit_strings[choice]
+        if np.ndim(values) == 0:
+            return float(presented[0]), str(unit_strings[0])
+        return presented, unit_strings
+
+    def _unprefixed(
+        self, unit_string: str, unit_form: LinearForm, is_symbol: bool
+    ) -> tuple[str, Fraction]:
+        # The unit (and its scale relative to the given unit) which the given
+        # unit is a prefixed form of, such as "g" for "kg", or the unit itself
+        # if it isn't prefixed. A unit such as "min" is not milli-"in", as the
+        # prefixed form must also be the same unit.
+        from ._expr.rational import as_fraction
+
+        if is_symbol:
+            prefixes = self._prefix_symbols
+            identifiers = {*self._symbols, *self._alias_symbols}
+        else:
+            prefixes = self._prefix_names
+            identifiers = {*self._names, *self._alias_names}
+        for prefix_identifier, prefix in prefixes.items():
+            base = unit_string[len(prefix_identifier) :]
+            if not unit_string.startswith(prefix_identifier) or base not in identifiers:
+                continue
+            base_form = self.unit(base)._linear_form()
+            if (
+                base_form is not None
+                and not base_form.offset
+                and base_form.powers == unit_form.powers
+                and base_form.scale * as_fraction(prefix.value) == unit_form.scale
+            ):
+                return base, base_form.scale / unit_form.scale
+        return unit_string, Fraction(1)
+
+    def _display_index(
+        self, unit_string: str, candidates: tuple[str, ...] | None
+    ) -> _DisplayIndex:
+        import math
+
+        np = import_numpy()
+
+        from ._expr.rational import as_fraction
+
+        unit = self.unit(unit_string)
+        unit_form = unit._linear_form()
+        if unit_form is None or unit_form.offset:
+            raise ValueError(f"The unit '{unit_string}' is not a scaled unit")
+
+        # The candidate units, keyed by their scale relative to the unit.
+        scales: dict[Fraction, str] = {}
+        if candidates is None:
+            is_symbol = (
+                unit_string in self._symbols or unit_string in self._alias_symbols
+            )
+            if not is_symbol and not (
+                unit_string in self._names or unit_string in self._alias_names
+            ):
+                raise ValueError(
+                    f"The unit '{unit_string}' is not the name or symbol of a "
+                    "unit in the system, so candidate display units must be given"
+                )
+            scales[Fraction(1)] = unit_string
+            # Prefixes go on the unprefixed unit, e.g. mg and Mg (not mkg and
+            # Mkg) for kg.
+            base, base_scale = self._unprefixed(unit_string, unit_form, is_symbol)
+            scales.setdefault(base_scale, base)
+            for prefix in self._prefix_names.values():
+                scale = as_fraction(prefix.value)
+                if not _is_power_of_1000(scale):
+                    continue
+                if not is_symbol:
+                    scales.setdefault(scale * base_scale, prefix.name + base)
+                elif prefix.symbols:
+                    scales.setdefault(scale * base_scale, prefix.symbols[0] + base)
+        else:
+            for candidate in candidates:
+                form = self.unit(candidate)._linear_form()
+                if form is None or form.offset or form.powers != unit_form.powers:
+                    raise ValueError(
+                        f"The unit '{candidate}' is not a scaled form of "
+                        f"'{unit_string}'"
+                    )
+                scales.setdefault(form.scale / unit_form.scale, candidate)
+
+        ordered = sorted(scales)
+        return _DisplayIndex(
+            unit_strings=np.array([scales[scale] for scale in ordered]),
+            scales=np.array([float(scale) for scale in ordered]),
+            log_scales=np.array([math.log10(scale) for scale in ordered]),
+            default=max(bisect.bisect_right(ordered, 1) - 1, 0),
+        )
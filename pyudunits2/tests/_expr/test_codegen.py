@@ -0,0 +1,60 @@
+import math
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+from pyudunits2._expr.codegen import compile_program
+from pyudunits2._expr.program import Affine, Exp, Log, Program, Reciprocal
+
+
+@pytest.mark.parametrize(
+    ["steps", "expected_expr", "reference"],
+    [
+        [[], "value", lambda x: x],
+        [[Affine(Fraction(1, 2))], "value * 0.5", lambda x: x / 2],
+        [[Affine(1, Fraction(-5, 2))], "value - 2.5", lambda x: x - 2.5],
+        [
+            [Affine(2, 1), Reciprocal()],
+            "1 / (value * 2.0 + 1.0)",
+            lambda x: 1 / (2 * x + 1),
+        ],
+        [
+            [Affine(1000), Log(10), Affine(10)],
+            "math.log10(value * 1000.0) * 10.0",
+            lambda x: 10 * math.log10(1000 * x),
+        ],
+        [[Exp(10), Affine(3)], "10.0 ** value * 3.0", lambda x: 3 * 10**x],
+        [
+            [Exp(None), Log(2)],
+            "math.log2(math.exp(value))",
+            lambda x: math.log2(math.exp(x)),
+        ],
+    ],
+)
+def test_compile_program(steps, expected_expr, reference):
+    compiled = compile_program(Program.from_steps(steps))
+    assert f"return {expected_expr}\n" in compiled.source
+
+    assert compiled.scalar(1.5) == pytest.approx(reference(1.5))
+
+    values = np.array([0.5, 1, 1.5])
+    result = compiled.array(values)
+    assert result == pytest.approx([reference(v) for v in values])
+
+    out = np.empty(3)
+    assert compiled.array(values, out=out) is out
+    assert out == pytest.approx([reference(v) for v in values])
+
+    for scalar in [1.5, np.float64(1.5), np.array(1.5)]:
+        assert compiled.array(scalar) == pytest.approx(reference(1.5))
+
+
+def test_compile_program__cached():
+    program = Program.from_steps([Affine(3)])
+    assert compile_program(program) is compile_program(Program.from_steps([Affine(3)]))
+
+
+def test_compile_program__identity_passthrough():
+    values = np.arange(3)
+    assert compile_program(Program()).array(values) is values
@@ -0,0 +1,42 @@
+from fractions import Fraction
+
+from pyudunits2._expr.linear import linear_form
+from pyudunits2._grammar import parse
+from pyudunits2._expr import graph as g
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    ["unit_str", "scale", "offset", "powers"],
+    [
+        ["2", Fraction(2), Fraction(0), {}],
+        ["1000·m", Fraction(1000), Fraction(0), {"m": 1}],
+        ["m/s", Fraction(1), Fraction(0), {"m": 1, "s": -1}],
+        ["K @ 273.15", Fraction(1), Fraction(27315, 100), {"K": 1}],
+        ["(K @ 273.15)/2", Fraction(1, 2), Fraction(0), {"K": 1}],
+        ["(K @ 273.15)*2", Fraction(1, 2), Fraction(0), {"K": 1}],
+        ["K/1.8 @ 459.67", Fraction(5, 9), Fraction(45967, 180), {"K": 1}],
+    ],
+)
+def test_linear_form(unit_str, scale, offset, powers):
+    result = linear_form(parse(unit_str))
+    assert result.scale == scale
+    assert result.offset == offset
+    assert result.powers == {
+        g.Identifier(name): order for name, order in powers.items()
+    }
+
+
+@pytest.mark.parametrize(
+    "unit_str",
+    [
+        "lg(re m)",
+        "2 lg(re m)",
+        "(m @ 1) a",  # A non-numeric coefficient in the transformation.
+        "0 m",
+    ],
+)
+def test_linear_form__not_linear(unit_str):
+    with pytest.raises(ValueError):
+        linear_form(parse(unit_str))
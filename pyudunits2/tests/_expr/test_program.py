@@ -0,0 +1,62 @@
+from fractions import Fraction
+
+from pyudunits2._expr.program import (
+    Affine,
+    Exp,
+    Log,
+    Program,
+    Reciprocal,
+    basis_program,
+)
+from pyudunits2._grammar import parse
+from pyudunits2._expr import graph as g
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    ["steps", "expected"],
+    [
+        [[], []],
+        [[Affine(Fraction(1))], []],
+        [[Affine(Fraction(2)), Affine(Fraction(3), Fraction(1))], [Affine(6, 1)]],
+        [[Affine(Fraction(2)), Affine(Fraction(1, 2))], []],
+        [[Exp(10), Log(10)], []],
+        [[Exp(10), Log(2)], [Exp(10), Log(2)]],
+        [[Log(10), Exp(10)], [Log(10), Exp(10)]],
+        [[Reciprocal(), Reciprocal()], []],
+        [[Affine(2), Exp(None), Log(None), Affine(Fraction(1, 2))], []],
+    ],
+)
+def test_program__from_steps(steps, expected):
+    assert Program.from_steps(steps).steps == tuple(expected)
+
+
+def test_program__inverse():
+    program = Program.from_steps([Affine(2, 3), Log(10), Reciprocal()])
+    assert program.inverse().steps == (
+        Reciprocal(),
+        Exp(10),
+        Affine(Fraction(1, 2), Fraction(-3, 2)),
+    )
+    assert program.inverse().then(program).is_identity()
+    # A logarithm followed by an exponential is only an identity for positive
+    # values, so is not folded.
+    assert not program.then(program.inverse()).is_identity()
+
+
+@pytest.mark.parametrize(
+    ["unit_str", "steps", "powers"],
+    [
+        ["1000·m", [Affine(1000)], {"m": 1}],
+        ["K @ 273.15", [Affine(1, Fraction(27315, 100))], {"K": 1}],
+        ["lg(re 1·0.001·W)", [Exp(10), Affine(Fraction(1, 1000))], {"W": 1}],
+        ["2 lb(re m/s)", [Affine(Fraction(1, 2)), Exp(2)], {"m": 1, "s": -1}],
+    ],
+)
+def test_basis_program(unit_str, steps, powers):
+    result = basis_program(parse(unit_str))
+    assert result.program.steps == tuple(steps)
+    assert result.powers == {
+        g.Identifier(name): order for name, order in powers.items()
+    }
@@ -0,0 +1,77 @@
+from decimal import Decimal
+from fractions import Fraction
+
+from pyudunits2._expr.rational import as_fraction, from_fraction, ExactMonomial
+from pyudunits2._grammar import parse
+from pyudunits2._expr import graph as g
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    ["value", "expected"],
+    [
+        [3, Fraction(3)],
+        [Decimal("0.1"), Fraction(1, 10)],
+        [Decimal("1e-3"), Fraction(1, 1000)],
+        ["-2", Fraction(-2)],
+        [Fraction(1, 3), Fraction(1, 3)],
+    ],
+)
+def test_as_fraction(value, expected):
+    assert as_fraction(value) == expected
+
+
+@pytest.mark.parametrize(
+    ["value", "expected"],
+    [
+        [Fraction(4, 2), 2],
+        [Fraction(1, 8), Decimal("0.125")],
+        [Fraction(-3, 1000), Decimal("-0.003")],
+        [Fraction(1, 3), Fraction(1, 3)],
+    ],
+)
+def test_from_fraction(value, expected):
+    result = from_fraction(value)
+    assert result == expected
+    assert type(result) is type(expected)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        # More digits than the (28 digit) precision of the decimal context.
+        Fraction(123456789012345678901234567891, 10**5),
+        Fraction(-123456789012345678901234567891, 2**40),
+    ],
+)
+def test_from_fraction__exact(value):
+    result = from_fraction(value)
+    assert isinstance(result, Decimal)
+    assert as_fraction(result) == value
+
+
+@pytest.mark.parametrize(
+    ["unit_str", "scale", "powers"],
+    [
+        ["2", Fraction(2), {}],
+        ["0.1 0.1 0.1", Fraction(1, 1000), {}],
+        ["1e-3 m", Fraction(1, 1000), {"m": 1}],
+        ["m/s", Fraction(1), {"m": 1, "s": -1}],
+        ["(2 m)^-2", Fraction(1, 4), {"m": -2}],
+        ["7·24·60·60·s/(14·24·60·60·s)", Fraction(1, 2), {}],
+        ["3 m² s⁻¹", Fraction(3), {"m": 2, "s": -1}],
+    ],
+)
+def test_exact_monomial(unit_str, scale, powers):
+    result = ExactMonomial().visit(parse(unit_str))
+    assert result.scale == scale
+    assert result.powers == {
+        g.Identifier(name): order for name, order in powers.items()
+    }
+
+
+@pytest.mark.parametrize("unit_str", ["m @ 2", "lg(re m)"])
+def test_exact_monomial__unsupported(unit_str):
+    with pytest.raises(ValueError, match="Unable to represent"):
+        ExactMonomial().visit(parse(unit_str))
@@ -1,3 +1,4 @@
+from pyudunits2._expr.graph import Number
 from pyudunits2._expr.sympy import ToSympy
 
 
@@ -42,3 +43,18 @@ def test_to_sympy(unit_str: str, sympy_expr: str):
     result = ToSympy().visit(expr)
     assert isinstance(result, sympy.core.expr.Expr)
     assert str(result) == str(sympy_parse(sympy_expr))
+
+
+@pytest.mark.parametrize(
+    ["content", "expected"],
+    [
+        ["2", sympy.Integer(2)],
+        ["-3", sympy.Integer(-3)],
+        ["0.5", sympy.Rational(1, 2)],
+        ["1.25", sympy.Rational(5, 4)],
+    ],
+)
+def test_to_sympy__string_number(content: str, expected):
+    result = ToSympy().visit(Number(content, raw_content=content))
+    assert result == expected
+    assert type(result) is type(expected)
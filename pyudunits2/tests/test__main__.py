@@ -1,6 +1,21 @@
+import functools
+import io
+import json
+import os
+import socket
 import textwrap
+import threading
+
 import pytest
-from pyudunits2.__main__ import main
+
+from pyudunits2 import UnitSystem, _server
+from pyudunits2.__main__ import COMMANDS, _checked, main
+
+
+@pytest.fixture(autouse=True)
+def no_server(monkeypatch):
+    # Ensure that the tests are not affected by a running server.
+    monkeypatch.setenv(_server.NO_SERVER_ENV, "1")
 
 
 def test__explain_unit(monkeypatch, capsys):
@@ -53,3 +68,290 @@ def test__conversion_expr__impossible(monkeypatch, capsys):
     """).strip()
     assert err == ""
     assert out.strip() == expected_output
+
+
+def test__convert__value(monkeypatch, capsys):
+    monkeypatch.setattr("sys.argv", ["pyudunits2", "convert", "10", "km", "m"])
+    main()
+    out, err = capsys.readouterr()
+    assert err == ""
+    assert out == "10000.0\n"
+
+
+def test__convert__stdin(monkeypatch, capsys):
+    monkeypatch.setattr(
+        "sys.argv", ["pyudunits2", "convert", "km", "m", "--block-size", "2"]
+    )
+    monkeypatch.setattr("sys.stdin", io.StringIO("1\n2.5\n\n-3\n0.001\n"))
+    main()
+    out, err = capsys.readouterr()
+    assert err == ""
+    assert out == "1000.0\n2500.0\n-3000.0\n1.0\n"
+
+
+def test__convert__csv_files(monkeypatch, capsys, tmp_path):
+    for name, content in [("a.csv", "t,T\n0,0\n1,10\n"), ("b.csv", "t,T\n2,20\n")]:
+        (tmp_path / name).write_text(content)
+    monkeypatch.setattr(
+        "sys.argv",
+        [
+            "pyudunits2",
+            "convert",
+            "degC",
+            "K",
+            *["-i", str(tmp_path / "a.csv"), "-i", str(tmp_path / "b.csv")],
+            *["--column", "2", "--skip-rows", "1", "--format", "%.2f"],
+        ],
+    )
+    main()
+    out, err = capsys.readouterr()
+    assert err == ""
+    assert out == "273.15\n283.15\n293.15\n"
+
+
+def test__convert__invalid_input(monkeypatch, capsys):
+    monkeypatch.setattr("sys.argv", ["pyudunits2", "convert", "km", "m"])
+    monkeypatch.setattr("sys.stdin", io.StringIO("1\none\n"))
+    with pytest.raises(SystemExit) as exc:
+        main()
+    assert exc.value.code == 1
+    out, err = capsys.readouterr()
+    assert "Unable to read the values to convert" in err
+
+
+def test__convert__impossible(monkeypatch, capsys):
+    monkeypatch.setattr("sys.argv", ["pyudunits2", "convert", "1", "mg", "meters"])
+    with pytest.raises(SystemExit) as exc:
+        main()
+    assert exc.value.code == 1
+    out, err = capsys.readouterr()
+    assert out.strip() == 'It is not possible to convert from "mg" to "meters"'
+
+
+def test__explain_unit__batch(monkeypatch, capsys):
+    monkeypatch.setattr("sys.argv", ["pyudunits2", "explain-unit"])
+    monkeypatch.setattr("sys.stdin", io.StringIO("degC\n\nnot_a_unit\ndegC\n"))
+    main()
+    out, err = capsys.readouterr()
+    assert err == ""
+    records = [json.loads(line) for line in out.splitlines()]
+    assert records[0] == {
+        "unit": "degC",
+        "name": "degC",
+        "basis_form": "(kelvin @ 273.15)",
+        "dimensionality": {"kelvin": 1},
+        "scale": 1.0,
+        "offset": 273.15,
+    }
+    assert records[1]["unit"] == "not_a_unit"
+    assert records[1]["error"].startswith("UnresolvableUnitException")
+    assert records[2] == records[0]
+
+
+@pytest.mark.parametrize(
+    ["unit", "scale", "offset"],
+    [
+        # Dimensionless basis units.
+        ["rad", 1.0, 0.0],
+        ["sr", 1.0, 0.0],
+        ["degree", 0.017453292519943295, 0.0],
+        ["percent", 0.01, 0.0],
+        ["lg(re m)", None, None],
+        ["days since 2000-01-01", 86400.0, 0.0],
+    ],
+)
+def test__explain_unit__batch_coefficients(monkeypatch, capsys, unit, scale, offset):
+    monkeypatch.setattr("sys.argv", ["pyudunits2", "explain-unit"])
+    monkeypatch.setattr("sys.stdin", io.StringIO(f"{unit}\n"))
+    main()
+    [record] = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert "error" not in record
+    assert record["scale"] == pytest.approx(scale)
+    assert record["offset"] == offset
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test__conversion_expr__batch(monkeypatch, capsys, tmp_path, jobs):
+    path = tmp_path / "pairs.csv"
+    path.write_text("mg,kg\ndegC,degF\nm/s,s/m\nmg,m\n")
+    monkeypatch.setattr(
+        "sys.argv",
+        ["pyudunits2", "conversion-expr", "--input", str(path), "--jobs", jobs],
+    )
+    main()
+    out, err = capsys.readouterr()
+    assert err == ""
+    records = [json.loads(line) for line in out.splitlines()]
+    assert [(r["from_unit"], r["to_unit"]) for r in records] == [
+        ("mg", "kg"),
+        ("degC", "degF"),
+        ("m/s", "s/m"),
+        ("mg", "m"),
+    ]
+    assert records[0]["scale"] == pytest.approx(1e-6)
+    assert (records[1]["scale"], records[1]["offset"]) == (1.8, 32)
+    # Non-affine conversions have no coefficients.
+    assert records[2]["expression"] == "1/value"
+    assert records[2]["scale"] is None
+    assert records[3]["convertible"] is False
+
+
+def test__conversion_expr__batch_invalid(monkeypatch, capsys):
+    monkeypatch.setattr("sys.argv", ["pyudunits2", "conversion-expr"])
+    monkeypatch.setattr("sys.stdin", io.StringIO("mg\nmg,kg\nm,km,s\n"))
+    main()
+    out, err = capsys.readouterr()
+    assert err == ""
+    records = [json.loads(line) for line in out.splitlines()]
+    assert records[0] == {
+        "from_unit": "mg",
+        "to_unit": None,
+        "error": "Expected 2 fields, got 1: ('mg',)",
+    }
+    # The malformed lines do not prevent the rest of the batch.
+    assert records[1]["scale"] == pytest.approx(1e-6)
+    assert records[2]["error"] == "Expected 2 fields, got 3: ('m', 'km', 's')"
+
+
+@pytest.fixture
+def server(monkeypatch, tmp_path):
+    path = str(tmp_path / "pyudunits2.sock")
+    unit_system = UnitSystem.from_udunits2_xml()
+    commands = {
+        name: functools.partial(_checked(command), unit_system)
+        for name, command in COMMANDS.items()
+    }
+    server = _server.create_server(path, commands)
+    thread = threading.Thread(target=_server.serve, args=(server,), daemon=True)
+    thread.start()
+    monkeypatch.delenv(_server.NO_SERVER_ENV)
+    monkeypatch.setenv(_server.SOCKET_ENV, path)
+    yield path
+    server.shutdown()
+    thread.join()
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["explain-unit", "mg"],
+        ["conversion-expr", "m/s", "s/m"],
+        ["convert", "10", "km", "m"],
+    ],
+)
+def test__serve(monkeypatch, capsys, server, argv):
+    monkeypatch.setattr("sys.argv", ["pyudunits2", *argv])
+    monkeypatch.setenv(_server.NO_SERVER_ENV, "1")
+    main()
+    expected = capsys.readouterr()
+
+    monkeypatch.delenv(_server.NO_SERVER_ENV)
+    assert _server.request(argv[0], {}) is None  # Missing arguments.
+    main()
+    assert capsys.readouterr() == expected
+
+
+def test__serve__exit_code(monkeypatch, capsys, server):
+    assert _server.request("conversion-expr", {"from_unit": "mg", "to_unit": "m"}) == (
+        'It is not possible to convert from "mg" to "m"',
+        1,
+    )
+    monkeypatch.setattr("sys.argv", ["pyudunits2", "conversion-expr", "mg", "m"])
+    with pytest.raises(SystemExit) as exc:
+        main()
+    assert exc.value.code == 1
+
+
+@pytest.mark.parametrize(
+    ["argv", "error"],
+    [
+        [["convert", "abc", "m", "km"], "ValueError: could not convert"],
+        [["explain-unit", "not_a_unit"], "UnresolvableUnitException: "],
+        [["conversion-expr", "m^", "m"], "SyntaxError: "],
+    ],
+)
+def test__serve__input_error(monkeypatch, capsys, server, argv, error):
+    def no_local_fallback():
+        raise AssertionError("The command was run again without the server")
+
+    monkeypatch.setattr(UnitSystem, "from_udunits2_xml", no_local_fallback)
+    monkeypatch.setattr("sys.argv", ["pyudunits2", *argv])
+    with pytest.raises(SystemExit) as exc:
+        main()
+    assert exc.value.code == 1
+    out, err = capsys.readouterr()
+    assert out == ""
+    assert err.startswith(error)
+
+
+@pytest.mark.parametrize(
+    ["argv", "error"],
+    [
+        [["convert", "abc", "m", "km"], "ValueError: could not convert"],
+        [["explain-unit", "not_a_unit"], "UnresolvableUnitException: "],
+        [["convert", "m", "not_a_unit"], "UnresolvableUnitException: "],
+    ],
+)
+def test__input_error(capsys, monkeypatch, argv, error):
+    monkeypatch.setattr("sys.argv", ["pyudunits2", *argv])
+    with pytest.raises(SystemExit) as exc:
+        main()
+    assert exc.value.code == 1
+    out, err = capsys.readouterr()
+    assert out == ""
+    assert err.startswith(error)
+
+
+def test__serve__already_running(server):
+    with pytest.raises(RuntimeError, match="already running"):
+        _server.create_server(server, COMMANDS)
+
+
+def test__serve__stale_socket(monkeypatch, tmp_path):
+    path = str(tmp_path / "stale.sock")
+    monkeypatch.delenv(_server.NO_SERVER_ENV)
+    assert _server.request("explain-unit", {"unit": "m"}, path) is None
+    server = _server.create_server(path, COMMANDS)
+    server.server_close()  # Leaves the socket file behind.
+    assert _server.request("explain-unit", {"unit": "m"}, path) is None
+    # The stale socket is replaced by a new server.
+    _server.create_server(path, COMMANDS).server_close()
+
+
+def test__serve__not_a_socket(monkeypatch, tmp_path):
+    path = tmp_path / "not-a-socket"
+    path.write_text("precious")
+    monkeypatch.delenv(_server.NO_SERVER_ENV)
+    assert _server.request("explain-unit", {"unit": "m"}, str(path)) is None
+    with pytest.raises(RuntimeError, match="not a socket of the current user"):
+        _server.create_server(str(path), COMMANDS)
+    # It is not replaced.
+    assert path.read_text() == "precious"
+
+
+def test__serve__private_directory(monkeypatch, tmp_path):
+    monkeypatch.delenv(_server.SOCKET_ENV, raising=False)
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    monkeypatch.setattr("tempfile.gettempdir", lambda: str(tmp_path))
+    path = _server.socket_path()
+    directory = os.path.dirname(path)
+    assert os.path.dirname(directory) == str(tmp_path)
+
+    _server.create_server(path, COMMANDS).server_close()
+    assert os.stat(directory).st_mode & 0o777 == 0o700
+
+    # A directory which is accessible by others is not used.
+    os.unlink(path)
+    os.chmod(directory, 0o777)
+    with pytest.raises(RuntimeError, match="not a directory which is private"):
+        _server.create_server(path, COMMANDS)
+
+
+def test__serve__idle_connection(monkeypatch, server):
+    monkeypatch.setattr(_server._RequestHandler, "timeout", 0.1)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as idle:
+        idle.connect(server)
+        # A request without a newline, which would otherwise block the server.
+        idle.sendall(b'{"command": ')
+        monkeypatch.setattr(_server, "TIMEOUT", 5)
+        assert _server.request("conversion-expr", {"from_unit": "m", "to_unit": "km"})
@@ -0,0 +1,141 @@
+import json
+import sys
+import textwrap
+
+import pytest
+
+from pyudunits2 import _bench
+from pyudunits2.__main__ import main
+
+
+@pytest.fixture
+def benchmark_dir(tmp_path):
+    directory = tmp_path / "example_benchmarks"
+    directory.mkdir()
+    (directory / "__init__.py").write_text("")
+    (directory / "suite.py").write_text(
+        textwrap.dedent("""
+            class Sum:
+                params = [[10, 100], ["list", "range"]]
+                param_names = ["size", "container"]
+
+                def setup(self, size, container):
+                    if container == "range" and size == 100:
+                        raise NotImplementedError
+                    self.values = list(range(size))
+
+                def time_sum(self, size, container):
+                    sum(self.values)
+
+                def timeraw_import(self, size, container):
+                    return "import json"
+
+
+            class Fixed:
+                number = 3
+                repeat = 2
+
+                def time_nothing(self):
+                    pass
+
+
+            def time_function():
+                pass
+        """)
+    )
+    yield directory
+    # Each test has its own (freshly imported) benchmarks package.
+    for name in list(sys.modules):
+        if name.partition(".")[0] == directory.name:
+            del sys.modules[name]
+
+
+def test_discover(benchmark_dir):
+    benchmarks = _bench.discover(benchmark_dir)
+    assert [benchmark.name for benchmark in benchmarks] == [
+        "suite.Fixed.time_nothing",
+        "suite.Sum.time_sum",
+        "suite.Sum.timeraw_import",
+        "suite.time_function",
+    ]
+    assert benchmarks[1].param_names == ["size", "container"]
+    assert [b.name for b in _bench.discover(benchmark_dir, "Sum.time_")] == [
+        "suite.Sum.time_sum"
+    ]
+
+
+def test_discover__not_a_package(tmp_path):
+    with pytest.raises(ValueError, match="is not a benchmarks package"):
+        _bench.discover(tmp_path)
+
+
+def test_run(benchmark_dir):
+    fixed, sum_, raw, function = _bench.discover(benchmark_dir)
+
+    [result] = _bench.run(fixed)
+    assert result["params"] == {}
+    assert result["number"] == 3
+    assert len(result["samples"]) == 2
+
+    results = _bench.run(sum_, quick=True)
+    assert [result["params"] for result in results] == [
+        {"size": "10", "container": "'list'"},
+        {"size": "10", "container": "'range'"},
+        {"size": "100", "container": "'list'"},
+        {"size": "100", "container": "'range'"},
+    ]
+    assert results[3] == {"params": results[3]["params"], "skipped": True}
+    assert len(results[0]["samples"]) == 1
+    # Enough calls are made for each sample to be measurable.
+    assert results[0]["number"] * results[0]["median"] >= _bench.SAMPLE_TIME / 10
+
+    [result, *_] = _bench.run(raw, quick=True)
+    assert result["number"] == 1
+    assert 0 < result["median"] < 10
+
+
+def test_compare(benchmark_dir):
+    benchmarks = _bench.discover(benchmark_dir, "Fixed|Sum.time_sum")
+    baseline = _bench.run_all(benchmarks, quick=True)
+    results = json.loads(json.dumps(baseline))
+    results["results"]["suite.Fixed.time_nothing"][0]["median"] *= 2
+    comparison = {
+        name: ratio for name, _, _, ratio in _bench.compare(baseline, results)
+    }
+    assert comparison["suite.Fixed.time_nothing"] == pytest.approx(2)
+    assert comparison["suite.Sum.time_sum(size=10, container='list')"] == 1
+    # Skipped benchmarks are not compared.
+    assert len(comparison) == 4
+
+    with pytest.raises(ValueError, match="Unsupported results version"):
+        _bench.compare({"version": 0}, results)
+
+
+def test_bench_cli(monkeypatch, capsys, benchmark_dir, tmp_path):
+    output = tmp_path / "results.json"
+    monkeypatch.setattr(
+        "sys.argv",
+        [
+            "pyudunits2",
+            "bench",
+            "--benchmark-dir",
+            str(benchmark_dir),
+            "--bench",
+            "function",
+            "--quick",
+            "--output",
+            str(output),
+        ],
+    )
+    main()
+    out, err = capsys.readouterr()
+    assert out == ""
+    assert "suite.time_function: " in err
+    results = json.loads(output.read_text())
+    assert results["version"] == _bench.RESULTS_VERSION
+    assert list(results["results"]) == ["suite.time_function"]
+
+
+@pytest.mark.parametrize("value, expected", [(12.5, "12.5s"), (0.00123, "1.23ms")])
+def test_format_time(value, expected):
+    assert _bench.format_time(value) == expected
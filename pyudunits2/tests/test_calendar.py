@@ -0,0 +1,167 @@
+import datetime
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+from pyudunits2._calendar import (
+    calendar_engine,
+    canonical_calendar,
+    fields_from_microseconds,
+    microseconds_from_fields,
+    seconds_since_epoch,
+)
+from pyudunits2._datetime import DateTime, Time
+
+
+def days_from_civil(year, month, day):
+    # The number of days since 1970-01-01 of the given proleptic Gregorian
+    # date(s).
+    return calendar_engine("proleptic_gregorian").days_from_date(year, month, day)
+
+
+@pytest.mark.parametrize(
+    "date",
+    [
+        datetime.date(1970, 1, 1),
+        datetime.date(2000, 2, 29),
+        datetime.date(2000, 3, 1),
+        datetime.date(1900, 3, 1),
+        datetime.date(1, 1, 1),
+        datetime.date(1582, 10, 15),
+        datetime.date(9999, 12, 31),
+    ],
+)
+def test_days_from_civil(date: datetime.date):
+    expected = date.toordinal() - datetime.date(1970, 1, 1).toordinal()
+    assert days_from_civil(date.year, date.month, date.day) == expected
+
+
+def test_days_from_civil__vectorised():
+    dates = [
+        datetime.date(1600, 1, 1) + datetime.timedelta(days=n)
+        for n in range(0, 200_000, 37)
+    ]
+    years = np.array([date.year for date in dates])
+    months = np.array([date.month for date in dates])
+    days = np.array([date.day for date in dates])
+    expected = [
+        date.toordinal() - datetime.date(1970, 1, 1).toordinal() for date in dates
+    ]
+    np.testing.assert_array_equal(days_from_civil(years, months, days), expected)
+
+
+def test_days_from_civil__negative_year():
+    # Year 0 is a leap year in the proleptic Gregorian calendar.
+    assert days_from_civil(1, 1, 1) - days_from_civil(0, 1, 1) == 366
+    assert days_from_civil(0, 1, 1) - days_from_civil(-1, 1, 1) == 365
+
+
+@pytest.mark.parametrize(
+    ["date_time", "expected"],
+    [
+        [DateTime(1970, 1, 1), 0],
+        [DateTime(2000, 1, 1), 946_684_800],
+        [DateTime(2000, 1, 1, Time(12, 30, 15, 500_000)), Fraction(946_729_815_5, 10)],
+        [DateTime(2000, 1, 1, tz_offset=Time(10, 0)), 946_684_800 - 36_000],
+        [DateTime(2000, 1, 1, tz_offset=Time(-5, 30)), 946_684_800 + 19_800],
+    ],
+)
+def test_seconds_since_epoch(date_time: DateTime, expected):
+    assert seconds_since_epoch(date_time, "standard") == expected
+
+
+def test_seconds_since_epoch__before_reform():
+    # The standard calendar is Julian before the Gregorian reform.
+    date_time = DateTime(1582, 10, 4)
+    assert seconds_since_epoch(date_time, "standard") == (
+        seconds_since_epoch(DateTime(1582, 10, 15), "standard") - 86400
+    )
+    assert seconds_since_epoch(date_time, "proleptic_gregorian") == (
+        days_from_civil(1582, 10, 4) * 86400
+    )
+
+
+@pytest.mark.parametrize(
+    ["calendar", "date", "expected"],
+    [
+        ["noleap", (1970, 3, 1), 59],
+        ["noleap", (1971, 1, 1), 365],
+        ["noleap", (1969, 12, 31), -1],
+        ["all_leap", (1970, 3, 1), 60],
+        ["all_leap", (1971, 1, 1), 366],
+        ["360_day", (1970, 2, 30), 59],
+        ["360_day", (1971, 1, 1), 360],
+        ["360_day", (1969, 12, 30), -1],
+        ["julian", (1969, 12, 19), 0],
+        ["julian", (1582, 10, 4), -141_428],
+        ["standard", (1582, 10, 4), -141_428],
+        ["standard", (1582, 10, 15), -141_427],
+        # There is no year 0 in the standard and julian calendars.
+        ["standard", (1, 1, 1), -719_164],
+        ["standard", (-1, 1, 1), -719_530],
+        ["proleptic_gregorian", (0, 1, 1), -719_528],
+    ],
+)
+def test_calendar_engine(calendar, date, expected):
+    engine = calendar_engine(calendar)
+    assert engine.days_from_date(*date) == expected
+    assert engine.date_from_days(expected) == date
+
+
+@pytest.mark.parametrize(
+    ["date", "expected"],
+    [
+        # As in udunits2, year 0 is taken to be year 1 (and so is not a leap
+        # year).
+        [(0, 1, 1), -719_164],
+        [(0, 12, 31), -718_800],
+        [(0, 2, 29), -719_105],
+    ],
+)
+@pytest.mark.parametrize("calendar", ["standard", "julian"])
+def test_calendar_engine__year_zero(calendar, date, expected):
+    engine = calendar_engine(calendar)
+    assert engine.days_from_date(*date) == expected
+    year, month, day = (np.array([field, field]) for field in date)
+    np.testing.assert_array_equal(
+        engine.days_from_date(year, month, day), [expected, expected]
+    )
+
+
+@pytest.mark.parametrize(
+    "calendar",
+    ["standard", "proleptic_gregorian", "julian", "noleap", "all_leap", "360_day"],
+)
+def test_calendar_engine__vectorised(calendar):
+    engine = calendar_engine(calendar)
+    days = np.arange(-800_000, 800_000, 7)
+    year, month, day = engine.date_from_days(days)
+    np.testing.assert_array_equal(engine.days_from_date(year, month, day), days)
+    # Consecutive days have consecutive dates.
+    ordered = (year * 100 + month) * 100 + day
+    assert np.all(np.diff(ordered) > 0)
+    assert engine.date_from_days(int(days[5])) == (year[5], month[5], day[5])
+
+
+def test_fields_from_microseconds():
+    microseconds = np.array([0, -1, 86_400_000_000 * 59 + 3_723_000_004])
+    fields = fields_from_microseconds(microseconds, "noleap")
+    np.testing.assert_array_equal(fields.year, [1970, 1969, 1970])
+    np.testing.assert_array_equal(fields.month, [1, 12, 3])
+    np.testing.assert_array_equal(fields.day, [1, 31, 1])
+    np.testing.assert_array_equal(fields.hour, [0, 23, 1])
+    np.testing.assert_array_equal(fields.minute, [0, 59, 2])
+    np.testing.assert_array_equal(fields.second, [0, 59, 3])
+    np.testing.assert_array_equal(fields.microsecond, [0, 999_999, 4])
+    np.testing.assert_array_equal(
+        microseconds_from_fields(fields, "noleap"), microseconds
+    )
+
+
+def test_canonical_calendar():
+    assert canonical_calendar("Gregorian") == "standard"
+    assert canonical_calendar("365_day") == "noleap"
+    assert canonical_calendar("366_day") == "all_leap"
+    with pytest.raises(ValueError, match="Unsupported calendar 'other'"):
+        canonical_calendar("other")
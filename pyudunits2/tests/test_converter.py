@@ -1,6 +1,9 @@
-from pyudunits2 import UnitSystem
+from pyudunits2 import IncompatibleUnitsError, UnitSystem
 from pyudunits2._unit import Converter
 
+import subprocess
+import sys
+import textwrap
 
 import numpy as np
 import pytest
@@ -100,3 +103,454 @@ def test_numpy_array_conversion(
     result = converter.convert(input_value)
 
     assert result == pytest.approx(expected_value)
+
+
+@pytest.mark.parametrize(
+    ["unit_from", "unit_to", "has_program"],
+    [
+        ["m", "km", True],
+        ["degC", "K", True],
+        ["m/s", "s/m", True],
+        ["lg(re m)", "m", True],
+        ["watt", "dBm", True],
+        # Non-numeric coefficients in the transformation fall back to sympy.
+        ["lg(re m) s", "m", False],
+    ],
+)
+def test_conversion_program(
+    simple_unit_system: UnitSystem, unit_from: str, unit_to: str, has_program: bool
+):
+    unit1 = simple_unit_system.unit(unit_from)
+    unit2 = simple_unit_system.unit(unit_to)
+    converter = Converter(unit1, unit2)
+    assert (converter._program is not None) is has_program
+
+
+def test_conversion__no_sympy_import():
+    code = textwrap.dedent("""
+        import sys
+        from pyudunits2 import UnitSystem, Converter
+
+        system = UnitSystem.from_udunits2_xml()
+        degC, degF = system.unit("degC"), system.unit("degF")
+        assert Converter(degC, degF).convert(10.0) == 50.0
+        assert degC != degF
+        m, lg_m = system.unit("m"), system.unit("lg(re m)")
+        assert Converter(m, lg_m).convert(100.0) == 2.0
+        assert "sympy" not in sys.modules
+    """)
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+@pytest.mark.parametrize(
+    ["unit_from", "unit_to", "expected"],
+    [
+        ["m", "km", 0.01],
+        ["degC", "K", 283.15],
+        ["m/s", "s/m", 0.1],
+        ["lg(re m)", "m", 1e10],
+        ["watt", "dBm", 40.0],
+    ],
+)
+def test_convert_scalar(
+    simple_unit_system: UnitSystem, unit_from: str, unit_to: str, expected: float
+):
+    unit1 = simple_unit_system.unit(unit_from)
+    unit2 = simple_unit_system.unit(unit_to)
+    converter = Converter(unit1, unit2)
+    result = converter.convert_scalar(10.0)
+    assert type(result) is float
+    assert result == pytest.approx(expected)
+    assert converter.convert(10.0) == result
+
+
+@pytest.mark.parametrize(
+    ["unit_from", "unit_to", "value", "expected"],
+    [
+        # Outside the domain of the log.
+        ["m", "ln(re 1 m)", -2.0, np.nan],
+        ["m", "lg(re m)", 0.0, -np.inf],
+        # Overflows a float.
+        ["dBm", "W", 1e6, np.inf],
+        ["m/s", "s/m", 0, np.inf],
+    ],
+)
+def test_convert_scalar__out_of_range(
+    simple_unit_system: UnitSystem,
+    unit_from: str,
+    unit_to: str,
+    value: float,
+    expected: float,
+):
+    unit1 = simple_unit_system.unit(unit_from)
+    unit2 = simple_unit_system.unit(unit_to)
+    converter = Converter(unit1, unit2)
+    with np.errstate(all="ignore"):
+        result = converter.convert(value)
+    # As for an array of values.
+    np.testing.assert_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    ["unit_from", "unit_to", "is_identity", "scale", "offset"],
+    [
+        ["m", "meter", True, 1.0, 0.0],
+        ["m/m", "1", True, 1.0, 0.0],
+        ["1000 m", "km", True, 1.0, 0.0],
+        ["m", "km", False, 0.001, 0.0],
+        ["degC", "K", False, 1.0, 273.15],
+        ["lg(re m)", "m", False, None, None],
+        ["m/s", "s/m", False, None, None],
+        ["lg(re m) s", "m", False, None, None],
+    ],
+)
+def test_converter__linear_coefficients(
+    simple_unit_system: UnitSystem,
+    unit_from: str,
+    unit_to: str,
+    is_identity: bool,
+    scale: float | None,
+    offset: float | None,
+):
+    unit1 = simple_unit_system.unit(unit_from)
+    unit2 = simple_unit_system.unit(unit_to)
+    converter = Converter(unit1, unit2)
+    assert converter.is_identity is is_identity
+    assert converter.is_linear is (scale is not None)
+    assert converter.scale == scale
+    assert converter.offset == offset
+
+
+def test_convert__identity_passthrough(simple_unit_system: UnitSystem):
+    converter = Converter(
+        simple_unit_system.unit("m/m"),
+        simple_unit_system.unit("1"),
+    )
+    values = np.arange(5.0)
+    assert converter.convert(values) is values
+
+    out = np.empty_like(values)
+    assert converter.convert(values, out=out) is out
+    np.testing.assert_array_equal(out, values)
+
+
+@pytest.mark.parametrize(
+    ["unit_from", "unit_to"],
+    [
+        ["m", "km"],
+        ["degC", "K"],
+        ["lg(re m)", "m"],
+    ],
+)
+def test_convert__in_place(
+    simple_unit_system: UnitSystem, unit_from: str, unit_to: str
+):
+    converter = Converter(
+        simple_unit_system.unit(unit_from),
+        simple_unit_system.unit(unit_to),
+    )
+    values = np.array([1.0, 2.0, 3.0])
+    expected = converter.convert(values)
+
+    result = converter.convert(values, out=values)
+    assert result is values
+    np.testing.assert_allclose(values, expected)
+
+
+@pytest.mark.parametrize(
+    ["unit_from", "unit_to"],
+    [
+        ["m", "m"],
+        ["m", "km"],
+        ["degC", "K"],
+        ["lg(re m)", "m"],
+        ["m/s", "s/m"],
+    ],
+)
+@pytest.mark.parametrize("dtype", [np.float64, np.float32, np.int64])
+def test_convert__threads(
+    simple_unit_system: UnitSystem,
+    monkeypatch: pytest.MonkeyPatch,
+    unit_from: str,
+    unit_to: str,
+    dtype,
+):
+    from pyudunits2 import _parallel
+
+    # Use small blocks, so that there are many of them.
+    monkeypatch.setattr(_parallel, "BLOCK_SIZE", 7)
+    converter = Converter(
+        simple_unit_system.unit(unit_from),
+        simple_unit_system.unit(unit_to),
+    )
+    values = np.arange(1, 101, dtype=dtype).reshape(4, 25)
+    expected = converter.convert(values)
+
+    result = converter.convert(values, threads=3)
+    assert result.dtype == expected.dtype
+    np.testing.assert_array_equal(result, expected)
+
+    out = np.empty(values.shape, dtype=expected.dtype)
+    assert converter.convert(values, out=out, threads=3) is out
+    np.testing.assert_array_equal(out, expected)
+
+
+def test_convert__threads_non_contiguous(
+    simple_unit_system: UnitSystem, monkeypatch: pytest.MonkeyPatch
+):
+    from pyudunits2 import _parallel
+
+    monkeypatch.setattr(_parallel, "BLOCK_SIZE", 7)
+    converter = Converter(
+        simple_unit_system.unit("m"),
+        simple_unit_system.unit("km"),
+    )
+    values = np.arange(200.0)[::2]
+    result = converter.convert(values, threads=3)
+    np.testing.assert_allclose(result, values / 1000)
+
+
+@pytest.mark.parametrize(
+    ["unit_from", "unit_to"],
+    [["m", "km"], ["lg(re m)", "m"], ["m/s", "s/m"]],
+)
+def test_convert__processes(
+    simple_unit_system: UnitSystem,
+    monkeypatch: pytest.MonkeyPatch,
+    unit_from: str,
+    unit_to: str,
+):
+    from pyudunits2 import _parallel
+
+    monkeypatch.setattr(_parallel, "BLOCK_SIZE", 7)
+    converter = Converter(
+        simple_unit_system.unit(unit_from),
+        simple_unit_system.unit(unit_to),
+    )
+    # A non-contiguous input.
+    values = np.arange(1, 201, dtype=np.float32).reshape(10, 20)[:, ::2] / 100
+    expected = converter.convert(values)
+
+    result = converter.convert(values, processes=2)
+    assert result.dtype == expected.dtype
+    np.testing.assert_array_equal(result, expected)
+
+    out = np.empty(values.shape, dtype=expected.dtype)
+    assert converter.convert(values, out=out, processes=2) is out
+    np.testing.assert_array_equal(out, expected)
+
+
+def test_convert__processes_shared_arrays(
+    simple_unit_system: UnitSystem, monkeypatch: pytest.MonkeyPatch
+):
+    from pyudunits2 import SharedArrays, _parallel
+
+    monkeypatch.setattr(_parallel, "BLOCK_SIZE", 7)
+    allocations = []
+    empty = SharedArrays.empty
+
+    def counting_empty(self, shape, dtype=float):
+        allocations.append(shape)
+        return empty(self, shape, dtype)
+
+    monkeypatch.setattr(SharedArrays, "empty", counting_empty)
+    converter = Converter(
+        simple_unit_system.unit("lg(re m)"),
+        simple_unit_system.unit("m"),
+    )
+    with SharedArrays() as shared:
+        values = shared.empty((10, 20), dtype=np.float32)
+        values[...] = np.arange(200).reshape(10, 20) / 100
+        out = shared.empty((8, 20))
+        # A view at an offset into the shared memory.
+        expected = converter.convert(values[2:])
+        assert converter.convert(values[2:], out=out, processes=2) is out
+        np.testing.assert_array_equal(out, expected)
+        # Neither the values nor the result were copied.
+        assert allocations == [(10, 20), (8, 20)]
+        del values, out
+    assert not _parallel._SHARED_MEMORIES
+
+
+def test_convert__threads_and_processes(simple_unit_system: UnitSystem):
+    converter = Converter(
+        simple_unit_system.unit("m"),
+        simple_unit_system.unit("km"),
+    )
+    with pytest.raises(ValueError, match="Only one of threads and processes"):
+        converter.convert(np.arange(10.0), threads=2, processes=2)
+
+
+@pytest.mark.parametrize(
+    ["unit_from", "units_to"],
+    [
+        ["m", ["km", "m", "lg(re m)"]],
+        ["lg(re m)", ["km", "m", "lg(re km)"]],
+        ["m/s", ["s/m", "km/min", "lg(re m/s)", "lg(re s/m)"]],
+    ],
+)
+def test_multi_converter(
+    simple_unit_system: UnitSystem,
+    monkeypatch: pytest.MonkeyPatch,
+    unit_from: str,
+    units_to: list[str],
+):
+    from pyudunits2 import MultiConverter, _parallel
+
+    # Use small blocks, so that there are many of them.
+    monkeypatch.setattr(_parallel, "BLOCK_SIZE", 7)
+    from_unit = simple_unit_system.unit(unit_from)
+    to_units = [simple_unit_system.unit(unit) for unit in units_to]
+    multi = MultiConverter(from_unit, to_units)
+
+    values = np.arange(1.0, 41.0).reshape(4, 10) / 10
+    expected = [Converter(from_unit, to_unit).convert(values) for to_unit in to_units]
+    results = multi.convert(values)
+    assert len(results) == len(to_units)
+    for result, expected_result in zip(results, expected):
+        np.testing.assert_allclose(result, expected_result)
+
+    outs = [np.empty_like(values) for _ in to_units]
+    results = multi.convert(values, outs=outs)
+    for result, out, expected_result in zip(results, outs, expected):
+        assert result is out
+        np.testing.assert_allclose(out, expected_result)
+
+    assert multi.convert(2.0) == [
+        pytest.approx(converter.convert(2.0)) for converter in multi.converters
+    ]
+
+
+@pytest.mark.parametrize(
+    ["units", "has_program"],
+    [
+        [["m", "km", "m"], True],
+        [["degC", "K", "degC"], True],
+        [["m/s", "s/m", "km/min"], True],
+        [["lg(re m)", "m", "km", "lg(re km)"], True],
+        [["lg(re m) s", "m", "km"], False],
+    ],
+)
+def test_converter__then(
+    simple_unit_system: UnitSystem, units: list[str], has_program: bool
+):
+    units = [simple_unit_system.unit(unit) for unit in units]
+    converters = [
+        Converter(from_unit, to_unit) for from_unit, to_unit in zip(units, units[1:])
+    ]
+    fused = converters[0]
+    for converter in converters[1:]:
+        fused = fused.then(converter)
+    assert (fused._program is not None) is has_program
+    direct = Converter(units[0], units[-1])
+    assert fused.is_identity is direct.is_identity
+    assert fused._program == direct._program
+
+    if has_program:
+        values = np.array([0.5, 1.0, 2.0])
+        expected = values
+        for converter in converters:
+            expected = converter.convert(expected)
+        np.testing.assert_allclose(fused.convert(values), expected)
+
+
+def test_converter__then_mismatch(simple_unit_system: UnitSystem):
+    m_to_km = Converter(simple_unit_system.unit("m"), simple_unit_system.unit("km"))
+    with pytest.raises(IncompatibleUnitsError, match="Unable to chain"):
+        m_to_km.then(m_to_km)
+
+
+@pytest.mark.parametrize(
+    ["unit_from", "unit_to"],
+    [["m", "km"], ["degC", "K"], ["m/s", "s/m"], ["lg(re m)", "m"]],
+)
+def test_converter__inverse(
+    simple_unit_system: UnitSystem, unit_from: str, unit_to: str
+):
+    converter = Converter(
+        simple_unit_system.unit(unit_from), simple_unit_system.unit(unit_to)
+    )
+    inverse = converter.inverse()
+    assert (
+        inverse._program == Converter(converter._to_unit, converter._from_unit)._program
+    )
+    assert converter.then(inverse).convert(2.0) == pytest.approx(2.0)
+    assert inverse.then(converter).convert(2.0) == pytest.approx(2.0)
+
+
+@pytest.mark.parametrize(
+    ["unit_from", "unit_to", "values", "expected"],
+    [
+        [
+            "hours since 1970-01-01",
+            "days since 2000-01-01",
+            [0, 24 * 10957, 24 * 10957 + 36],
+            [-10957, 0, 1.5],
+        ],
+        ["days since 2000-01-01", "days since 2000-01-01", [1.5], [1.5]],
+        [
+            "seconds since 2000-01-01 00:00 +10",
+            "hours since 2000",
+            [0, 3600],
+            [-10, -9],
+        ],
+        ["minutes since 2000-01-01 12:00", "days since 2000-01-01", [720], [1]],
+        ["kiloseconds since 1970-01-01T00:00:01", "s since 1970", [1], [1001]],
+    ],
+)
+def test_convert__dates(unit_from: str, unit_to: str, values, expected):
+    system = UnitSystem.from_udunits2_xml()
+    from_unit, to_unit = system.unit(unit_from), system.unit(unit_to)
+    assert from_unit.is_convertible_to(to_unit)
+    converter = Converter(from_unit, to_unit)
+    assert converter.is_linear
+    np.testing.assert_allclose(converter.convert(np.array(values)), expected)
+    np.testing.assert_allclose(converter.inverse().convert(np.array(expected)), values)
+
+
+@pytest.mark.parametrize(
+    ["unit_from", "unit_to"],
+    [
+        ["days since 2000-01-01", "days"],
+        ["days", "days since 2000-01-01"],
+        ["days since 2000-01-01", "m"],
+    ],
+)
+def test_convert__dates_incompatible(unit_from: str, unit_to: str):
+    system = UnitSystem.from_udunits2_xml()
+    from_unit, to_unit = system.unit(unit_from), system.unit(unit_to)
+    assert not from_unit.is_convertible_to(to_unit)
+    with pytest.raises(IncompatibleUnitsError):
+        Converter(from_unit, to_unit)
+
+
+def test_convert__dates_calendar():
+    system = UnitSystem.from_udunits2_xml()
+    standard = system.unit("days since 1970-01-01")
+    proleptic = standard.with_calendar("proleptic_gregorian")
+    julian = standard.with_calendar("julian")
+    noleap = standard.with_calendar("365_day")
+    assert standard.calendar == "standard"
+    assert proleptic.calendar == "proleptic_gregorian"
+    assert noleap.calendar == "noleap"
+
+    # Calendars which count real days are interchangeable.
+    assert standard.is_convertible_to(proleptic)
+    assert Converter(standard, proleptic).is_identity
+    # 1970-01-01 in the Julian calendar is 1970-01-14 (Gregorian).
+    assert Converter(standard, julian).convert(0.0) == -13
+
+    # Model calendars are only convertible to the same calendar.
+    assert not standard.is_convertible_to(noleap)
+    with pytest.raises(IncompatibleUnitsError):
+        Converter(standard, noleap)
+    noleap_2000 = system.unit("days since 2000-01-01").with_calendar("noleap")
+    assert Converter(noleap_2000, noleap).convert(0.0) == 30 * 365
+
+    # Dates before the Gregorian reform are Julian in the standard calendar.
+    early = system.unit("days since 1000-01-01")
+    assert Converter(early, standard).convert(0.0) == -354_280
+    assert (
+        Converter(early.with_calendar("proleptic_gregorian"), standard).convert(0.0)
+        == -354_285
+    )
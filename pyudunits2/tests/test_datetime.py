@@ -1,21 +1,79 @@
-from pyudunits2._datetime import parse_udunits_date, DateTime
+from pyudunits2._datetime import parse_udunits_date, DateTime, Time
 from pyudunits2._grammar import parse
 import pytest
 
 
-@pytest.mark.xfail(strict=True)
 @pytest.mark.parametrize(
     ["date_expr", "expected"],
     [
-        # ['2000T1', DateTime(2000, 1, 1)],
-        # ['2000', DateTime(2000, 1, 1)],
+        ["2000T1", DateTime(2000, 1, 1, Time(1, 0))],
+        ["2000", DateTime(2000, 1, 1)],
         ["00010101", DateTime(1, 1, 1)],
         ["+00010101", DateTime(1, 1, 1)],
         ["-00010101", DateTime(-1, 1, 1)],
+        ["1990-1-1 0:1:1", DateTime(1990, 1, 1, Time(0, 1, 1))],
     ],
 )
 def test_parse_udunits_date(date_expr: str, expected: DateTime):
     date_node = parse(f"seconds @ {date_expr}").shift_from
-    # TODO: get the original content, not the parsed content.
-    date_ref = parse_udunits_date(date_node.content)
+    date_ref = parse_udunits_date(date_node.raw_content)
     assert date_ref == expected
+
+
+@pytest.mark.parametrize(
+    ["date_expr", "expected"],
+    [
+        ["2000", DateTime(2000, 1, 1)],
+        ["1990-2", DateTime(1990, 2, 1)],
+        ["2000-01-01T00:00", DateTime(2000, 1, 1)],
+        ["1970-01-01 00:00:00Z", DateTime(1970, 1, 1)],
+        [
+            "2001-12-31 23:59:59.999 UTC",
+            DateTime(2001, 12, 31, Time(23, 59, 59, 999_000)),
+        ],
+        # The first signed term after the date is a clock, not an offset.
+        ["2000 +10 UTC", DateTime(2000, 1, 1, Time(10, 0))],
+        ["2000-01-01 +5 +2", DateTime(2000, 1, 1, Time(5, 0), Time(2, 0))],
+        ["20200101", DateTime(2020, 1, 1)],
+        ["2020-0101", DateTime(2020, 1, 1, Time(1, 0))],
+        ["199001021900 +10", DateTime(1990, 1, 2, Time(19, 0), Time(10, 0))],
+        ["19900101T190030 GMT", DateTime(1990, 1, 1, Time(19, 0, 30))],
+        ["1990-1-2+5:2:2", DateTime(1990, 1, 2, Time(5, 2, 2))],
+        ["1990-1-2 5 6:0", DateTime(1990, 1, 2, Time(5, 0), Time(6, 0))],
+        ["1990-1-1 -19:4:2", DateTime(1990, 1, 1, Time(-19, 4, 2))],
+        ["1990-1-1 3+1", DateTime(1990, 1, 1, Time(3, 0), Time(1, 0))],
+        ["1990-1-1 0:0:0 -0530", DateTime(1990, 1, 1, tz_offset=Time(-5, 30))],
+        ["1970-01-10TZ", DateTime(1970, 1, 10)],
+        ["2000-01-01 12:00 -5:30", DateTime(2000, 1, 1, Time(12, 0), Time(-5, 30))],
+    ],
+)
+def test_parse_udunits_date__forms(date_expr: str, expected: DateTime):
+    date_time = parse_udunits_date(date_expr)
+    assert date_time == expected
+    assert date_time.raw_content == date_expr
+
+
+@pytest.mark.parametrize("date_expr", ["tomorrow", "199022T1", "1990-0-0 0:0:0"])
+def test_parse_udunits_date__invalid(date_expr):
+    with pytest.raises(
+        ValueError, match=f"Unable to parse the date time '{date_expr}'"
+    ):
+        parse_udunits_date(date_expr)
+
+
+def test_parse_udunits_date__cached():
+    assert parse_udunits_date("1990-01-01 12:00") is parse_udunits_date(
+        "1990-01-01 12:00"
+    )
+
+
+def test_timestamp_node():
+    node = parse("days since 1990-1-1 0:0:1 +2").shift_from
+    assert node.content == DateTime(1990, 1, 1, Time(0, 0, 1), Time(2, 0))
+    assert str(node) == "1990-1-1 0:0:1 +2"
+
+
+def test_date_time__str():
+    assert str(DateTime(2000, 1, 2, Time(3, 4), Time(-5, 30))) == (
+        "2000-01-02 03:04 -05:30"
+    )
@@ -0,0 +1,61 @@
+import time
+
+import pytest
+
+from pyudunits2 import Converter, UnitSystem, instrument
+from pyudunits2._instrumentation import STAGES, _active, stage
+
+
+def test_instrument():
+    system = UnitSystem.from_udunits2_xml()
+    with instrument() as stats:
+        unit = system.unit("kg m/s^2")
+        Converter(unit, system.unit("N")).expression
+    assert set(stats.stages) == set(STAGES)
+    for name in STAGES:
+        assert stats[name].count > 0, name
+        assert stats[name].total_time > 0, name
+    # Resolution of the unit system definitions is nested within (and so
+    # can't take longer than) the resolution of the identifiers.
+    assert (
+        stats["resolve_definition"].total_time <= stats["resolve_identifier"].total_time
+    )
+    assert "resolve_identifier" in stats.report()
+
+
+def test_instrument__disabled():
+    system = UnitSystem.from_udunits2_xml()
+    with instrument() as stats:
+        pass
+    system.unit("m/s")
+    assert all(s.count == 0 for s in stats.stages.values())
+    assert _active == ()
+
+
+def test_instrument__nested():
+    system = UnitSystem.from_udunits2_xml()
+    with instrument() as outer:
+        system.unit("m")
+        with instrument() as inner:
+            system.unit("s")
+    assert inner["parse"].count == 1
+    assert outer["parse"].count == 2
+
+
+def test_instrument__recursion():
+    @stage("parse")
+    def countdown(n):
+        return countdown(n - 1) if n else 0
+
+    start = time.perf_counter()
+    with instrument() as stats:
+        countdown(3)
+    elapsed = time.perf_counter() - start
+    assert stats["parse"].count == 4
+    # The nested calls are not counted again.
+    assert 0 < stats["parse"].total_time <= elapsed
+
+
+def test_stage__unknown():
+    with pytest.raises(ValueError, match="Unknown stage 'lexing'"):
+        stage("lexing")
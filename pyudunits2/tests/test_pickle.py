@@ -0,0 +1,94 @@
+import concurrent.futures
+import pickle
+
+import numpy as np
+import pytest
+
+from pyudunits2 import Converter, DateUnit, UnitSystem
+from pyudunits2._pickle import UDUNITS2_XML, unit_system
+
+
+@pytest.fixture
+def xml_unit_system() -> UnitSystem:
+    # The per-process instance, to avoid re-reading the XML in each test.
+    return unit_system(UDUNITS2_XML)
+
+
+@pytest.mark.parametrize("unit_string", ["m", "km/h", "lg(re mW)", "degC"])
+def test_unit__compact(xml_unit_system: UnitSystem, unit_string: str):
+    unit = xml_unit_system.unit(unit_string)
+    data = pickle.dumps(unit)
+    # Just the unit string and the system identifier (and some overhead).
+    assert len(data) < 150
+    assert pickle.loads(data) == unit
+
+
+def test_date_unit__compact(xml_unit_system: UnitSystem):
+    unit = xml_unit_system.unit("days since 2000-01-01")
+    assert isinstance(unit, DateUnit)
+    data = pickle.dumps(unit)
+    assert len(data) < 150
+    restored = pickle.loads(data)
+    assert isinstance(restored, DateUnit)
+    assert restored.unit == unit.unit
+    assert str(restored.reference_date) == str(unit.reference_date)
+
+
+def test_unit__modified_system(simple_unit_system: UnitSystem):
+    # A unit from any other unit system is pickled in full.
+    unit = simple_unit_system.unit("km")
+    assert unit._origin is None
+    restored = pickle.loads(pickle.dumps(unit))
+    assert restored == unit
+    assert restored.dimensionality() == unit.dimensionality()
+
+
+def test_unit_system__mutation_drops_identifier():
+    system = UnitSystem.from_udunits2_xml()
+    assert system.unit("m")._origin == (UDUNITS2_XML, "m")
+    system.add_unit(system.unit_by_name_or_symbol("m"), replace=True)
+    assert system.unit("m")._origin is None
+
+
+@pytest.mark.parametrize(
+    ["unit_from", "unit_to"],
+    [["degC", "degF"], ["mW", "lg(re W)"], ["m/s", "s/m"]],
+)
+def test_converter(xml_unit_system: UnitSystem, unit_from: str, unit_to: str):
+    converter = Converter(
+        xml_unit_system.unit(unit_from), xml_unit_system.unit(unit_to)
+    )
+    data = pickle.dumps(converter)
+    assert len(data) < 1000
+    restored = pickle.loads(data)
+    assert restored._program == converter._program
+    values = np.array([1.0, 10.0, 100.0])
+    np.testing.assert_array_equal(restored.convert(values), converter.convert(values))
+
+
+def test_converter__no_program(simple_unit_system: UnitSystem):
+    converter = Converter(
+        simple_unit_system.unit("lg(re m) s"), simple_unit_system.unit("m")
+    )
+    assert converter._program is None
+    restored = pickle.loads(pickle.dumps(converter))
+    assert restored.expression == converter.expression
+
+
+def _convert(converter: Converter, value: float) -> float:
+    return converter.convert(value)
+
+
+def test_converter__process_pool(xml_unit_system: UnitSystem):
+    converter = Converter(xml_unit_system.unit("degC"), xml_unit_system.unit("K"))
+    with concurrent.futures.ProcessPoolExecutor(max_workers=1) as pool:
+        result = pool.submit(_convert, converter, 10.0).result()
+    assert result == pytest.approx(283.15)
+
+
+def test_date_unit__calendar(xml_unit_system: UnitSystem):
+    unit = xml_unit_system.unit("days since 2000-01-01").with_calendar(
+        "proleptic_gregorian"
+    )
+    restored = pickle.loads(pickle.dumps(unit))
+    assert restored.calendar == "proleptic_gregorian"
@@ -1,3 +1,7 @@
+import sys
+
+import pytest
+
 import pyudunits2
 
 
@@ -16,16 +20,28 @@ def test_public_api():
     assert public_vars == {
         "Unit",
         "Converter",
+        "MultiConverter",
         "BasisUnit",
         "DateUnit",
         "DateTime",
         "NamedUnit",
         "UnitSystem",
+        "TimeAxis",
+        "instrument",
+        "SharedArrays",
         "UnresolvableUnitException",
         "IncompatibleUnitsError",
     }
 
 
+def test_import_numpy__missing(monkeypatch):
+    from pyudunits2._optional import import_numpy
+
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    with pytest.raises(ImportError, match=r"pip install pyudunits2\[numpy\]"):
+        import_numpy()
+
+
 def test_readme_example(capsys):
     # TODO: pull this out from the README automatically (or use doctest).
 
@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+
+from pyudunits2 import TimeAxis, UnitSystem
+
+
+@pytest.fixture(scope="module")
+def system():
+    return UnitSystem.from_udunits2_xml()
+
+
+def test_time_axis__regular(system):
+    unit = system.unit("hours since 2000-01-01")
+    axis = unit.time_axis(np.arange(0, 48, 6))
+    assert axis.is_regular
+    assert (axis.start, axis.step, axis.count) == (0, 6, 8)
+    assert len(axis) == 8
+    np.testing.assert_array_equal(np.asarray(axis), np.arange(0, 48, 6))
+
+
+@pytest.mark.parametrize(
+    ["values", "step"],
+    [
+        [np.arange(0, 1, 0.1), 0.1],
+        # Not exactly an arithmetic progression (0.1 * 3 != 0.3).
+        [[0.0, 0.1, 0.2, 0.3, 0.4], 0.1],
+        [np.cumsum(np.full(1000, 0.1)), 0.1],
+        [np.arange(0, 48, 6, dtype=np.float32) + 0.2, 6],
+        [np.linspace(700_000, 700_001, 97), 1 / 96],
+    ],
+)
+def test_time_axis__regular_float(system, values, step):
+    unit = system.unit("days since 1850-01-01")
+    axis = unit.time_axis(values)
+    assert axis.is_regular
+    assert axis.start == values[0]
+    assert axis.step == pytest.approx(step)
+    np.testing.assert_array_equal(axis.values, values)
+
+
+@pytest.mark.parametrize(
+    "values",
+    [[0, 1, 3], [0.0, 0.5, 1.1], [5], [], [2, 2, 2], [0.0, 0.1, 0.20001]],
+)
+def test_time_axis__irregular(system, values):
+    unit = system.unit("hours since 2000-01-01")
+    axis = unit.time_axis(values)
+    assert not axis.is_regular
+    assert axis.start is None and axis.step is None
+    np.testing.assert_array_equal(axis.values, values)
+
+
+def test_time_axis__invalid(system):
+    unit = system.unit("hours since 2000-01-01")
+    with pytest.raises(ValueError, match="must be 1-dimensional"):
+        unit.time_axis(np.zeros((2, 2)))
+
+
+def test_time_axis__rebase(system):
+    axis = TimeAxis(system.unit("hours since 2000-01-02"), start=0, step=6, count=4)
+    rebased = axis.rebase(system.unit("hours since 2000-01-01"))
+    # Integer axes stay integer while the offsets are whole numbers.
+    assert (rebased.start, rebased.step, rebased.count) == (24, 6, 4)
+    assert rebased._values is None
+    np.testing.assert_array_equal(rebased.values, [24, 30, 36, 42])
+    assert rebased.values.dtype.kind == "i"
+
+    rebased = axis.rebase(system.unit("days since 2000-01-01"))
+    assert (rebased.start, rebased.step) == (1.0, 0.25)
+    np.testing.assert_array_equal(rebased.values, [1, 1.25, 1.5, 1.75])
+
+
+def test_time_axis__rebase_irregular(system):
+    axis = system.unit("days since 2000-01-02").time_axis([0, 1, 3])
+    rebased = axis.rebase(system.unit("hours since 2000-01-01"))
+    assert not rebased.is_regular
+    np.testing.assert_array_equal(rebased.values, [24, 48, 96])
+
+
+def test_time_axis__extend(system):
+    first = system.unit("days since 2000-01-01").time_axis(np.arange(31))
+    second = system.unit("days since 2000-02-01").time_axis(np.arange(29))
+    axis = first.extend(second)
+    assert axis.is_regular
+    assert (axis.start, axis.step, axis.count) == (0, 1, 60)
+
+    # A gap in the time axis.
+    third = system.unit("days since 2000-03-02").time_axis(np.arange(10))
+    axis = axis.extend(third)
+    assert not axis.is_regular
+    assert axis.count == 70
+    np.testing.assert_array_equal(axis.values[58:62], [58, 59, 61, 62])
+
+
+def test_time_axis__extend_float(system):
+    unit = system.unit("days since 2000-01-01")
+    first = unit.time_axis([0.0, 0.1, 0.2])
+    # Neither 0.3 nor its step (0.4 - 0.3) is exactly a continuation.
+    second = TimeAxis(unit, start=0.3, step=0.4 - 0.3, count=2)
+    axis = first.extend(second)
+    assert axis.is_regular
+    assert (axis.start, axis.step, axis.count) == (0.0, 0.1, 5)
+    # Extended in constant time, without materialising the offsets.
+    assert axis._values is None
+
+    # Offsets which don't continue the progression.
+    gap = TimeAxis(unit, start=0.31, step=0.1, count=2)
+    assert not first.extend(gap).is_regular
+    drifting = TimeAxis(unit, start=0.3, step=0.1001, count=2)
+    assert not first.extend(drifting).is_regular
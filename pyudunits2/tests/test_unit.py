@@ -1,4 +1,6 @@
-from pyudunits2 import Unit, BasisUnit, DateUnit
+import numpy as np
+
+from pyudunits2 import Unit, BasisUnit, DateUnit, DateTime, UnitSystem
 from pyudunits2._unit_reference import Name
 from pyudunits2._unit import Names, _unit_from_expression_and_identifiers
 import pytest
@@ -59,6 +61,16 @@ def test_unit__eq(lhs: Unit, rhs: Unit, expectation: str):
     assert (rhs == lhs) is expectation
 
 
+def test_basis_unit__is_convertible_to():
+    system = UnitSystem.from_udunits2_xml()
+    meter = system.unit_by_name_or_symbol("meter")
+    kilogram = system.unit_by_name_or_symbol("kilogram")
+    assert isinstance(meter, BasisUnit)
+    assert meter.dimensionality() == {"meter": 1}
+    assert meter.is_convertible_to(meter)
+    assert not meter.is_convertible_to(kilogram)
+
+
 @pytest.mark.parametrize(
     ["expr", "error_msg"],
     [
@@ -102,7 +114,74 @@ def test_dateunit__reference_date(unit_expr: str, expected_ref, common_id_refs):
         definition, identifier_references=common_id_refs
     )
     assert isinstance(date_unit, DateUnit)
-    assert isinstance(date_unit.reference_date, graph.Unhandled)
-    # TODO: get this assertion to be true.
-    # assert isinstance(date_unit.reference_date, DateTime)
+    assert isinstance(date_unit.reference_date, DateTime)
     assert str(date_unit.reference_date) == expected_ref
+
+
+def test_dateunit__str():
+    system = UnitSystem.from_udunits2_xml()
+    unit = system.unit("hours since 2000-01-01 12:00 UTC")
+    assert str(unit) == "hours since 2000-01-01 12:00 UTC"
+
+
+def test_dateunit__date_fields():
+    system = UnitSystem.from_udunits2_xml()
+    unit = system.unit("hours since 2000-02-28 12:00").with_calendar("360_day")
+    fields = unit.to_date_fields(np.array([0, 12, 36, 60]))
+    np.testing.assert_array_equal(fields.month, [2, 2, 2, 3])
+    np.testing.assert_array_equal(fields.day, [28, 29, 30, 1])
+    np.testing.assert_array_equal(fields.hour, [12, 0, 0, 0])
+    np.testing.assert_array_equal(
+        unit.from_date_fields(fields.year, fields.month, fields.day, fields.hour),
+        [0, 12, 36, 60],
+    )
+
+    fields = unit.to_date_fields(1.5)
+    assert (fields.day, fields.hour, fields.minute) == (28, 13, 30)
+    assert unit.from_date_fields(2000, 2, 28, 13, 30) == 1.5
+
+
+def test_dateunit__to_datetime64():
+    system = UnitSystem.from_udunits2_xml()
+    unit = system.unit("days since 1850-01-01")
+    result = unit.to_datetime64(np.array([0, 1.5, np.nan, 62000]))
+    expected = np.array(
+        ["1850-01-01", "1850-01-02T12", "NaT", "2019-10-02"], dtype="datetime64[ns]"
+    )
+    np.testing.assert_array_equal(result, expected)
+    np.testing.assert_array_equal(unit.from_datetime64(result), [0, 1.5, np.nan, 62000])
+
+    assert unit.to_datetime64(2, "s") == np.datetime64("1850-01-03T00:00:00")
+    assert unit.from_datetime64(np.datetime64("2000-01-01")) == 54786
+
+
+def test_dateunit__to_datetime64__exact():
+    system = UnitSystem.from_udunits2_xml()
+    # A reference date out of the range of datetime64[ns], and offsets out of
+    # the range of int64.
+    unit = system.unit("ns since 1700-01-01")
+    values = np.array([10_000_000_000_000_000_001], dtype=np.uint64)
+    result = unit.to_datetime64(values)
+    assert result[0] == np.datetime64("2016-11-20T17:46:40.000000001")
+
+    unit = system.unit("days since 0001-01-01")
+    result = unit.to_datetime64(np.array([738000.25]))
+    assert result[0] == np.datetime64("2021-07-28T06:00")
+    np.testing.assert_array_equal(unit.from_datetime64(result), [738000.25])
+
+
+def test_dateunit__to_datetime64__overflow():
+    system = UnitSystem.from_udunits2_xml()
+    unit = system.unit("days since 1850-01-01")
+    with pytest.raises(OverflowError, match="out of the range of 64-bit"):
+        unit.to_datetime64(np.array([0, 1e6]))
+    # But fine at a coarser resolution.
+    assert unit.to_datetime64(1e6, "s") == np.datetime64("4587-11-28")
+
+
+def test_dateunit__to_datetime64__calendar():
+    system = UnitSystem.from_udunits2_xml()
+    unit = system.unit("days since 1970-01-01").with_calendar("julian")
+    assert unit.to_datetime64(0, "D") == np.datetime64("1970-01-14")
+    with pytest.raises(ValueError, match="noleap calendar cannot be represented"):
+        unit.with_calendar("noleap").to_datetime64(0)
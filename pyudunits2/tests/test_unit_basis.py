@@ -50,6 +50,9 @@ def idfn(param):
         ["(s @ 100)^2", "(s^2 @ 100^2)"],
         ["((s @ 2) @ 100)^2", "(s^2 @ 100^2·2^2)"],
         ["7·24·60·60·s/(14·24·60·60·s)", "14^-1·7"],
+        # Numbers of different types are combined exactly.
+        ["2.5 4 s", "10·s"],
+        ["0.001 3 s", "0.003·s"],
         # ["(s @ 2)/(3s @ 5)", "()"],
         #
         # ["(kelvin @ 273.15)/(kelvin/1.8 @ 459.67)", ""],
@@ -1,7 +1,10 @@
 import contextlib
 
-from pyudunits2 import UnitSystem, UnresolvableUnitException
+from pyudunits2 import IncompatibleUnitsError, UnitSystem, UnresolvableUnitException
 from pyudunits2._unit import Unit, DateUnit
+from pyudunits2._unit_reference import Name, UnitReference
+from pyudunits2._unit_system import LazilyDefinedUnit
+import numpy as np
 import pytest
 
 
@@ -45,6 +48,8 @@ def test__unit__undefined_unit(simple_unit_system: UnitSystem, unit_spec):
     ["unit_lhs", "unit_rhs"],
     [
         ["km", "1000 m"],
+        ["degC", "K @ 273.15"],
+        ["m/s", "meters per second"],
     ],
 )
 def test__unit__symbolic_eq(
@@ -57,6 +62,23 @@ def test__unit__symbolic_eq(
     assert unit1 == unit2
 
 
+@pytest.mark.parametrize(
+    ["unit_lhs", "unit_rhs"],
+    [
+        ["km", "100 m"],
+        ["degC", "K"],
+        ["m/s", "s/m"],
+    ],
+)
+def test__unit__symbolic_ne(
+    simple_unit_system: UnitSystem, unit_lhs: str, unit_rhs: str
+):
+    unit1 = simple_unit_system.unit(unit_lhs)
+    unit2 = simple_unit_system.unit(unit_rhs)
+
+    assert unit1 != unit2
+
+
 no_exception = contextlib.nullcontext()
 
 
@@ -80,3 +102,200 @@ def test__unit__date_unit(simple_unit_system: UnitSystem, unit_expr: str, expect
     with expectation:
         unit = simple_unit_system.unit(unit_expr)
         assert isinstance(unit, DateUnit)
+
+
+@pytest.mark.parametrize(
+    ["unit_spec", "error_type", "position"],
+    [
+        ["km/h", None, None],
+        ["degC", None, None],
+        ["hours since 2000-01-01T00:00", None, None],
+        ["m^^2", "syntax", 2],
+        ["  m$", "syntax", 3],
+        ["m/other", "unresolvable", 2],
+        # The position of the identifier, not of its first textual match.
+        ["min/mi", "unresolvable", 4],
+        [" m.mx", "unresolvable", 3],
+        ["", "invalid", None],
+        ["   ", "invalid", None],
+        ["m (s @ 2000)", "invalid", None],
+    ],
+)
+def test__validate_many(
+    simple_unit_system: UnitSystem, unit_spec: str, error_type, position
+):
+    [verdict] = simple_unit_system.validate_many([unit_spec])
+    assert verdict.unit_string == unit_spec
+    assert verdict.is_valid is (error_type is None)
+    assert bool(verdict) is (error_type is None)
+    assert verdict.error_type == error_type
+    assert verdict.position == position
+    assert simple_unit_system.is_valid(unit_spec) is (error_type is None)
+
+
+def test__is_valid__cache_invalidated_by_add_unit(simple_unit_system: UnitSystem):
+    from pyudunits2 import BasisUnit
+    from pyudunits2._unit_reference import UnitReference, Name
+
+    assert not simple_unit_system.is_valid("mol/s")
+    assert "mol/s" in simple_unit_system._validation_cache
+
+    simple_unit_system.add_unit(
+        BasisUnit(names=UnitReference(name=Name(singular="mole"), symbols=("mol",)))
+    )
+    assert simple_unit_system.is_valid("mol/s")
+
+
+def test__unit_by_name_or_symbol__negative_cache(simple_unit_system: UnitSystem):
+    from pyudunits2._unit_reference import Prefix
+
+    for _ in range(2):
+        with pytest.raises(UnresolvableUnitException):
+            simple_unit_system.unit_by_name_or_symbol("Mm")
+        assert "Mm" in simple_unit_system._unresolvable_identifiers
+
+    # Adding a prefix may make the identifier resolvable.
+    simple_unit_system.add_prefix(Prefix("mega", value="1e6", symbols=("M",)))
+    assert "Mm" not in simple_unit_system._unresolvable_identifiers
+    assert str(simple_unit_system.unit_by_name_or_symbol("Mm")) == "M·m"
+
+
+def test_convert_column(simple_unit_system: UnitSystem):
+    values = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+    units = np.array(["km", "m", "km", "0.5 m", "m"])
+    result = simple_unit_system.convert_column(values, units, "m")
+    np.testing.assert_allclose(result, [1000, 2, 3000, 2, 5])
+
+
+def test_convert_column__unit_codes(simple_unit_system: UnitSystem):
+    values = np.array([[1, 2], [3, 4]])
+    codes = np.array([[0, 1], [1, 0]], dtype=np.uint8)
+    result = simple_unit_system.convert_column(
+        values, codes, "m", unit_codes=["km", "0.5 m"]
+    )
+    assert result.dtype == np.float64
+    np.testing.assert_allclose(result, [[1000, 1], [1.5, 4000]])
+
+
+def test_convert_column__raise(simple_unit_system: UnitSystem):
+    values = np.array([1.0, 2.0, 3.0])
+    units = np.array(["km", "s", "m"])
+    with pytest.raises(
+        IncompatibleUnitsError, match="Unable to convert the unit 's' \\(of 1 rows\\)"
+    ):
+        simple_unit_system.convert_column(values, units, "m")
+
+
+def test_convert_column__raise_empty_unit(simple_unit_system: UnitSystem):
+    values = np.array([1.0, 2.0])
+    units = np.array(["km", ""])
+    with pytest.raises(
+        IncompatibleUnitsError, match="Unable to convert the unit '' \\(of 1 rows\\)"
+    ):
+        simple_unit_system.convert_column(values, units, "m")
+
+
+def test_convert_column__mask(simple_unit_system: UnitSystem):
+    values = np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+    units = np.array(["km", "s", "N/A", "m", "m^", ""])
+    result = simple_unit_system.convert_column(values, units, "m", errors="mask")
+    assert isinstance(result, np.ma.MaskedArray)
+    np.testing.assert_array_equal(result.mask, [False, True, True, False, True, True])
+    np.testing.assert_allclose(result.compressed(), [1000, 4])
+
+
+def test_units_with_dimensionality(simple_unit_system: UnitSystem):
+    matches = simple_unit_system.units_with_dimensionality("km")
+    assert {match.name for match in matches} == {"meter"}
+    [match] = matches
+    assert match.scale == 1
+    assert match.unit is simple_unit_system.unit_by_name_or_symbol("m")
+
+    matches = simple_unit_system.units_with_dimensionality("s")
+    assert {(match.name, match.scale) for match in matches} >= {
+        ("second", 1),
+        ("minute", 60),
+        ("hour", 3600),
+    }
+    assert simple_unit_system.units_with_dimensionality("m/s") == []
+
+
+def test_units_with_dimensionality__xml():
+    system = UnitSystem.from_udunits2_xml()
+    matches = system.units_with_dimensionality("m s-2")
+    scales = {match.name: match.scale for match in matches}
+    assert scales["standard_free_fall"] == pytest.approx(9.80665)
+    assert scales["gal"] == pytest.approx(0.01)
+    # Each unit appears once.
+    assert len({id(match.unit) for match in matches}) == len(matches)
+
+
+def test_units_with_dimensionality__invalidated(simple_unit_system: UnitSystem):
+    assert simple_unit_system.units_with_dimensionality("m/s") == []
+    simple_unit_system.add_unit(
+        LazilyDefinedUnit(
+            simple_unit_system,
+            "m/s",
+            names=UnitReference(name=Name(singular="speed"), symbols=("v",)),
+        )
+    )
+    [match] = simple_unit_system.units_with_dimensionality("m/s")
+    assert match.name == "speed"
+    assert match.scale == 1
+
+
+def test_unit_by_name_or_symbol__prefix_symbol_is_unit_symbol():
+    # The milli prefix and the meter share the symbol "m".
+    system = UnitSystem.from_udunits2_xml()
+    assert system.unit("mm").expanded() == "0.001·meter"
+    assert system.unit("mm/s") == system.unit("0.001 m/s")
+
+
+@pytest.mark.parametrize(
+    ["values", "unit", "expected_values", "expected_units"],
+    [
+        [1.2e-6, "m", 1.2, "\u00b5m"],
+        [
+            [1.2e-6, 0.001, 999, 1000, 0, -3e7, np.inf],
+            "m",
+            [1.2, 1, 999, 1, 0, -30, np.inf],
+            ["\u00b5m", "mm", "m", "km", "m", "Mm", "m"],
+        ],
+        [[1500, 2e-5], "watt", [1.5, 20], ["kilowatt", "microwatt"]],
+        [[[2500.0], [0.5]], "W", [[2.5], [500]], [["kW"], ["mW"]]],
+        # Prefixes go on the unprefixed unit (not "kkg" or "mkg").
+        [[5000, 0.002, 1, 2e-9], "kg", [5, 2, 1, 2], ["Mg", "g", "kg", "\u00b5g"]],
+        [[3000, 0.5], "kilogram", [3, 500], ["megagram", "gram"]],
+    ],
+)
+def test_best_display_unit(values, unit, expected_values, expected_units):
+    system = UnitSystem.from_udunits2_xml()
+    presented, units = system.best_display_unit(values, unit)
+    np.testing.assert_allclose(presented, expected_values)
+    np.testing.assert_array_equal(units, expected_units)
+    # The units are those of the system.
+    for presented_unit in np.ravel(units):
+        system.unit(str(presented_unit))
+
+
+def test_best_display_unit__candidates():
+    system = UnitSystem.from_udunits2_xml()
+    presented, units = system.best_display_unit(
+        [0.5, 2e-5, 1.5e11, 0], "m", candidates=["au", "km", "mm"]
+    )
+    np.testing.assert_allclose(presented, [500, 0.02, 1.0027, 0], rtol=1e-4)
+    np.testing.assert_array_equal(units, ["mm", "mm", "au", "mm"])
+
+
+@pytest.mark.parametrize(
+    ["unit", "candidates", "match"],
+    [
+        ["m/s", None, "is not the name or symbol"],
+        ["degC", None, "is not a scaled unit"],
+        ["m", ["km", "s"], "'s' is not a scaled form of 'm'"],
+    ],
+)
+def test_best_display_unit__invalid(unit, candidates, match):
+    system = UnitSystem.from_udunits2_xml()
+    with pytest.raises(ValueError, match=match):
+        system.best_display_unit([1.0], unit, candidates=candidates)